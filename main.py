@@ -1,5 +1,5 @@
 from src.slack.app import SlackApp
-from src.config.settings import Settings
+from src.config.settings import get_settings, EnvironmentError
 from src.crew.master_crew import MasterCrew
 from src.utils.logging import configure_logging
 from src.auth.role_manager import RoleManager
@@ -19,11 +19,11 @@ def main() -> None:
         
         # Load and validate settings
         try:
-            settings = Settings()
+            settings = get_settings()
             logger.info("Settings loaded successfully", 
                        openai_model=settings.openai_model,
                        anthropic_model=settings.anthropic_model)
-        except ValueError as e:
+        except (EnvironmentError, ValueError) as e:
             logger.error("Failed to load settings", error=str(e))
             sys.exit(1)
         
@@ -0,0 +1,37 @@
+from abc import ABC, abstractmethod
+from typing import Optional
+import threading
+from crewai import Agent
+from src.config.settings import Settings
+from src.llm.clients import LLMClients
+
+class BaseAgent(ABC):
+    """Abstract base class for agent wrappers that build a CrewAI agent."""
+
+    __slots__ = ("settings", "_agent", "_agent_lock")
+
+    def __init__(self, settings: Settings) -> None:
+        self.settings = settings
+        # Route the agent's litellm calls through the shared connection pool
+        LLMClients.get_instance(settings)
+        self._agent: Optional[Agent] = None
+        self._agent_lock = threading.Lock()
+
+    @abstractmethod
+    def _build(self) -> Agent:
+        """Build and configure the CrewAI agent."""
+        pass
+
+    def create(self) -> Agent:
+        """
+        Return the CrewAI agent, building it on first use.
+
+        The agent (and its LLM wrapper and tool bindings) is created once and
+        reused across crew runs instead of being rebuilt for every request.
+        """
+        if self._agent is None:
+            # Slack Bolt dispatches listeners on a thread pool
+            with self._agent_lock:
+                if self._agent is None:
+                    self._agent = self._build()
+        return self._agent
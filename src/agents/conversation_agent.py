@@ -2,16 +2,19 @@ from crewai import Agent
 from typing import Dict, Any
 import structlog
 from src.config.settings import Settings
+from src.agents.base_agent import BaseAgent
 
 logger = structlog.get_logger(__name__)
 
-class ConversationAgent:
+class ConversationAgent(BaseAgent):
     """Conversational agent that handles general conversation and ambiguous requests."""
 
+    __slots__ = ()
+
     def __init__(self, settings: Settings) -> None:
-        self.settings = settings
+        super().__init__(settings)
 
-    def create(self) -> Agent:
+    def _build(self) -> Agent:
         return Agent(
             role="Conversational Assistant",
             goal="Engage in natural conversation and help clarify user intentions when requests are ambiguous",
@@ -20,8 +23,8 @@ class ConversationAgent:
             intentions when their requests are ambiguous. You're the first point of contact when 
             the system isn't sure what the user wants. Never mention that you are an AI, a model, 
             or a conversational agent - just respond directly to the user's queries as a human agent would.""",
-            verbose=False,
+            verbose=self.settings.crew_verbose,
             allow_delegation=False,
             max_iter=3,
-            llm=f"openai/{self.settings.openai_model}"
+            llm=self.settings.openai_llm_spec
         )
@@ -2,21 +2,24 @@ from crewai import Agent
 from typing import Dict, Any
 import structlog
 from src.config.settings import Settings
+from src.agents.base_agent import BaseAgent
 from src.tools.document_ingestion_tool import DocumentIngestionTool
 from src.tools.document_management_tool import DocumentManagementTool
 
 logger = structlog.get_logger(__name__)
 
-class DocumentManagementAgent:
+class DocumentManagementAgent(BaseAgent):
     """Agent that manages documents in the knowledge base."""
 
+    __slots__ = ("document_ingestion_tool", "document_management_tool")
+
     def __init__(self, settings: Settings) -> None:
-        self.settings = settings
+        super().__init__(settings)
         self.document_ingestion_tool = DocumentIngestionTool(settings)
         self.document_management_tool = DocumentManagementTool(settings)
         logger.info("Initialized DocumentManagementAgent")
 
-    def create(self) -> Agent:
+    def _build(self) -> Agent:
         return Agent(
             role="Knowledge Base Manager",
             goal="Manage the organization's knowledge base by adding, retrieving, or removing documents",
@@ -24,9 +27,9 @@ class DocumentManagementAgent:
             You can ingest documents from various sources, organize them effectively, and ensure
             the knowledge base remains up-to-date and relevant. You understand how to process
             different types of documents and extract valuable information from them.""",
-            verbose=False,
+            verbose=self.settings.crew_verbose,
             allow_delegation=False,
             max_iter=3,
-            llm=f"openai/{self.settings.openai_model}",
+            llm=self.settings.openai_llm_spec,
             tools=[self.document_ingestion_tool, self.document_management_tool]
         )
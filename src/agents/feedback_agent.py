@@ -1,18 +1,21 @@
 from crewai import Agent
 import structlog
 from src.config.settings import Settings
+from src.agents.base_agent import BaseAgent
 from src.tools.feedback_tool import FeedbackTool
 
 logger = structlog.get_logger(__name__)
 
-class FeedbackAgent:
+class FeedbackAgent(BaseAgent):
     """Agent specialized in collecting feedback and saving it to Google Sheets."""
 
+    __slots__ = ("feedback_tool",)
+
     def __init__(self, settings: Settings) -> None:
-        self.settings = settings
+        super().__init__(settings)
         self.feedback_tool = FeedbackTool(settings=settings)
 
-    def create(self) -> Agent:
+    def _build(self) -> Agent:
         return Agent(
             role="Feedback Collector",
             goal="Collect detailed feedback from users through structured questions and save it to Google Sheets",
@@ -21,9 +24,9 @@ class FeedbackAgent:
             your questioning based on previous responses. You're excellent at guiding users through 
             a feedback process while keeping them engaged. You never mention that you are an AI or 
             a conversational agent - you respond directly to users as a human agent would.""",
-            verbose=False,
+            verbose=self.settings.crew_verbose,
             allow_delegation=False,
             max_iter=5,  # Allow more iterations for multi-turn feedback collection
-            llm=f"openai/{self.settings.openai_model}",
+            llm=self.settings.openai_llm_spec,
             tools=[self.feedback_tool()]  # Call the tool to get a LangChain Tool instance
         )
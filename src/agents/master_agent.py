@@ -2,27 +2,30 @@ from crewai import Agent
 from typing import Dict, Any
 import structlog
 from src.config.settings import Settings
+from src.agents.base_agent import BaseAgent
 from src.tools.intent_analyzer import IntentAnalyzerTool
 
 logger = structlog.get_logger(__name__)
 
-class MasterAgent:
+class MasterAgent(BaseAgent):
     """Master agent that analyzes requests and routes them to appropriate agents."""
 
+    __slots__ = ("intent_analyzer",)
+
     def __init__(self, settings: Settings) -> None:
-        self.settings = settings
+        super().__init__(settings)
         self.intent_analyzer = IntentAnalyzerTool()
 
-    def create(self) -> Agent:
+    def _build(self) -> Agent:
         return Agent(
             role="Master Controller",
             goal="Analyze user requests and route them to the most appropriate specialized agent",
             backstory="""You are an intelligent coordinator with expertise in understanding user 
             requests and determining which specialized agent can best handle them. You have deep 
             understanding of each agent's capabilities and can route requests effectively.""",
-            verbose=False,
+            verbose=self.settings.crew_verbose,
             allow_delegation=True,
             max_iter=3,
-            llm=f"openai/{self.settings.openai_model}",
+            llm=self.settings.openai_llm_spec,
             tools=[self.intent_analyzer]
         )
@@ -1,24 +1,27 @@
 from crewai import Agent
 import structlog
 from src.config.settings import Settings
+from src.agents.base_agent import BaseAgent
 from src.tools.research_tool import ResearchTool
 
 logger = structlog.get_logger(__name__)
 
-class ResearchAgent:
+class ResearchAgent(BaseAgent):
+    __slots__ = ("research_tool",)
+
     def __init__(self, settings: Settings) -> None:
-        self.settings = settings
+        super().__init__(settings)
         self.research_tool = ResearchTool()
 
-    def create(self) -> Agent:
+    def _build(self) -> Agent:
         return Agent(
             role="Researcher",
             goal="Conduct thorough research on given topics",
             backstory="""You're a skilled researcher with expertise in finding reliable information.
             You can analyze topics deeply and provide comprehensive, well-structured information.""",
-            verbose=False,
+            verbose=self.settings.crew_verbose,
             allow_delegation=False,
             max_iter=2,
-            llm=f"openai/{self.settings.openai_model}",
+            llm=self.settings.openai_llm_spec,
             tools=[self.research_tool]
         )
@@ -1,27 +1,30 @@
 from crewai import Agent
 import structlog
 from src.config.settings import Settings
+from src.agents.base_agent import BaseAgent
 from src.tools.weather_tool import WeatherTool
 
 logger = structlog.get_logger(__name__)
 
-class WeatherAgent:
+class WeatherAgent(BaseAgent):
     """Agent specialized in providing weather information."""
 
+    __slots__ = ("weather_tool",)
+
     def __init__(self, settings: Settings) -> None:
-        self.settings = settings
+        super().__init__(settings)
         self.weather_tool = WeatherTool(settings)
 
-    def create(self) -> Agent:
+    def _build(self) -> Agent:
         return Agent(
             role="Weather Expert",
             goal="Provide accurate weather forecasts and conditions for any location",
             backstory="""You are a meteorologist with expertise in weather forecasting. 
             You have access to professional weather data and can provide detailed weather 
             information for any location.""",
-            verbose=False,
+            verbose=self.settings.crew_verbose,
             allow_delegation=False,
             max_iter=2,
-            llm=f"openai/{self.settings.openai_model}",
+            llm=self.settings.openai_llm_spec,
             tools=[self.weather_tool]
         )
@@ -1,17 +1,20 @@
 from crewai import Agent
 from src.config.settings import Settings
+from src.agents.base_agent import BaseAgent
+
+class WritingAgent(BaseAgent):
+    __slots__ = ()
 
-class WritingAgent:
     def __init__(self, settings: Settings) -> None:
-        self.settings = settings
+        super().__init__(settings)
 
-    def create(self) -> Agent:
+    def _build(self) -> Agent:
         return Agent(
             role="Writer",
             goal="Produce clear and engaging written content",
             backstory="You're a professional writer with a knack for crafting compelling narratives.",
-            verbose=False,
+            verbose=self.settings.crew_verbose,
             allow_delegation=False,
             max_iter=10,
-            llm=f"openai/{self.settings.openai_model}"
+            llm=self.settings.openai_llm_spec
         )
\ No newline at end of file
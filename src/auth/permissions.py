@@ -1,4 +1,6 @@
 import functools
+import inspect
+import msgspec
 import structlog
 from typing import Any, Callable, Dict, Optional, TypeVar, cast
 from src.auth.role_manager import RoleManager, Operation
@@ -19,11 +21,17 @@ def requires_permission(operation: Operation) -> Callable[[Callable[..., T]], Ca
         A decorator function that checks permissions
     """
     def decorator(func: Callable[..., T]) -> Callable[..., T]:
+        # Resolve where role_manager and user_id sit in the positional arguments once,
+        # so each protected call reads them straight from args when passed positionally
+        params = list(inspect.signature(func).parameters)
+        role_manager_idx = params.index('role_manager')
+        user_id_idx = params.index('user_id')
+
         @functools.wraps(func)
         def wrapper(*args: Any, **kwargs: Any) -> T:
-            # Extract role_manager and user_id from kwargs
-            role_manager = kwargs.get('role_manager')
-            user_id = kwargs.get('user_id')
+            # Extract role_manager and user_id from args or kwargs
+            role_manager = args[role_manager_idx] if len(args) > role_manager_idx else kwargs.get('role_manager')
+            user_id = args[user_id_idx] if len(args) > user_id_idx else kwargs.get('user_id')
             
             # In tests, role_manager might be a Mock object, so we can't use isinstance directly
             if not role_manager:
@@ -53,60 +61,28 @@ def requires_permission(operation: Operation) -> Callable[[Callable[..., T]], Ca
     
     return decorator
 
-class ApprovalRequest:
-    """Represents a request that needs approval."""
-    
-    def __init__(self, 
-                 request_id: str,
-                 user_id: str, 
-                 operation: Operation, 
-                 details: Dict[str, Any],
-                 channel_id: str,
-                 thread_ts: str):
-        """
-        Initialize an approval request.
-        
-        Args:
-            request_id: Unique identifier for the request
-            user_id: ID of the user making the request
-            operation: The operation being requested
-            details: Additional details about the request
-            channel_id: ID of the channel where the request was made
-            thread_ts: Thread timestamp of the request
-        """
-        self.request_id = request_id
-        self.user_id = user_id
-        self.operation = operation
-        self.details = details
-        self.channel_id = channel_id
-        self.thread_ts = thread_ts
-        self.status = "pending"  # pending, approved, denied
-        self.approver_id: Optional[str] = None
-    
-    def to_dict(self) -> Dict[str, Any]:
-        """Convert the request to a dictionary for storage."""
-        return {
-            "request_id": self.request_id,
-            "user_id": self.user_id,
-            "operation": self.operation.name,
-            "details": self.details,
-            "channel_id": self.channel_id,
-            "thread_ts": self.thread_ts,
-            "status": self.status,
-            "approver_id": self.approver_id
-        }
-    
-    @classmethod
-    def from_dict(cls, data: Dict[str, Any]) -> 'ApprovalRequest':
-        """Create an approval request from a dictionary."""
-        request = cls(
-            request_id=data["request_id"],
-            user_id=data["user_id"],
-            operation=Operation[data["operation"]],
-            details=data["details"],
-            channel_id=data["channel_id"],
-            thread_ts=data["thread_ts"]
-        )
-        request.status = data["status"]
-        request.approver_id = data["approver_id"]
-        return request
+class ApprovalRequest(msgspec.Struct):
+    """
+    Represents a request that needs approval.
+
+    Stored in Redis as JSON and (de)serialized directly with msgspec.
+
+    Attributes:
+        request_id: Unique identifier for the request
+        user_id: ID of the user making the request
+        operation: Name of the operation being requested (an Operation member name)
+        details: Additional details about the request
+        channel_id: ID of the channel where the request was made
+        thread_ts: Thread timestamp of the request
+        status: pending, approved or denied
+        approver_id: ID of the admin who approved or denied the request
+    """
+
+    request_id: str
+    user_id: str
+    operation: str
+    details: Dict[str, Any]
+    channel_id: str
+    thread_ts: str
+    status: str = "pending"
+    approver_id: Optional[str] = None
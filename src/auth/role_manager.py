@@ -1,6 +1,7 @@
-from enum import Enum, auto
+from enum import Enum, IntEnum, auto
+import sys
 import structlog
-from typing import List, Optional
+from typing import FrozenSet, Iterable
 from src.config.settings import Settings
 
 logger = structlog.get_logger(__name__)
@@ -10,24 +11,39 @@ class Role(Enum):
     ADMIN = auto()
     REGULAR = auto()
 
-class Operation(Enum):
+class Operation(IntEnum):
     """Operation types that may require permission checks."""
     # Document operations
-    DOCUMENT_ADD = auto()
-    DOCUMENT_DELETE = auto()
-    DOCUMENT_UPDATE = auto()
-    DOCUMENT_LIST = auto()
-    DOCUMENT_VIEW = auto()
-    DOCUMENT_STATS = auto()  # Added for viewing document statistics
+    DOCUMENT_ADD = 0
+    DOCUMENT_DELETE = 1
+    DOCUMENT_UPDATE = 2
+    DOCUMENT_LIST = 3
+    DOCUMENT_VIEW = 4
+    DOCUMENT_STATS = 5  # Added for viewing document statistics
     
-    # Other operations can be added here as needed
+    # Other operations can be added here as needed, with the next value
+    # and an entry in _APPROVAL_REQUIRED
     # For example:
-    # USER_MANAGEMENT = auto()
-    # SYSTEM_CONFIG = auto()
+    # USER_MANAGEMENT = 6
+    # SYSTEM_CONFIG = 7
+
+# Whether regular users need approval for each operation, indexed by Operation value
+_APPROVAL_REQUIRED = (
+    True,   # DOCUMENT_ADD
+    True,   # DOCUMENT_DELETE
+    True,   # DOCUMENT_UPDATE
+    False,  # DOCUMENT_LIST
+    False,  # DOCUMENT_VIEW
+    False,  # DOCUMENT_STATS
+)
+
+# Plain module globals skip the enum class attribute lookup in get_user_role
+_ADMIN = Role.ADMIN
+_REGULAR = Role.REGULAR
 
 class RoleManager:
     """Manages user roles and permissions."""
-    
+
     def __init__(self, settings: Settings):
         """
         Initialize the role manager.
@@ -38,6 +54,17 @@ class RoleManager:
         self.settings = settings
         self.admin_user_ids = settings.admin_user_ids
         logger.info("Role manager initialized", admin_count=len(self.admin_user_ids))
+
+    @property
+    def admin_user_ids(self) -> FrozenSet[str]:
+        """Slack user IDs of the admins."""
+        return self._admin_user_ids
+
+    @admin_user_ids.setter
+    def admin_user_ids(self, user_ids: Iterable[str]) -> None:
+        # A set so the admin check on every event is a hash lookup; interned so
+        # interned event user IDs match by identity before any string compare
+        self._admin_user_ids = frozenset(map(sys.intern, user_ids))
     
     def get_user_role(self, user_id: str) -> Role:
         """
@@ -49,9 +76,7 @@ class RoleManager:
         Returns:
             The user's role (ADMIN or REGULAR)
         """
-        if user_id in self.admin_user_ids:
-            return Role.ADMIN
-        return Role.REGULAR
+        return _ADMIN if user_id in self.admin_user_ids else _REGULAR
     
     def is_admin(self, user_id: str) -> bool:
         """
@@ -76,16 +101,9 @@ class RoleManager:
         Returns:
             True if the user can perform the operation directly, False if approval is needed
         """
-        # Admin users can perform all operations directly
-        if self.is_admin(user_id):
-            return True
-        
-        # Regular users need approval for document management operations
-        if operation in [Operation.DOCUMENT_ADD, Operation.DOCUMENT_DELETE, Operation.DOCUMENT_UPDATE]:
-            return False
-        
-        # Regular users can perform other operations directly
-        return True
+        # Admin users can perform all operations directly; regular users
+        # need approval for document management operations only
+        return not _APPROVAL_REQUIRED[operation] or user_id in self.admin_user_ids
     
     def requires_approval(self, user_id: str, operation: Operation) -> bool:
         """
@@ -98,4 +116,4 @@ class RoleManager:
         Returns:
             True if the operation requires approval, False otherwise
         """
-        return not self.can_perform_operation(user_id, operation)
+        return _APPROVAL_REQUIRED[operation] and user_id not in self.admin_user_ids
@@ -0,0 +1,134 @@
+import asyncio
+import threading
+import time
+from concurrent.futures import Future
+from typing import Any, Dict, List, Optional
+import structlog
+from src.config.settings import Settings
+from src.llm.clients import LLMClients
+
+logger = structlog.get_logger(__name__)
+
+class CompletionBatcher:
+    """
+    Batches chat completions from concurrent Slack requests.
+
+    Slack Bolt handles each message on its own worker thread. Instead of every
+    thread opening its own connection and firing its request independently,
+    requests are queued to the shared LLM event loop, which collects everything
+    arriving within a short window (up to a maximum batch size) and sends the
+    batch concurrently over the shared pooled client. Callers that share the same
+    system prompt let the provider reuse its cached prompt prefix.
+    """
+
+    _instance = None
+    _instance_lock = threading.Lock()
+
+    @classmethod
+    def get_instance(cls, settings: Settings) -> 'CompletionBatcher':
+        """
+        Get the singleton instance of the CompletionBatcher.
+
+        Args:
+            settings: Application settings.
+
+        Returns:
+            CompletionBatcher: The singleton instance.
+        """
+        if cls._instance is None:
+            with cls._instance_lock:
+                if cls._instance is None:
+                    cls._instance = cls(settings)
+        return cls._instance
+
+    def __init__(self, settings: Settings):
+        """
+        Initialize the CompletionBatcher.
+
+        Args:
+            settings: Application settings.
+        """
+        self.settings = settings
+        self.batch_size = settings.batch_size
+        self.batch_window = settings.batch_window_ms / 1000
+        self.clients = LLMClients.get_instance(settings)
+        self._queue: Optional[asyncio.Queue] = None
+        self._start_lock = threading.Lock()
+
+    def complete(self, messages: List[Dict[str, str]], **kwargs: Any) -> str:
+        """
+        Run a chat completion as part of the next batch and wait for its result.
+
+        Args:
+            messages: Chat messages for the completion.
+            **kwargs: Extra parameters for the completion request.
+
+        Returns:
+            str: The content of the completion.
+        """
+        return self.submit(messages, **kwargs).result()
+
+    def submit(self, messages: List[Dict[str, str]], **kwargs: Any) -> Future:
+        """
+        Queue a chat completion for the next batch.
+
+        Args:
+            messages: Chat messages for the completion.
+            **kwargs: Extra parameters for the completion request.
+
+        Returns:
+            Future: Resolves to the content of the completion.
+        """
+        self._ensure_started()
+        future: Future = Future()
+        self.clients.loop.call_soon_threadsafe(self._queue.put_nowait, (messages, kwargs, future))
+        return future
+
+    def _ensure_started(self) -> None:
+        """Start the dispatcher on the shared LLM event loop on first use."""
+        if self._queue is not None:
+            return
+        with self._start_lock:
+            if self._queue is not None:
+                return
+            queue: asyncio.Queue = asyncio.Queue()
+            self.clients.submit(self._dispatch(queue))
+            self._queue = queue
+            logger.info("Started completion batcher",
+                        batch_size=self.batch_size,
+                        batch_window_ms=self.settings.batch_window_ms)
+
+    async def _dispatch(self, queue: asyncio.Queue) -> None:
+        """Collect queued requests into batches and send each batch concurrently."""
+        while True:
+            batch = [await queue.get()]
+            deadline = time.monotonic() + self.batch_window
+            while len(batch) < self.batch_size:
+                timeout = deadline - time.monotonic()
+                if timeout <= 0:
+                    break
+                try:
+                    batch.append(await asyncio.wait_for(queue.get(), timeout))
+                except asyncio.TimeoutError:
+                    break
+
+            logger.debug("Dispatching completion batch", size=len(batch))
+            asyncio.create_task(self._run_batch(batch))
+
+    async def _run_batch(self, batch: List[tuple]) -> None:
+        """Send a batch of requests and hand each result back to its caller."""
+        results = await asyncio.gather(
+            *(self._complete(messages, **kwargs) for messages, kwargs, _ in batch),
+            return_exceptions=True
+        )
+        for (_, _, future), result in zip(batch, results):
+            if isinstance(result, BaseException):
+                future.set_exception(result)
+            else:
+                future.set_result(result)
+
+    async def _complete(self, messages: List[Dict[str, str]], **kwargs: Any) -> str:
+        """Send a single chat completion request."""
+        kwargs.setdefault("model", self.settings.openai_model)
+        response = await self.clients.openai.chat.completions.create(messages=messages, **kwargs)
+        return response.choices[0].message.content or ""
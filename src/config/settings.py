@@ -1,81 +1,264 @@
 import os
+import functools
 from dotenv import load_dotenv
 import structlog
+from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Optional
+from typing import Any, Dict, FrozenSet, Optional
 
 logger = structlog.get_logger(__name__)
 
+BASE_DIR = Path(__file__).resolve().parent.parent.parent
+DOTENV_PATH = BASE_DIR / ".env"
+
 class EnvironmentError(Exception):
     """Custom exception for environment-related errors."""
     pass
 
+@dataclass(slots=True, frozen=True)
 class Settings:
     """Application configuration loaded from environment variables."""
 
-    def __init__(self) -> None:
-        self._load_environment()
-        self._validate_and_set_variables()
-        self._configure_crewai_environment()
-        self._configure_redis()
-        self._configure_rag()
-        self._log_initialization()
+    # Secrets are left out of the repr so a logged Settings never leaks them
+
+    # Slack
+    slack_bot_token: str = field(repr=False)
+    slack_app_token: str = field(repr=False)
+    # Token prefixes safe to log
+    slack_bot_token_prefix: str
+    slack_app_token_prefix: str
+    admin_user_ids: FrozenSet[str]
+
+    # LLM providers
+    openai_api_key: str = field(repr=False)
+    openai_model: str
+    openai_api_base: Optional[str]
+    openai_llm_spec: str
+    anthropic_api_key: str = field(repr=False)
+    anthropic_model: str
+    anthropic_api_base: Optional[str]
+    anthropic_llm_spec: str
+
+    # Redis
+    redis_host: str
+    redis_port: int
+    redis_password: Optional[str] = field(repr=False)
+    redis_db: int
+    redis_ssl: bool
+    redis_ttl: int
+
+    # Weather
+    openweather_api_key: str = field(repr=False)
+
+    # CrewAI
+    crew_verbose: bool
+    crew_process_workers: int
+
+    # Intent cache
+    intent_cache_enabled: bool
+    intent_cache_size: int
+    intent_cache_threshold: float
+    intent_cache_ttl: int
+    conversation_history_threshold: int
+    intent_classifier_path: Optional[str]
+
+    # RAG
+    vector_db_provider: str
+    pinecone_api_key: Optional[str] = field(repr=False)
+    pinecone_environment: Optional[str]
+    pinecone_index: str
+    chroma_persist_dir: str
+    chroma_collection: str
+    embedding_provider: str
+    openai_embedding_model: str
+    embedding_batch_size: int
+    embedding_concurrency: int
+    embedding_cache_size: int
+    st_model: str
+    st_backend: str
+    st_onnx_file: Optional[str]
+    chunk_size: int
+    chunk_overlap: int
+    cache_enabled: bool
+    cache_backend: str
+    cache_dir: str
+
+    # External services
+    google_credentials: Optional[str] = field(repr=False)
+    dropbox_app_key: Optional[str]
+    dropbox_app_secret: Optional[str] = field(repr=False)
+    dropbox_refresh_token: Optional[str] = field(repr=False)
+    google_sheets_credentials_file: Optional[str]
+    google_service_account_email: Optional[str]
+    feedback_spreadsheet_id: Optional[str]
+
+    # Batching
+    batch_size: int
+    batch_window_ms: int
 
-    def _load_environment(self) -> None:
+    @classmethod
+    def from_env(cls) -> 'Settings':
+        """
+        Build Settings from the environment, after loading the .env file.
+
+        Returns:
+            Settings: The validated application settings.
+        """
+        cls._load_environment()
+        # Read every variable from one plain-dict snapshot of the environment
+        env = os.environ.copy()
+        settings = cls(
+            **cls._validate_and_read_variables(env),
+            **cls._read_crewai(env),
+            **cls._read_intent_cache(env),
+            **cls._read_rag(env),
+            **cls._read_batching(env)
+        )
+        settings._configure_crewai_environment()
+        settings._configure_redis()
+        settings._configure_rag()
+        settings._log_initialization()
+        return settings
+
+    @staticmethod
+    def _load_environment() -> None:
         """Load environment variables from .env file."""
-        BASE_DIR = Path(__file__).resolve().parent.parent.parent
-        dotenv_path = BASE_DIR / ".env"
-        
-        if not dotenv_path.exists():
-            logger.warning("Environment setup", status="warning", 
-                         message=f".env file not found at {dotenv_path}")
-        
-        load_dotenv(dotenv_path=dotenv_path, verbose=True)
-        logger.debug("Environment setup", status="success",
-                    message=f"Attempted to load .env from {dotenv_path}")
-
-    def _validate_and_set_variables(self) -> None:
-        """Validate and set all required environment variables."""
+        _load_dotenv(DOTENV_PATH)
+
+    @classmethod
+    def _validate_and_read_variables(cls, env: Dict[str, str]) -> Dict[str, Any]:
+        """Validate and read all required environment variables."""
         try:
             # Required variables with validation
-            self.slack_bot_token = self._validate_token(
-                self._get_required("SLACK_BOT_TOKEN"), "xoxb-")
-            self.slack_app_token = self._validate_token(
-                self._get_required("SLACK_APP_TOKEN"), "xapp-")
-            self.openai_api_key = self._validate_token(
-                self._get_required("OPENAI_API_KEY"), "sk-")
-            self.anthropic_api_key = self._get_required("ANTHROPIC_API_KEY")
+            slack_bot_token = cls._validate_token(
+                cls._get_required(env, "SLACK_BOT_TOKEN"), "xoxb-")
+            slack_app_token = cls._validate_token(
+                cls._get_required(env, "SLACK_APP_TOKEN"), "xapp-")
+            openai_api_key = cls._validate_token(
+                cls._get_required(env, "OPENAI_API_KEY"), "sk-")
+            anthropic_api_key = cls._get_required(env, "ANTHROPIC_API_KEY")
 
             # Variables with defaults
-            self.openai_model = self._get_required(
-                "OPENAI_MODEL", "gpt-4o-mini")
-            self.anthropic_model = self._get_required(
-                "ANTHROPIC_MODEL", "claude-3-haiku-20240307")
-
-            # Optional variables
-            self.openai_api_base = os.getenv("OPENAI_API_BASE")
-            self.anthropic_api_base = os.getenv("ANTHROPIC_API_BASE")
-            
+            openai_model = cls._get_required(env, "OPENAI_MODEL", "gpt-4o-mini")
+            anthropic_model = cls._get_required(
+                env, "ANTHROPIC_MODEL", "claude-3-haiku-20240307")
+
             # Role-based access control
-            admin_ids = os.getenv("ADMIN_USER_IDS", "")
-            self.admin_user_ids = [uid.strip() for uid in admin_ids.split(",") if uid.strip()]
-
-            # Redis configuration
-            self.redis_host = self._get_required("REDIS_HOST", "redis")
-            self.redis_port = int(self._get_required("REDIS_PORT", "6379"))
-            self.redis_password = os.getenv("REDIS_PASSWORD")
-            self.redis_db = int(self._get_required("REDIS_DB", "0"))
-            self.redis_ssl = self._get_required("REDIS_SSL", "true").lower() == "true"
-            self.redis_ttl = int(self._get_required("REDIS_TTL", "86400"))
-
-            # Weather API configuration (using WeatherAPI.com instead of OpenWeather)
-            self.openweather_api_key = self._get_required("OPENWEATHER_API_KEY")
-            # Note: We're still using the OPENWEATHER_API_KEY env variable name for backward compatibility
-            # but it should now contain a WeatherAPI.com API key
+            admin_user_ids = cls._parse_admin_user_ids(env.get("ADMIN_USER_IDS", ""))
+
+            return dict(
+                slack_bot_token=slack_bot_token,
+                slack_app_token=slack_app_token,
+                slack_bot_token_prefix=f"{slack_bot_token[:8]}...",
+                slack_app_token_prefix=f"{slack_app_token[:8]}...",
+                admin_user_ids=admin_user_ids,
+                openai_api_key=openai_api_key,
+                openai_model=openai_model,
+                # Optional variables
+                openai_api_base=env.get("OPENAI_API_BASE"),
+                # Provider-prefixed model names passed to CrewAI agents as llm=
+                openai_llm_spec=f"openai/{openai_model}",
+                anthropic_api_key=anthropic_api_key,
+                anthropic_model=anthropic_model,
+                anthropic_api_base=env.get("ANTHROPIC_API_BASE"),
+                anthropic_llm_spec=f"anthropic/{anthropic_model}",
+
+                # Redis configuration
+                redis_host=cls._get_required(env, "REDIS_HOST", "redis"),
+                redis_port=int(cls._get_required(env, "REDIS_PORT", "6379")),
+                redis_password=env.get("REDIS_PASSWORD"),
+                redis_db=int(cls._get_required(env, "REDIS_DB", "0")),
+                redis_ssl=cls._get_required(env, "REDIS_SSL", "true").lower() == "true",
+                redis_ttl=int(cls._get_required(env, "REDIS_TTL", "86400")),
+
+                # Weather API configuration (using WeatherAPI.com instead of OpenWeather)
+                # Note: We're still using the OPENWEATHER_API_KEY env variable name for backward compatibility
+                # but it should now contain a WeatherAPI.com API key
+                openweather_api_key=cls._get_required(env, "OPENWEATHER_API_KEY")
+            )
 
         except ValueError as e:
             raise EnvironmentError(f"Environment validation failed: {str(e)}")
 
+    @staticmethod
+    def _read_crewai(env: Dict[str, str]) -> Dict[str, Any]:
+        """Read CrewAI-specific settings."""
+        return dict(
+            # Verbose crew output logs every agent step, so it's opt-in for debugging
+            crew_verbose=env.get("CREW_VERBOSE", "0").lower() in ("1", "true"),
+            # Worker processes for blocking crew runs; 0 runs them on threads in this process
+            crew_process_workers=int(env.get("CREW_PROCESS_WORKERS", "0"))
+        )
+
+    @staticmethod
+    def _read_intent_cache(env: Dict[str, str]) -> Dict[str, Any]:
+        """Read settings for the master crew's intent cache and classifier."""
+        return dict(
+            intent_cache_enabled=env.get("INTENT_CACHE_ENABLED", "true").lower() == "true",
+            intent_cache_size=int(env.get("INTENT_CACHE_SIZE", "10000")),
+            # Minimum cosine similarity for a request to reuse a cached intent
+            intent_cache_threshold=float(env.get("INTENT_CACHE_THRESHOLD", "0.92")),
+            intent_cache_ttl=int(env.get("INTENT_CACHE_TTL", "3600")),
+            # Longer conversations skip the cache, since shared topics inflate similarity
+            conversation_history_threshold=int(env.get("CONVERSATION_HISTORY_THRESHOLD", "6")),
+            # Trained SetFit intent classifier; unset leaves routing to the master agent
+            intent_classifier_path=env.get("INTENT_CLASSIFIER_PATH")
+        )
+
+    @staticmethod
+    def _read_rag(env: Dict[str, str]) -> Dict[str, Any]:
+        """Read RAG-specific settings."""
+        return dict(
+            # Vector Database Configuration
+            vector_db_provider=env.get("VECTOR_DB_PROVIDER", "pinecone"),
+
+            # Pinecone Configuration
+            pinecone_api_key=env.get("PINECONE_API_KEY"),
+            pinecone_environment=env.get("PINECONE_ENVIRONMENT"),
+            pinecone_index=env.get("PINECONE_INDEX", "documents"),
+
+            # Chroma Configuration
+            chroma_persist_dir=env.get("CHROMA_PERSIST_DIR", "./chroma_db"),
+            chroma_collection=env.get("CHROMA_COLLECTION", "documents"),
+
+            # Embedding Configuration
+            embedding_provider=env.get("EMBEDDING_PROVIDER", "openai"),
+            openai_embedding_model=env.get("OPENAI_EMBEDDING_MODEL", "text-embedding-3-small"),
+            embedding_batch_size=int(env.get("EMBEDDING_BATCH_SIZE", "256")),
+            embedding_concurrency=int(env.get("EMBEDDING_CONCURRENCY", "8")),
+            # Embedding vectors cached by text; 0 disables the cache
+            embedding_cache_size=int(env.get("EMBEDDING_CACHE_SIZE", "10000")),
+            st_model=env.get("ST_MODEL", "all-MiniLM-L6-v2"),
+            st_backend=env.get("ST_BACKEND", "torch").lower(),
+            st_onnx_file=env.get("ST_ONNX_FILE"),
+
+            # Document Processing Configuration
+            chunk_size=int(env.get("CHUNK_SIZE", "1000")),
+            chunk_overlap=int(env.get("CHUNK_OVERLAP", "200")),
+            cache_enabled=env.get("CACHE_ENABLED", "true").lower() == "true",
+            cache_backend=env.get("CACHE_BACKEND", "file").lower(),
+            cache_dir=env.get("CACHE_DIR", "./document_cache"),
+
+            # External Services Configuration
+            google_credentials=env.get("GOOGLE_CREDENTIALS"),
+            dropbox_app_key=env.get("DROPBOX_APP_KEY"),
+            dropbox_app_secret=env.get("DROPBOX_APP_SECRET"),
+            dropbox_refresh_token=env.get("DROPBOX_REFRESH_TOKEN"),
+
+            # Feedback Agent Configuration
+            google_sheets_credentials_file=env.get("GOOGLE_SHEETS_CREDENTIALS_FILE"),
+            google_service_account_email=env.get("GOOGLE_SERVICE_ACCOUNT_EMAIL"),
+            feedback_spreadsheet_id=env.get("FEEDBACK_SPREADSHEET_ID")
+        )
+
+    @staticmethod
+    def _read_batching(env: Dict[str, str]) -> Dict[str, Any]:
+        """Read settings for batching concurrent LLM requests."""
+        return dict(
+            batch_size=int(env.get("BATCH_SIZE", "32")),
+            batch_window_ms=int(env.get("BATCH_WINDOW_MS", "25"))
+        )
+
     def _configure_redis(self) -> None:
         """Configure Redis-specific settings."""
         logger.info(
@@ -91,57 +274,24 @@ class Settings:
         """Configure CrewAI-specific environment variables."""
         # Set API bases first to ensure they're configured before any API client initialization
         if self.openai_api_base:
-            os.environ["OPENAI_API_BASE"] = self.openai_api_base
+            _set_environ("OPENAI_API_BASE", self.openai_api_base)
             logger.info("Set custom OpenAI API base", base_url=self.openai_api_base)
         if self.anthropic_api_base:
-            os.environ["ANTHROPIC_API_BASE"] = self.anthropic_api_base
+            _set_environ("ANTHROPIC_API_BASE", self.anthropic_api_base)
             logger.info("Set custom Anthropic API base", base_url=self.anthropic_api_base)
 
         # Set API keys after bases are configured
-        os.environ["OPENAI_API_KEY"] = self.openai_api_key
-        os.environ["ANTHROPIC_API_KEY"] = self.anthropic_api_key
+        _set_environ("OPENAI_API_KEY", self.openai_api_key)
+        _set_environ("ANTHROPIC_API_KEY", self.anthropic_api_key)
 
         # Set additional OpenAI configurations
-        os.environ["OPENAI_API_TYPE"] = "open_ai"
         if self.openai_api_base and "azure" in self.openai_api_base.lower():
-            os.environ["OPENAI_API_TYPE"] = "azure"
+            _set_environ("OPENAI_API_TYPE", "azure")
+        else:
+            _set_environ("OPENAI_API_TYPE", "open_ai")
 
     def _configure_rag(self) -> None:
         """Configure RAG-specific settings."""
-        # Vector Database Configuration
-        self.vector_db_provider = os.getenv("VECTOR_DB_PROVIDER", "pinecone")
-        
-        # Pinecone Configuration
-        self.pinecone_api_key = os.getenv("PINECONE_API_KEY")
-        self.pinecone_environment = os.getenv("PINECONE_ENVIRONMENT")
-        self.pinecone_index = os.getenv("PINECONE_INDEX", "documents")
-        
-        # Chroma Configuration
-        self.chroma_persist_dir = os.getenv("CHROMA_PERSIST_DIR", "./chroma_db")
-        self.chroma_collection = os.getenv("CHROMA_COLLECTION", "documents")
-        
-        # Embedding Configuration
-        self.embedding_provider = os.getenv("EMBEDDING_PROVIDER", "openai")
-        self.openai_embedding_model = os.getenv("OPENAI_EMBEDDING_MODEL", "text-embedding-3-small")
-        self.st_model = os.getenv("ST_MODEL", "all-MiniLM-L6-v2")
-        
-        # Document Processing Configuration
-        self.chunk_size = int(os.getenv("CHUNK_SIZE", "1000"))
-        self.chunk_overlap = int(os.getenv("CHUNK_OVERLAP", "200"))
-        self.cache_enabled = os.getenv("CACHE_ENABLED", "true").lower() == "true"
-        self.cache_dir = os.getenv("CACHE_DIR", "./document_cache")
-        
-        # External Services Configuration
-        self.google_credentials = os.getenv("GOOGLE_CREDENTIALS")
-        self.dropbox_app_key = os.getenv("DROPBOX_APP_KEY")
-        self.dropbox_app_secret = os.getenv("DROPBOX_APP_SECRET")
-        self.dropbox_refresh_token = os.getenv("DROPBOX_REFRESH_TOKEN")
-        
-        # Feedback Agent Configuration
-        self.google_sheets_credentials_file = os.getenv("GOOGLE_SHEETS_CREDENTIALS_FILE")
-        self.google_service_account_email = os.getenv("GOOGLE_SERVICE_ACCOUNT_EMAIL")
-        self.feedback_spreadsheet_id = os.getenv("FEEDBACK_SPREADSHEET_ID")
-        
         logger.info(
             "RAG configuration initialized",
             vector_db_provider=self.vector_db_provider,
@@ -155,24 +305,61 @@ class Settings:
         """Log initialization status and configuration."""
         logger.info(
             "Settings initialized",
-            slack_bot_token_prefix=self.slack_bot_token[:8] + "...",
-            slack_app_token_prefix=self.slack_app_token[:8] + "...",
+            slack_bot_token_prefix=self.slack_bot_token_prefix,
+            slack_app_token_prefix=self.slack_app_token_prefix,
             openai_model=self.openai_model,
             anthropic_model=self.anthropic_model,
             openai_api_base=self.openai_api_base or "default",
             anthropic_api_base=self.anthropic_api_base or "default"
         )
 
-    def _get_required(self, key: str, default: Optional[str] = None) -> str:
+    @staticmethod
+    def _parse_admin_user_ids(admin_ids: str) -> FrozenSet[str]:
+        """Parse the comma-separated admin user IDs."""
+        if "," not in admin_ids:
+            # A single admin (or none) is the usual setup
+            admin_id = admin_ids.strip()
+            return frozenset((admin_id,)) if admin_id else frozenset()
+        return frozenset(filter(None, map(str.strip, admin_ids.split(","))))
+
+    @staticmethod
+    def _get_required(env: Dict[str, str], key: str, default: Optional[str] = None) -> str:
         """Get a required environment variable."""
-        value = os.getenv(key, default)
+        value = env.get(key, default)
         if not value:
             raise ValueError(f"Missing required environment variable: {key}")
         return value
 
-    def _validate_token(self, token: str, expected_prefix: str) -> str:
+    @staticmethod
+    def _validate_token(token: str, expected_prefix: str) -> str:
         """Validate token format."""
         if not token.startswith(expected_prefix):
             raise ValueError(
                 f"Invalid token format. Expected prefix '{expected_prefix}' for token: {token[:4]}...")
         return token
+
+def _set_environ(key: str, value: str) -> None:
+    """Set an environment variable, skipping the putenv call when it already has the value."""
+    if os.environ.get(key) != value:
+        os.environ[key] = value
+
+@functools.lru_cache(maxsize=None)
+def _load_dotenv(dotenv_path: Path) -> None:
+    """Parse the .env file into the environment, once per process."""
+    if not dotenv_path.exists():
+        logger.warning("Environment setup", status="warning", 
+                     message=f".env file not found at {dotenv_path}")
+    
+    load_dotenv(dotenv_path=dotenv_path, verbose=True)
+    logger.debug("Environment setup", status="success",
+                message=f"Attempted to load .env from {dotenv_path}")
+
+@functools.lru_cache(maxsize=1)
+def get_settings() -> Settings:
+    """
+    Get the process-wide Settings instance, creating it on first use.
+
+    Returns:
+        Settings: The shared application settings.
+    """
+    return Settings.from_env()
@@ -1,21 +1,58 @@
 from abc import ABC, abstractmethod
-from typing import Any, Dict, Optional
-from crewai import Crew
-from crewai.tools import BaseTool
-from src.config.settings import Settings
+import asyncio
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from typing import TYPE_CHECKING, Any, AsyncIterator, Dict, Iterator, Optional
+from src.config.settings import Settings, get_settings
 import structlog
 
+if TYPE_CHECKING:
+    # CrewAI is only imported once a crew actually builds its agents
+    from crewai import Agent, Crew
+    from crewai.tools import BaseTool
+    from src.agents.base_agent import BaseAgent
+
 logger = structlog.get_logger(__name__)
 
+# Recycle crew worker processes after this many runs to bound their memory
+WORKER_MAX_TASKS = 50
+
+# Crews built inside a worker process, reused across the runs it handles
+_worker_crews: Dict[type, 'BaseCrew'] = {}
+
+def _run_in_worker(crew_class: type, inputs: Dict[str, Any]) -> str:
+    """Run a crew inside a worker process, building it on the worker's first run."""
+    crew = _worker_crews.get(crew_class)
+    if crew is None:
+        crew = _worker_crews[crew_class] = crew_class.from_settings(get_settings())
+    return crew.run(inputs=inputs)
+
 class BaseCrew(ABC):
     """Abstract base class for CrewAI crews."""
 
+    _process_pool: Optional[ProcessPoolExecutor] = None
+    _process_pool_lock = threading.Lock()
+
     def __init__(self, settings: Settings) -> None:
         self.settings = settings
         self.logger = structlog.get_logger(self.__class__.__name__)
+        self._tool_index: Optional[Dict[str, 'BaseTool']] = None
+
+    @classmethod
+    def from_settings(cls, settings: Settings) -> 'BaseCrew':
+        """
+        Build the crew from settings alone, as done in crew worker processes.
+
+        Args:
+            settings: Application settings.
+
+        Returns:
+            BaseCrew: The new crew.
+        """
+        return cls(settings)
 
     @abstractmethod
-    def create_crew(self, inputs: dict[str, str]) -> Crew:
+    def create_crew(self, inputs: dict[str, str]) -> 'Crew':
         """Create and configure the CrewAI crew."""
         pass
 
@@ -29,8 +66,67 @@ class BaseCrew(ABC):
         except Exception as e:
             self.logger.error("Error running crew", error=str(e), exc_info=True)
             raise
+
+    async def stream(self, inputs: dict[str, str]) -> AsyncIterator[str]:
+        """
+        Execute the crew, yielding the response text in chunks as it is produced.
+
+        Crews that cannot stream yield the whole result once. The blocking
+        CrewAI run happens on a worker thread so the event loop stays free, or
+        in a worker process when crew_process_workers is set, so concurrent
+        runs don't contend for this process's GIL.
+        """
+        if self.settings.crew_process_workers > 0:
+            loop = asyncio.get_running_loop()
+            yield await loop.run_in_executor(self._get_process_pool(), _run_in_worker, type(self), inputs)
+        else:
+            yield await asyncio.to_thread(self.run, inputs=inputs)
+
+    def _get_process_pool(self) -> ProcessPoolExecutor:
+        """Get the process pool shared by all crews, starting it on first use."""
+        if BaseCrew._process_pool is None:
+            with BaseCrew._process_pool_lock:
+                if BaseCrew._process_pool is None:
+                    BaseCrew._process_pool = ProcessPoolExecutor(
+                        max_workers=self.settings.crew_process_workers,
+                        max_tasks_per_child=WORKER_MAX_TASKS
+                    )
+                    logger.info("Started crew process pool",
+                                workers=self.settings.crew_process_workers)
+        return BaseCrew._process_pool
+
+    @staticmethod
+    def _system_prompt(agent: 'Agent') -> str:
+        """Build the system prompt for calling the LLM directly as the given agent."""
+        return f"You are {agent.role}. {agent.backstory}\nYour personal goal is: {agent.goal}"
     
-    def get_tool(self, tool_name: str) -> Optional[BaseTool]:
+    def coalescing_key(self, inputs: dict[str, str]) -> Optional[str]:
+        """
+        Key under which identical concurrent requests can share one response.
+
+        Returns None (never share) by default; crews whose response depends
+        only on the key's inputs can override this.
+        """
+        return None
+
+    def agents(self) -> Iterator['BaseAgent']:
+        """
+        Get the crew's agent wrappers.
+
+        Finds the wrappers among the crew's attributes by default; crews that
+        create their agents lazily override this to list them all.
+        """
+        from src.agents.base_agent import BaseAgent
+        for value in vars(self).values():
+            if isinstance(value, BaseAgent):
+                yield value
+
+    def warm_up(self) -> None:
+        """Build the crew's agents ahead of the first request."""
+        for agent in self.agents():
+            agent.create()
+
+    def get_tool(self, tool_name: str) -> Optional['BaseTool']:
         """
         Get a tool by name from the crew's agents.
         
@@ -41,21 +137,19 @@ class BaseCrew(ABC):
             The tool if found, None otherwise.
         """
         try:
-            # Create the crew to access its agents and tools
-            crew = self.create_crew({})
-            
-            # Iterate through all agents in the crew
-            for agent in crew.agents:
-                # Iterate through all tools of each agent
-                for tool in agent.tools:
-                    # Check if the tool name matches
-                    if tool.name == tool_name:
-                        return tool
+            if self._tool_index is None:
+                # Index the tools of all the crew's agents once, without building a crew
+                tool_index: Dict[str, 'BaseTool'] = {}
+                for agent in self.agents():
+                    for tool in agent.create().tools:
+                        tool_index.setdefault(tool.name, tool)
+                self._tool_index = tool_index
             
-            # Tool not found
-            self.logger.warning(f"Tool '{tool_name}' not found in any agent")
-            return None
+            tool = self._tool_index.get(tool_name)
+            if tool is None:
+                self.logger.warning("Tool not found in any agent", tool_name=tool_name)
+            return tool
             
         except Exception as e:
-            self.logger.error(f"Error retrieving tool '{tool_name}'", error=str(e), exc_info=True)
+            self.logger.error("Error retrieving tool", tool_name=tool_name, error=str(e), exc_info=True)
             return None
@@ -0,0 +1,204 @@
+import hashlib
+import threading
+import time
+from collections import OrderedDict
+from typing import List, Optional, Tuple
+import numpy as np
+import orjson
+import structlog
+from src.config.settings import Settings
+from src.rag.embedding.base import EmbeddingModel
+
+logger = structlog.get_logger(__name__)
+
+# (intent, confidence, clarification_question, additional_intents), as returned
+# by MasterCrew._parse_intent_result
+IntentResult = Tuple[str, float, Optional[str], Tuple[str, ...]]
+
+# Entries kept by the exact-match tier
+FINGERPRINT_CACHE_SIZE = 4096
+
+class IntentFingerprintCache:
+    """
+    Caches intent analysis results for exact repeats of a request.
+
+    Keys are a hash of the normalized request and the formatted history, so a
+    lookup costs one BLAKE2b digest and a dict probe. The least recently used entry is
+    dropped once the cache is full.
+    """
+
+    def __init__(self, capacity: int = FINGERPRINT_CACHE_SIZE):
+        """
+        Initialize the IntentFingerprintCache.
+
+        Args:
+            capacity: Maximum number of cached results.
+        """
+        self.capacity = capacity
+        self._lock = threading.Lock()
+        self._results: OrderedDict[str, IntentResult] = OrderedDict()
+
+    @staticmethod
+    def fingerprint(request: str, history: str) -> str:
+        """
+        Build the cache key for a request.
+
+        Args:
+            request: The user's request text.
+            history: The formatted conversation history.
+
+        Returns:
+            str: The fingerprint.
+        """
+        # orjson serializes straight to bytes and keeps the two fields apart, so
+        # different splits between history and request can't collide
+        return hashlib.blake2b(orjson.dumps((history, request.strip().lower())),
+                               digest_size=16).hexdigest()
+
+    def get(self, fingerprint: str) -> Optional[IntentResult]:
+        """
+        Get the cached result for a fingerprint.
+
+        Args:
+            fingerprint: Key from fingerprint().
+
+        Returns:
+            Optional[IntentResult]: The cached result, or None on a miss.
+        """
+        with self._lock:
+            result = self._results.get(fingerprint)
+            if result is not None:
+                self._results.move_to_end(fingerprint)
+            return result
+
+    def put(self, fingerprint: str, result: IntentResult) -> None:
+        """
+        Cache the result for a fingerprint.
+
+        Args:
+            fingerprint: Key from fingerprint().
+            result: The intent analysis result.
+        """
+        with self._lock:
+            self._results[fingerprint] = result
+            self._results.move_to_end(fingerprint)
+            if len(self._results) > self.capacity:
+                self._results.popitem(last=False)
+
+class SemanticIntentCache:
+    """
+    Caches intent analysis results by the meaning of the request.
+
+    Requests are embedded with a local sentence-transformers model. A new
+    request whose embedding has cosine similarity at or above the threshold
+    with a cached one reuses that request's intent, so paraphrases of recent
+    requests skip the master agent's completion. Entries expire after a TTL,
+    and the least recently used entry is replaced once the cache is full.
+    """
+
+    def __init__(self, settings: Settings, model: Optional[EmbeddingModel] = None):
+        """
+        Initialize the SemanticIntentCache.
+
+        Args:
+            settings: Application settings with the intent cache configuration.
+            model: Embedding model to use. If None, the EmbeddingService's shared
+                sentence-transformers model is used, loaded on first use.
+        """
+        self.settings = settings
+        self.capacity = settings.intent_cache_size
+        self.threshold = settings.intent_cache_threshold
+        self.ttl = settings.intent_cache_ttl
+        self._model = model
+        self._lock = threading.Lock()
+        # Unit-length embeddings, one row per slot, allocated with the first entry
+        self._vectors: Optional[np.ndarray] = None
+        self._results: List[IntentResult] = []
+        self._expires_at = np.zeros(self.capacity)
+        self._last_used = np.zeros(self.capacity)
+        # Scratch buffers so lookups don't allocate
+        self._scores = np.empty(self.capacity, dtype=np.float32)
+        self._expired = np.empty(self.capacity, dtype=bool)
+
+    def _get_model(self) -> EmbeddingModel:
+        """Get the embedding model, loading it on first use."""
+        if self._model is None:
+            with self._lock:
+                if self._model is None:
+                    # Shares the loaded model with RAG when it also uses sentence-transformers
+                    from src.rag.embedding.service import EmbeddingService
+                    self._model = EmbeddingService.get_instance(self.settings).get_shared_model(
+                        "sentence_transformers")
+        return self._model
+
+    def embed(self, text: str) -> Optional[np.ndarray]:
+        """
+        Embed a request for lookup and storage.
+
+        Args:
+            text: The normalized request text.
+
+        Returns:
+            Optional[np.ndarray]: The unit-length embedding, or None if the model
+                could not produce one.
+        """
+        vector = np.asarray(self._get_model().generate(text), dtype=np.float32)
+        norm = np.linalg.norm(vector)
+        if not norm:
+            # The embedding models return zero vectors when they fail
+            return None
+        vector /= norm
+        return vector
+
+    def lookup(self, vector: np.ndarray) -> Optional[IntentResult]:
+        """
+        Find the cached result for the most similar live request.
+
+        Args:
+            vector: Embedding from embed().
+
+        Returns:
+            Optional[IntentResult]: The cached result, or None on a miss.
+        """
+        with self._lock:
+            size = len(self._results)
+            if not size:
+                return None
+            now = time.monotonic()
+            similarities = self._scores[:size]
+            np.dot(self._vectors[:size], vector, out=similarities)
+            expired = self._expired[:size]
+            np.less_equal(self._expires_at[:size], now, out=expired)
+            np.copyto(similarities, -1.0, where=expired)
+            # Expired slots are the first to be replaced
+            np.copyto(self._last_used[:size], 0.0, where=expired)
+            best = int(similarities.argmax())
+            if similarities[best] < self.threshold:
+                return None
+            self._last_used[best] = now
+            return self._results[best]
+
+    def add(self, vector: np.ndarray, result: IntentResult) -> None:
+        """
+        Cache the result for a request.
+
+        Args:
+            vector: Embedding from embed().
+            result: The parsed intent analysis result.
+        """
+        if not self.capacity:
+            return
+        with self._lock:
+            if self._vectors is None:
+                self._vectors = np.empty((self.capacity, vector.shape[0]), dtype=np.float32)
+            size = len(self._results)
+            if size < self.capacity:
+                slot = size
+                self._results.append(result)
+            else:
+                slot = int(np.argmin(self._last_used))
+                self._results[slot] = result
+            now = time.monotonic()
+            self._vectors[slot] = vector
+            self._expires_at[slot] = now + self.ttl
+            self._last_used[slot] = now
@@ -0,0 +1,178 @@
+import threading
+from typing import Any, Dict, List, Optional, Tuple
+import structlog
+from src.config.settings import Settings
+
+logger = structlog.get_logger(__name__)
+
+# Few-shot training examples for each intent the master crew routes to
+TRAINING_EXAMPLES: Dict[str, List[str]] = {
+    "weather": [
+        "What's the weather in London?",
+        "Will it rain tomorrow in Paris?",
+        "How hot is it in Dubai right now?",
+        "Do I need an umbrella today?",
+        "Forecast for Tokyo this weekend",
+        "Is it snowing in Denver?",
+        "What's the temperature outside?",
+        "How windy is it in Chicago today?"
+    ],
+    "rag_query": [
+        "What do our documents say about project X?",
+        "Find information about the onboarding process in our knowledge base",
+        "What does the handbook say about leave policy?",
+        "Search our docs for the deployment checklist",
+        "According to our internal docs, who owns billing?",
+        "What's in the knowledge base about API rate limits?",
+        "Look up the security policy in our documents",
+        "Summarize what our docs say about expense claims"
+    ],
+    "doc_management": [
+        "Add this PDF to the knowledge base",
+        "Index this website",
+        "Remove document X",
+        "Delete the old pricing document",
+        "Upload this file to the knowledge base",
+        "List the documents in the knowledge base",
+        "Show me the knowledge base stats",
+        "Update the onboarding guide with this new version"
+    ],
+    "research": [
+        "Tell me about quantum computing",
+        "Research renewable energy trends",
+        "Explain how transformers work in machine learning",
+        "What is the history of the Roman Empire?",
+        "Give me an overview of the electric vehicle market",
+        "How does CRISPR gene editing work?",
+        "What are the latest developments in fusion power?",
+        "Compare Python and Rust for systems programming"
+    ],
+    "feedback": [
+        "I want to give feedback",
+        "Can I provide some feedback?",
+        "I'd like to share my thoughts",
+        "I have some suggestions for the bot",
+        "Let me tell you what I think of this service",
+        "I want to report how my experience was",
+        "Can I rate this assistant?",
+        "I'd like to leave a review"
+    ],
+    "conversation": [
+        "Hello",
+        "How are you?",
+        "Thanks",
+        "I'm not sure what I need",
+        "Good morning!",
+        "Who are you?",
+        "That's great, thank you",
+        "What can you do?"
+    ]
+}
+
+class IntentClassifier:
+    """
+    Local few-shot intent classifier backed by a SetFit model.
+
+    The model is trained on TRAINING_EXAMPLES with train() and loaded from
+    settings.intent_classifier_path. Predictions take milliseconds on CPU, so
+    confident ones let the master crew skip the master agent's completion.
+    The classifier is disabled when no path is configured or when setfit or
+    the model can't be loaded.
+    """
+
+    _instance = None
+    _instance_lock = threading.Lock()
+
+    @classmethod
+    def get_instance(cls, settings: Settings) -> 'IntentClassifier':
+        """
+        Get the singleton instance of the IntentClassifier.
+
+        Args:
+            settings: Application settings.
+
+        Returns:
+            IntentClassifier: The singleton instance.
+        """
+        if cls._instance is None:
+            with cls._instance_lock:
+                if cls._instance is None:
+                    cls._instance = cls(settings)
+        return cls._instance
+
+    def __init__(self, settings: Settings):
+        """
+        Initialize the IntentClassifier.
+
+        Args:
+            settings: Application settings containing the model path.
+        """
+        self.settings = settings
+        self.model_path = settings.intent_classifier_path
+        self._model: Optional[Any] = None
+        self._labels: List[str] = []
+        if self.model_path:
+            self._load_model()
+
+    def _load_model(self) -> None:
+        """
+        Load the SetFit model.
+        """
+        try:
+            from setfit import SetFitModel
+            self._model = SetFitModel.from_pretrained(self.model_path)
+            self._labels = list(self._model.labels)
+            logger.info("Loaded intent classifier", path=self.model_path, labels=self._labels)
+        except Exception as e:
+            logger.error("Error loading intent classifier", path=self.model_path, error=str(e))
+            self._model = None
+
+    @property
+    def available(self) -> bool:
+        """Whether a model is loaded."""
+        return self._model is not None
+
+    def predict(self, request: str) -> Optional[Tuple[str, float]]:
+        """
+        Classify a request.
+
+        Args:
+            request: The user's request text.
+
+        Returns:
+            Optional[Tuple[str, float]]: The intent and its probability, or None
+                if no model is loaded or prediction failed.
+        """
+        if self._model is None:
+            return None
+
+        try:
+            probabilities = self._model.predict_proba([request], as_numpy=True)[0]
+            best = int(probabilities.argmax())
+            return self._labels[best], float(probabilities[best])
+        except Exception as e:
+            logger.error("Error classifying intent", error=str(e))
+            return None
+
+    @staticmethod
+    def train(output_path: str, base_model: str = "sentence-transformers/paraphrase-MiniLM-L6-v2") -> None:
+        """
+        Train a SetFit model on TRAINING_EXAMPLES and save it.
+
+        Args:
+            output_path: Directory to save the model to.
+            base_model: Sentence-transformers model to fine-tune.
+        """
+        from datasets import Dataset
+        from setfit import SetFitModel, Trainer
+
+        texts = [text for examples in TRAINING_EXAMPLES.values() for text in examples]
+        labels = [intent for intent, examples in TRAINING_EXAMPLES.items() for _ in examples]
+        model = SetFitModel.from_pretrained(base_model, labels=list(TRAINING_EXAMPLES))
+        trainer = Trainer(
+            model=model,
+            train_dataset=Dataset.from_dict({"text": texts, "label": labels})
+        )
+        trainer.train()
+        model.save_pretrained(output_path)
+        logger.info("Saved intent classifier", path=output_path, examples=len(texts))
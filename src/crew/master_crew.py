@@ -1,49 +1,263 @@
-from crewai import Crew, Process, Task
-from typing import Dict, Any, Optional
+from typing import TYPE_CHECKING, Dict, Any, Iterator, Optional
+import functools
 import structlog
-import json
+import re
+import orjson
 from src.config.settings import Settings
 from src.auth.role_manager import RoleManager
 from src.storage.approval_store import ApprovalStore
-from src.tools.document_management_tool import DocumentManagementTool
-from src.agents.master_agent import MasterAgent
-from src.agents.research_agent import ResearchAgent
-from src.agents.weather_agent import WeatherAgent
-from src.agents.rag_query_agent import RAGQueryAgent
-from src.agents.document_management_agent import DocumentManagementAgent
-from src.agents.conversation_agent import ConversationAgent
-from src.agents.feedback_agent import FeedbackAgent
 from src.crew.base_crew import BaseCrew
+from src.batch.batcher import CompletionBatcher
+from src.crew.intent_cache import IntentFingerprintCache, IntentResult, SemanticIntentCache
+from src.crew.intent_classifier import IntentClassifier
+
+if TYPE_CHECKING:
+    # CrewAI and the agents behind it are imported when an agent is first used
+    from crewai import Crew, Task
+    from src.agents.base_agent import BaseAgent
+    from src.rag.embedding.base import EmbeddingModel
+    from src.agents.master_agent import MasterAgent
+    from src.agents.research_agent import ResearchAgent
+    from src.agents.weather_agent import WeatherAgent
+    from src.agents.rag_query_agent import RAGQueryAgent
+    from src.agents.document_management_agent import DocumentManagementAgent
+    from src.agents.conversation_agent import ConversationAgent
+    from src.agents.feedback_agent import FeedbackAgent
 
 logger = structlog.get_logger(__name__)
 
+# Keywords that settle the intent without asking the master agent
+_WEATHER_RE = re.compile(r"\b(weather|temperature|forecast|rain|snow|humidity)\b", re.I)
+_RESEARCH_RE = re.compile(r"\b(research|investigate)\b", re.I)
+# Mentions of the knowledge base, which make any keyword match ambiguous
+_KNOWLEDGE_BASE_RE = re.compile(r"\b(docs?|documents?|knowledge base|handbook|our)\b", re.I)
+
+# Intent names to look for in analysis output that isn't valid JSON
+_INTENT_NAME_RE = re.compile(r"weather|rag_query|doc_management|research|conversation|feedback", re.I)
+
+# Task descriptions for each route; only the request, history and clarification vary
+_CLARIFICATION_DESCRIPTION = (
+    "Ask for clarification\n\nThe user's request is ambiguous or unclear. "
+    "Previous conversation: {history} Original request: {request} "
+    "Please ask this clarification question: {clarification_question}"
+)
+_CLARIFICATION_EXPECTED_OUTPUT = (
+    "A polite response asking for clarification without mentioning that you are an AI or conversational agent"
+)
+_WEATHER_DESCRIPTION = (
+    "Get weather information\n\nThe user wants weather information. "
+    "Previous conversation: {history} Original request: {request}"
+)
+_RAG_QUERY_DESCRIPTION = (
+    "Query the knowledge base\n\nThe user wants to query the knowledge base. "
+    "Previous conversation: {history} Original request: {request}"
+)
+_DOC_MANAGEMENT_DESCRIPTION = (
+    "Manage documents in the knowledge base\n\nThe user wants to manage documents in the knowledge base. "
+    "Previous conversation: {history} Original request: {request}"
+)
+_CONVERSATION_DESCRIPTION = (
+    "Engage in conversation\n\nThe user is engaging in general conversation. "
+    "Previous conversation: {history} Original request: {request}"
+)
+_RESEARCH_DESCRIPTION = (
+    "Research the topic\n\nThe user wants information about a topic. "
+    "Previous conversation: {history} Original request: {request}"
+)
+
+# MasterCrew attributes holding its agent wrappers
+_AGENT_ATTRS = (
+    "master_agent", "research_agent", "weather_agent", "rag_query_agent",
+    "document_management_agent", "conversation_agent", "feedback_agent"
+)
+
+# Task description, expected output and agent attribute for each intent with a plain task
+_ROUTES: Dict[str, tuple[str, str, str]] = {
+    "weather": (
+        _WEATHER_DESCRIPTION,
+        "Weather information for the requested location",
+        "weather_agent"
+    ),
+    "rag_query": (
+        _RAG_QUERY_DESCRIPTION,
+        "Information retrieved from the knowledge base",
+        "rag_query_agent"
+    ),
+    "doc_management": (
+        _DOC_MANAGEMENT_DESCRIPTION,
+        "Confirmation of document management operation",
+        "document_management_agent"
+    ),
+    "conversation": (
+        _CONVERSATION_DESCRIPTION,
+        "A friendly and helpful response that directly addresses the user's query without mentioning that you are an AI or conversational agent",
+        "conversation_agent"
+    ),
+    "research": (
+        _RESEARCH_DESCRIPTION,
+        "Detailed research information about the requested topic",
+        "research_agent"
+    )
+}
+
+_SYNTHESIS_DESCRIPTION = (
+    "Combine the results\n\nThe user's request has several independent parts, each answered by a specialist. "
+    "Previous conversation: {history} Original request: {request}"
+)
+_SYNTHESIS_EXPECTED_OUTPUT = (
+    "A single friendly response that answers every part of the user's request "
+    "without mentioning that you are an AI or conversational agent"
+)
+
+# Intents whose tasks don't depend on each other and may run concurrently
+_PARALLEL_INTENTS = frozenset({"weather", "rag_query", "research"})
+
+def _extract_first_json(text: str) -> Optional[str]:
+    """
+    Find the first complete JSON object in text.
+
+    Args:
+        text: Text that may contain a JSON object among other prose
+
+    Returns:
+        The first balanced {...} object, the text from the first "{" on if that
+        object never closes, or None if there is no "{"
+    """
+    start = text.find("{")
+    if start < 0:
+        return None
+    depth = 0
+    in_string = False
+    escaped = False
+    for index in range(start, len(text)):
+        char = text[index]
+        if in_string:
+            if escaped:
+                escaped = False
+            elif char == "\\":
+                escaped = True
+            elif char == '"':
+                in_string = False
+        elif char == '"':
+            in_string = True
+        elif char == "{":
+            depth += 1
+        elif char == "}":
+            depth -= 1
+            if not depth:
+                return text[start:index + 1]
+    return text[start:]
+
+@functools.lru_cache(maxsize=1024)
+def _format_messages(messages: tuple[tuple[str, str], ...]) -> str:
+    """Format (type, text) message pairs as the conversation context."""
+    parts = ["Previous messages:\n"]
+    for msg_type, text in messages:
+        parts.append(f"- {msg_type}: {text}\n")
+    return "".join(parts)
+
+def _match_local_intent(request: str) -> Optional[str]:
+    """
+    Classify the request by keyword, when exactly one intent's keywords match
+    and the request doesn't refer to the knowledge base.
+
+    Args:
+        request: The user's request text
+
+    Returns:
+        The intent, or None when the request is ambiguous and needs the master agent
+    """
+    if _KNOWLEDGE_BASE_RE.search(request):
+        return None
+    weather = _WEATHER_RE.search(request) is not None
+    research = _RESEARCH_RE.search(request) is not None
+    if weather and not research:
+        return "weather"
+    if research and not weather:
+        return "research"
+    return None
+
 class MasterCrew(BaseCrew):
     """Master crew that routes requests to appropriate specialized crews."""
 
     def __init__(self, settings: Settings, role_manager: Optional[RoleManager] = None, 
-                 approval_store: Optional[ApprovalStore] = None) -> None:
+                 approval_store: Optional[ApprovalStore] = None,
+                 embedding_model: Optional['EmbeddingModel'] = None) -> None:
         super().__init__(settings)
         self.role_manager = role_manager
         self.approval_store = approval_store
-        self.master_agent = MasterAgent(settings)
-        self.research_agent = ResearchAgent(settings)
-        self.weather_agent = WeatherAgent(settings)
-        self.rag_query_agent = RAGQueryAgent(settings)
-        
-        # Initialize document management agent with role manager and approval store
-        self.document_management_agent = self._create_document_management_agent()
-        
-        self.conversation_agent = ConversationAgent(settings)
-        self.feedback_agent = FeedbackAgent(settings)
         self.confidence_threshold = 0.7
+        self.batcher = CompletionBatcher.get_instance(settings)
+        self.fingerprint_cache = IntentFingerprintCache() if settings.intent_cache_enabled else None
+        self.intent_cache = (SemanticIntentCache(settings, model=embedding_model)
+                             if settings.intent_cache_enabled and settings.intent_cache_size > 0 else None)
+        self.conversation_history_threshold = settings.conversation_history_threshold
+        self.intent_classifier = IntentClassifier.get_instance(settings)
         
-    def _create_document_management_agent(self) -> DocumentManagementAgent:
+    # Specialized agents are created on first use, since a request needs only one or two
+    @functools.cached_property
+    def master_agent(self) -> 'MasterAgent':
+        from src.agents.master_agent import MasterAgent
+        return MasterAgent(self.settings)
+
+    @functools.cached_property
+    def research_agent(self) -> 'ResearchAgent':
+        from src.agents.research_agent import ResearchAgent
+        return ResearchAgent(self.settings)
+
+    @functools.cached_property
+    def weather_agent(self) -> 'WeatherAgent':
+        from src.agents.weather_agent import WeatherAgent
+        return WeatherAgent(self.settings)
+
+    @functools.cached_property
+    def rag_query_agent(self) -> 'RAGQueryAgent':
+        from src.agents.rag_query_agent import RAGQueryAgent
+        return RAGQueryAgent(self.settings)
+
+    @functools.cached_property
+    def document_management_agent(self) -> 'DocumentManagementAgent':
+        # Initialize document management agent with role manager and approval store
+        return self._create_document_management_agent()
+
+    @functools.cached_property
+    def conversation_agent(self) -> 'ConversationAgent':
+        from src.agents.conversation_agent import ConversationAgent
+        return ConversationAgent(self.settings)
+
+    @functools.cached_property
+    def feedback_agent(self) -> 'FeedbackAgent':
+        from src.agents.feedback_agent import FeedbackAgent
+        return FeedbackAgent(self.settings)
+
+    def agents(self) -> Iterator['BaseAgent']:
+        """Get the crew's agent wrappers, creating any not used yet."""
+        for name in _AGENT_ATTRS:
+            yield getattr(self, name)
+
+    @classmethod
+    def from_settings(cls, settings: Settings) -> 'MasterCrew':
+        """Build the master crew with its own role manager and approval store."""
+        approval_store = ApprovalStore(
+            host=settings.redis_host,
+            port=settings.redis_port,
+            password=settings.redis_password,
+            db=settings.redis_db,
+            ssl=settings.redis_ssl,
+            ttl=settings.redis_ttl
+        )
+        return cls(settings, role_manager=RoleManager(settings), approval_store=approval_store)
+
+    def _create_document_management_agent(self) -> 'DocumentManagementAgent':
         """
         Create a document management agent with role-based access control.
         
         Returns:
             DocumentManagementAgent: The configured document management agent
         """
+        from src.agents.document_management_agent import DocumentManagementAgent
+        from src.tools.document_management_tool import DocumentManagementTool
+
         agent = DocumentManagementAgent(self.settings)
         
         # If role manager and approval store are available, update the document management tool
@@ -59,41 +273,16 @@ class MasterCrew(BaseCrew):
         
         return agent
 
-    def create_crew(self, inputs: dict[str, str]) -> Crew:
+    def create_crew(self, inputs: dict[str, str]) -> 'Crew':
         """Create a crew with the master agent and appropriate specialized agents."""
+        from crewai import Crew, Process, Task
+
         request = inputs.get("topic", "")  # Using 'topic' for backward compatibility
         conversation_history = inputs.get("conversation_history", [])
+        history = self._format_history(conversation_history)
 
-        # Create the master agent task to analyze intent
-        context_info = [
-            f"User request: {request}",
-            f"Previous conversation context: {self._format_history(conversation_history)}",
-            "Determine which specialized agent should handle this request.",
-            "Consider the full context and the specific capabilities of each agent.",
-            "Return your analysis in JSON format with intent, parameters, confidence, and reasoning."
-        ]
-        
-        master_task = Task(
-            description=f"Analyze this request and determine which agent should handle it: {request}\n\n{' '.join(context_info)}",
-            expected_output="JSON object with intent analysis",
-            agent=self.master_agent.create()
-        )
-
-        # Create the crew with just the master task initially
-        crew = Crew(
-            agents=[self.master_agent.create()],
-            tasks=[master_task],
-            process=Process.sequential,
-            verbose=True
-        )
-
-        # Get the master agent's decision
-        result = crew.kickoff()
-        result_str = str(result)
-        logger.info("Master agent analysis", result=result_str)
-
-        # Parse the result to extract intent, confidence, and clarification question
-        intent, confidence, clarification_question = self._parse_intent_result(result_str)
+        intent, confidence, clarification_question, additional_intents = self._classify_intent(
+            request, conversation_history, history)
         
         # If confidence is below threshold and we have a clarification question, use the conversation agent to ask it
         if confidence < self.confidence_threshold and clarification_question:
@@ -102,118 +291,149 @@ class MasterCrew(BaseCrew):
                        confidence=confidence, 
                        clarification_question=clarification_question)
             
-            clarification_context = [
-                "The user's request is ambiguous or unclear.",
-                f"Previous conversation: {self._format_history(conversation_history)}",
-                f"Original request: {request}",
-                f"Please ask this clarification question: {clarification_question}"
-            ]
-            
             specialized_task = Task(
-                description=f"Ask for clarification\n\n{' '.join(clarification_context)}",
-                expected_output="A polite response asking for clarification without mentioning that you are an AI or conversational agent",
+                description=_CLARIFICATION_DESCRIPTION.format(
+                    history=history, request=request, clarification_question=clarification_question),
+                expected_output=_CLARIFICATION_EXPECTED_OUTPUT,
                 agent=self.conversation_agent.create()
             )
-            specialized_agent = self.conversation_agent
+        elif additional_intents:
+            # Independent parts of the request run concurrently, then the conversation
+            # agent combines their results into one response
+            logger.info("Multiple intents detected", intents=(intent, *additional_intents))
+            parallel_tasks = [self._create_specialized_task(part, request, history, inputs)
+                              for part in (intent, *additional_intents)]
+            for task in parallel_tasks:
+                task.async_execution = True
+            synthesis_task = Task(
+                description=_SYNTHESIS_DESCRIPTION.format(history=history, request=request),
+                expected_output=_SYNTHESIS_EXPECTED_OUTPUT,
+                agent=self.conversation_agent.create(),
+                context=parallel_tasks
+            )
+            tasks = [*parallel_tasks, synthesis_task]
+            return Crew(
+                agents=[task.agent for task in tasks],
+                tasks=tasks,
+                process=Process.sequential,
+                verbose=self.settings.crew_verbose
+            )
         else:
-            # Route to the appropriate specialized agent based on intent
-            if intent == "weather":
-                weather_context = [
-                    "The user wants weather information.",
-                    f"Previous conversation: {self._format_history(conversation_history)}",
-                    f"Original request: {request}"
-                ]
-                
-                specialized_task = Task(
-                    description=f"Get weather information\n\n{' '.join(weather_context)}",
-                    expected_output="Weather information for the requested location",
-                    agent=self.weather_agent.create()
-                )
-                specialized_agent = self.weather_agent
-            elif intent == "rag_query":
-                rag_context = [
-                    "The user wants to query the knowledge base.",
-                    f"Previous conversation: {self._format_history(conversation_history)}",
-                    f"Original request: {request}"
-                ]
-                
-                specialized_task = Task(
-                    description=f"Query the knowledge base\n\n{' '.join(rag_context)}",
-                    expected_output="Information retrieved from the knowledge base",
-                    agent=self.rag_query_agent.create()
-                )
-                specialized_agent = self.rag_query_agent
-            elif intent == "doc_management":
-                doc_context = [
-                    "The user wants to manage documents in the knowledge base.",
-                    f"Previous conversation: {self._format_history(conversation_history)}",
-                    f"Original request: {request}"
-                ]
-                
-                specialized_task = Task(
-                    description=f"Manage documents in the knowledge base\n\n{' '.join(doc_context)}",
-                    expected_output="Confirmation of document management operation",
-                    agent=self.document_management_agent.create()
-                )
-                specialized_agent = self.document_management_agent
-            elif intent == "feedback":
-                # Extract user_id and channel_id from inputs if available
-                user_id = inputs.get("user_id", "unknown_user")
-                channel_id = inputs.get("channel_id", "unknown_channel")
-                
-                feedback_context = [
-                    "The user wants to provide feedback.",
-                    f"User ID: {user_id}",
-                    f"Channel ID: {channel_id}",
-                    f"Previous conversation: {self._format_history(conversation_history)}",
-                    f"Original request: {request}"
-                ]
-                
-                from src.tasks.feedback_task import create_feedback_task
-                specialized_task = create_feedback_task(
-                    agent=self.feedback_agent,
-                    user_id=user_id,
-                    channel_id=channel_id,
-                    initial_message=request
-                )
-                specialized_agent = self.feedback_agent
-                
-            elif intent == "conversation":
-                conversation_context = [
-                    "The user is engaging in general conversation.",
-                    f"Previous conversation: {self._format_history(conversation_history)}",
-                    f"Original request: {request}"
-                ]
-                
-                specialized_task = Task(
-                    description=f"Engage in conversation\n\n{' '.join(conversation_context)}",
-                    expected_output="A friendly and helpful response that directly addresses the user's query without mentioning that you are an AI or conversational agent",
-                    agent=self.conversation_agent.create()
-                )
-                specialized_agent = self.conversation_agent
-            else:  # Default to research for any other intent
-                research_context = [
-                    "The user wants information about a topic.",
-                    f"Previous conversation: {self._format_history(conversation_history)}",
-                    f"Original request: {request}"
-                ]
-                
-                specialized_task = Task(
-                    description=f"Research the topic\n\n{' '.join(research_context)}",
-                    expected_output="Detailed research information about the requested topic",
-                    agent=self.research_agent.create()
-                )
-                specialized_agent = self.research_agent
-
-        # Create final crew with the specialized task
+            specialized_task = self._create_specialized_task(intent, request, history, inputs)
+
+        # Create final crew with the specialized task, reusing the agent the task was built with
         return Crew(
-            agents=[specialized_agent.create()],
+            agents=[specialized_task.agent],
             tasks=[specialized_task],
             process=Process.sequential,
-            verbose=True
+            verbose=self.settings.crew_verbose
         )
 
-    def _parse_intent_result(self, result_str: str) -> tuple[str, float, Optional[str]]:
+    def _create_specialized_task(self, intent: str, request: str, history: str,
+                                 inputs: dict[str, str]) -> 'Task':
+        """
+        Create the task for the specialized agent that handles an intent.
+
+        Args:
+            intent: The detected intent
+            request: The user's request text
+            history: The formatted conversation history
+            inputs: The crew inputs, for the user and channel IDs
+
+        Returns:
+            The task, with the specialized agent assigned
+        """
+        from crewai import Task
+
+        if intent == "feedback":
+            # Extract user_id and channel_id from inputs if available
+            user_id = inputs.get("user_id", "unknown_user")
+            channel_id = inputs.get("channel_id", "unknown_channel")
+            
+            from src.tasks.feedback_task import create_feedback_task
+            return create_feedback_task(
+                agent=self.feedback_agent,
+                user_id=user_id,
+                channel_id=channel_id,
+                initial_message=request
+            )
+
+        # Route to the appropriate specialized agent based on intent, defaulting to research
+        description, expected_output, agent_attr = _ROUTES.get(intent, _ROUTES["research"])
+        return Task(
+            description=description.format(history=history, request=request),
+            expected_output=expected_output,
+            agent=getattr(self, agent_attr).create()
+        )
+
+    def _classify_intent(self, request: str, conversation_history: list, history: str) -> IntentResult:
+        """
+        Determine the intent of a request, asking the master agent only when needed.
+
+        Args:
+            request: The user's request text
+            conversation_history: The conversation's messages
+            history: The formatted conversation history
+
+        Returns:
+            A tuple of (intent, confidence, clarification_question, additional_intents)
+        """
+        # Unambiguous weather and research requests skip the master agent entirely
+        intent = _match_local_intent(request)
+        if intent is not None:
+            logger.info("Local intent match", intent=intent)
+            return intent, 1.0, None, ()
+
+        # Exact repeats of a request in the same context reuse its intent
+        fingerprint = None
+        if self.fingerprint_cache is not None:
+            fingerprint = self.fingerprint_cache.fingerprint(request, history)
+            cached = self.fingerprint_cache.get(fingerprint)
+            if cached is not None:
+                logger.info("Intent fingerprint hit", intent=cached[0])
+                return cached
+
+        # A confident local classifier prediction needs no completion
+        prediction = self.intent_classifier.predict(request)
+        if prediction is not None and prediction[1] >= self.confidence_threshold:
+            logger.info("Intent classifier match", intent=prediction[0], confidence=prediction[1])
+            return prediction[0], prediction[1], None, ()
+
+        # Paraphrases of recent requests in the same context reuse their intent
+        vector = None
+        if self.intent_cache is not None and len(conversation_history) > self.conversation_history_threshold:
+            logger.debug("Intent cache skipped for long history",
+                         history_length=len(conversation_history))
+        elif self.intent_cache is not None:
+            vector = self.intent_cache.embed(f"{history}\n{request.strip().lower()}")
+            if vector is not None:
+                cached = self.intent_cache.lookup(vector)
+                if cached is not None:
+                    logger.info("Intent cache hit", intent=cached[0])
+                    if fingerprint is not None:
+                        self.fingerprint_cache.put(fingerprint, cached)
+                    return cached
+
+        # Analyze the intent with a single completion. Requests from concurrent users are
+        # batched together and share the master agent's system prompt.
+        result_str = self.batcher.complete([
+            {"role": "system", "content": self._system_prompt(self.master_agent.create())},
+            {"role": "user", "content": self.master_agent.intent_analyzer._run(
+                request, history)}
+        ])
+        logger.info("Master agent analysis", result=result_str)
+
+        # Parse the result to extract intent, confidence, and clarification question
+        result = self._parse_intent_result(result_str)
+        # Only confident answers are reused; ambiguous requests get analyzed each time
+        if result[1] >= self.confidence_threshold:
+            if fingerprint is not None:
+                self.fingerprint_cache.put(fingerprint, result)
+            if vector is not None:
+                self.intent_cache.add(vector, result)
+        return result
+
+    def _parse_intent_result(self, result_str: str) -> IntentResult:
         """
         Parse the intent analysis result to extract intent, confidence, and clarification question.
         
@@ -221,57 +441,57 @@ class MasterCrew(BaseCrew):
             result_str: The string representation of the intent analysis result
             
         Returns:
-            A tuple of (intent, confidence, clarification_question)
+            A tuple of (intent, confidence, clarification_question, additional_intents).
+            additional_intents holds the other independent intents of a multi-part
+            request, and is empty otherwise.
         """
         # Default values
         intent = "conversation"  # Default to conversation if parsing fails
         confidence = 0.0
         clarification_question = None
+        additional_intents: tuple[str, ...] = ()
         
         try:
-            # Try to extract JSON from the result string
-            # First, find the start of the JSON object
-            json_start = result_str.find("{")
-            if json_start >= 0:
-                # Extract the JSON part of the string
-                json_str = result_str[json_start:]
+            # Try to extract JSON from the result string, ignoring any prose around it
+            json_str = _extract_first_json(result_str)
+            if json_str is not None:
                 # Parse the JSON
-                result_json = json.loads(json_str)
+                result_json = orjson.loads(json_str)
                 
                 # Extract the values
                 intent = result_json.get("intent", "conversation").lower()
                 confidence = float(result_json.get("confidence", 0.0))
                 clarification_question = result_json.get("clarification_question")
+                if intent in _PARALLEL_INTENTS:
+                    # Only parts that can run alongside the main intent are kept
+                    additional_intents = tuple(dict.fromkeys(
+                        part.lower() for part in result_json.get("intents") or ()
+                        if isinstance(part, str) and part.lower() in _PARALLEL_INTENTS
+                        and part.lower() != intent
+                    ))
                 
                 logger.debug("Parsed intent result", 
                            intent=intent, 
                            confidence=confidence, 
-                           clarification_question=clarification_question)
-        except (json.JSONDecodeError, ValueError) as e:
+                           clarification_question=clarification_question,
+                           additional_intents=additional_intents)
+        except (orjson.JSONDecodeError, ValueError) as e:
             logger.error("Failed to parse intent result", error=str(e), result=result_str)
-            # If we can't parse the JSON, use simple string matching as fallback
-            intent_mapping = {
-                "weather": "weather",
-                "rag_query": "rag_query",
-                "doc_management": "doc_management",
-                "research": "research",
-                "conversation": "conversation",
-                "feedback": "feedback"
-            }
-            
-            for key, value in intent_mapping.items():
-                if key in result_str.lower():
-                    intent = value
-                    break
+            # If we can't parse the JSON, use the first intent name mentioned as fallback
+            match = _INTENT_NAME_RE.search(result_str)
+            if match:
+                intent = match.group(0).lower()
         
-        return intent, confidence, clarification_question
+        return intent, confidence, clarification_question, additional_intents
 
     def _format_history(self, history: list) -> str:
         """Format conversation history for context."""
         if not history:
             return "No previous conversation context."
         
-        formatted = "Previous messages:\n"
-        for msg in history[-3:]:  # Last 3 messages
-            formatted += f"- {msg['type']}: {msg['text']}\n"
-        return formatted
+        count = len(history)
+        # Consecutive turns of a thread share their recent messages, so the text is cached
+        return _format_messages(tuple(
+            (history[index]['type'], history[index]['text'])
+            for index in range(max(0, count - 3), count)  # Last 3 messages
+        ))
@@ -1,10 +1,18 @@
+import asyncio
+import hashlib
+from typing import AsyncIterator, Optional
 from crewai import Crew, Process
+from openai import AsyncOpenAI
 from src.config.settings import Settings
 from src.agents.research_agent import ResearchAgent
 from src.agents.writing_agent import WritingAgent
 from src.tasks.research_task import create_research_task
 from src.tasks.writing_task import create_writing_task
 from src.crew.base_crew import BaseCrew
+from src.llm.clients import LLMClients
+
+# Minimum amount of new research text (~100 tokens) before the writer takes another step
+STAIRCASE_STEP_CHARS = 400
 
 class ResearchWritingCrew(BaseCrew):
     """Crew for research and writing tasks."""
@@ -13,6 +21,7 @@ class ResearchWritingCrew(BaseCrew):
         super().__init__(settings)
         self.research_agent = ResearchAgent(settings)
         self.writing_agent = WritingAgent(settings)
+        self.clients = LLMClients.get_instance(settings)
 
     def create_crew(self, inputs: dict[str, str]) -> Crew:
         topic = inputs.get("topic", "")
@@ -22,5 +31,158 @@ class ResearchWritingCrew(BaseCrew):
             agents=[self.research_agent.create(), self.writing_agent.create()],
             tasks=[research_task, writing_task],
             process=Process.sequential,
-            verbose=True
-        )
\ No newline at end of file
+            verbose=self.settings.crew_verbose
+        )
+
+    def coalescing_key(self, inputs: dict[str, str]) -> Optional[str]:
+        """The article depends only on the topic, so identical topics share one run."""
+        topic = " ".join(inputs.get("topic", "").lower().split())
+        return hashlib.blake2b(topic.encode(), digest_size=16).hexdigest()
+
+    def run(self, inputs: dict[str, str]) -> str:
+        """
+        Research the topic and write the article as a staircase pipeline.
+
+        Instead of running the research and writing tasks back to back, the
+        research is streamed and the writer starts on the first paragraphs
+        while the rest of the research is still being generated.
+        """
+        try:
+            result = self.clients.submit(self._collect(inputs.get("topic", ""))).result()
+            self.logger.info("Crew executed successfully", inputs=inputs)
+            return result
+        except Exception as e:
+            self.logger.error("Error running crew", error=str(e), exc_info=True)
+            raise
+
+    async def stream(self, inputs: dict[str, str]) -> AsyncIterator[str]:
+        """
+        Yield the article in chunks as the writer produces it.
+
+        The pipeline runs on the shared LLM event loop and hands each chunk
+        over to the caller's event loop as it arrives.
+        """
+        loop = asyncio.get_running_loop()
+        chunks: asyncio.Queue[tuple[Optional[str], Optional[BaseException]]] = asyncio.Queue()
+
+        def put(item: tuple[Optional[str], Optional[BaseException]]) -> None:
+            if not loop.is_closed():
+                loop.call_soon_threadsafe(chunks.put_nowait, item)
+
+        async def pump() -> None:
+            try:
+                async for delta in self.stream_article(inputs.get("topic", "")):
+                    put((delta, None))
+                put((None, None))
+            except BaseException as e:
+                put((None, e))
+                raise
+
+        pipeline = self.clients.submit(pump())
+        try:
+            while True:
+                delta, error = await chunks.get()
+                if error is not None:
+                    self.logger.error("Error running crew", error=str(error), exc_info=error)
+                    raise error
+                if delta is None:
+                    break
+                yield delta
+            self.logger.info("Crew executed successfully", inputs=inputs)
+        finally:
+            # Stop generating if the caller gave up on the stream
+            pipeline.cancel()
+
+    async def _collect(self, topic: str) -> str:
+        return "".join([delta async for delta in self.stream_article(topic)])
+
+    async def stream_article(self, topic: str) -> AsyncIterator[str]:
+        """
+        Stream the article for a topic as it is written.
+
+        Must run on the shared LLM event loop.
+
+        Args:
+            topic: The topic to research and write about.
+
+        Yields:
+            Chunks of article text in order.
+        """
+        client = self.clients.openai
+        # Each item is (research so far, research complete); None signals a failed research stream
+        queue: asyncio.Queue[Optional[tuple[str, bool]]] = asyncio.Queue()
+        research = asyncio.create_task(self._stream_research(client, topic, queue))
+        try:
+            article = ""
+            done = False
+            while not done:
+                item = await queue.get()
+                # Skip to the newest research snapshot if the writer fell behind
+                while item is not None and not item[1] and not queue.empty():
+                    item = queue.get_nowait()
+                if item is None:
+                    break
+                notes, done = item
+                step_start = len(article)
+                async for delta in self._stream_writing_step(client, notes, article, done):
+                    # Keep a paragraph break between steps
+                    if len(article) == step_start and article and not article[-1].isspace() \
+                            and not delta[0].isspace():
+                        delta = "\n\n" + delta
+                    article += delta
+                    yield delta
+            await research
+        finally:
+            research.cancel()
+
+    async def _stream_research(self, client: AsyncOpenAI, topic: str,
+                               queue: "asyncio.Queue[Optional[tuple[str, bool]]]") -> None:
+        """Stream the research and publish it to the writer at paragraph boundaries."""
+        try:
+            stream = await client.chat.completions.create(
+                model=self.settings.openai_model,
+                messages=[
+                    {"role": "system", "content": self._system_prompt(self.research_agent.create())},
+                    {"role": "user", "content": self.research_agent.research_tool._run(topic)}
+                ],
+                stream=True
+            )
+            research = ""
+            published = 0
+            async for chunk in stream:
+                if not chunk.choices:
+                    continue
+                research += chunk.choices[0].delta.content or ""
+                if len(research) - published >= STAIRCASE_STEP_CHARS:
+                    boundary = research.rfind("\n\n", published)
+                    if boundary > published:
+                        published = boundary
+                        queue.put_nowait((research[:boundary], False))
+            queue.put_nowait((research, True))
+        except BaseException:
+            queue.put_nowait(None)
+            raise
+
+    async def _stream_writing_step(self, client: AsyncOpenAI, notes: str,
+                                   article: str, final: bool) -> AsyncIterator[str]:
+        """Stream one writer step covering the research that arrived since the last one."""
+        status = "The research is complete." if final else "The research is still in progress."
+        action = "Finish the article" if final else "Continue the article using only the notes above"
+        stream = await client.chat.completions.create(
+            model=self.settings.openai_model,
+            # The system prompt and the append-only notes lead the prompt so successive
+            # steps share a prefix with the previous call and hit the provider's prompt cache
+            messages=[
+                {"role": "system", "content": self._system_prompt(self.writing_agent.create())},
+                {"role": "user", "content": (
+                    f"Research notes:\n{notes}\n\n{status}\n\n"
+                    f"Article written so far:\n{article or '(nothing yet)'}\n\n"
+                    f"{action}, picking up exactly where it stops. "
+                    "Do not repeat text that is already written. Reply with the new text only."
+                )}
+            ],
+            stream=True
+        )
+        async for chunk in stream:
+            if chunk.choices and chunk.choices[0].delta.content:
+                yield chunk.choices[0].delta.content
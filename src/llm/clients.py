@@ -0,0 +1,119 @@
+import asyncio
+import threading
+from concurrent.futures import Future
+from typing import TYPE_CHECKING, Any, Coroutine, Optional
+import httpx
+import structlog
+from src.config.settings import Settings
+
+if TYPE_CHECKING:
+    # The SDKs are imported when the clients are first created
+    from openai import AsyncOpenAI
+
+logger = structlog.get_logger(__name__)
+
+# Connection pool limits shared by every LLM call in the process
+HTTP_LIMITS = httpx.Limits(max_keepalive_connections=64, max_connections=128)
+
+class LLMClients:
+    """
+    Process-wide HTTP clients for talking to the LLM provider.
+
+    CrewAI agents call the model through litellm, which is pointed at one
+    pooled httpx client so all agents reuse the same keep-alive connections
+    instead of each opening its own. Code that calls the OpenAI API directly
+    uses a single AsyncOpenAI client that lives on a dedicated background
+    event loop, since async connection pools can't be shared across loops.
+    """
+
+    _instance = None
+    _instance_lock = threading.Lock()
+
+    @classmethod
+    def get_instance(cls, settings: Settings) -> 'LLMClients':
+        """
+        Get the singleton instance of LLMClients.
+
+        Args:
+            settings: Application settings.
+
+        Returns:
+            LLMClients: The singleton instance.
+        """
+        if cls._instance is None:
+            with cls._instance_lock:
+                if cls._instance is None:
+                    cls._instance = cls(settings)
+        return cls._instance
+
+    def __init__(self, settings: Settings):
+        """
+        Initialize LLMClients and install the shared session for litellm.
+
+        Args:
+            settings: Application settings.
+        """
+        import litellm
+
+        self.settings = settings
+        self.http_client = httpx.Client(limits=HTTP_LIMITS)
+        litellm.client_session = self.http_client
+        self._openai: Optional['AsyncOpenAI'] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._lock = threading.Lock()
+
+    @property
+    def openai(self) -> 'AsyncOpenAI':
+        """The shared AsyncOpenAI client. Only use it from coroutines passed to submit()."""
+        if self._openai is None:
+            with self._lock:
+                if self._openai is None:
+                    from openai import AsyncOpenAI
+                    self._openai = AsyncOpenAI(
+                        api_key=self.settings.openai_api_key,
+                        base_url=self.settings.openai_api_base,
+                        http_client=httpx.AsyncClient(limits=HTTP_LIMITS)
+                    )
+        return self._openai
+
+    @property
+    def loop(self) -> asyncio.AbstractEventLoop:
+        """The background event loop, started on first use."""
+        if self._loop is None:
+            with self._lock:
+                if self._loop is None:
+                    loop = asyncio.new_event_loop()
+                    threading.Thread(target=loop.run_forever, name="llm-event-loop", daemon=True).start()
+                    self._loop = loop
+                    logger.info("Started LLM event loop")
+        return self._loop
+
+    def submit(self, coro: Coroutine[Any, Any, Any]) -> Future:
+        """
+        Run a coroutine on the background event loop.
+
+        Args:
+            coro: The coroutine to run.
+
+        Returns:
+            Future: Resolves to the coroutine's result.
+        """
+        return asyncio.run_coroutine_threadsafe(coro, self.loop)
+
+    async def warm_up(self) -> None:
+        """
+        Open the pooled connections ahead of the first request.
+
+        Resolves DNS and completes the TLS handshakes for both pools, and
+        sends a one-token completion so the provider is ready for the model.
+        Must run on the background event loop.
+        """
+        headers = {"Authorization": f"Bearer {self.settings.openai_api_key}"}
+        await asyncio.gather(
+            self.openai.chat.completions.create(
+                model=self.settings.openai_model,
+                messages=[{"role": "user", "content": "ping"}],
+                max_tokens=1
+            ),
+            asyncio.to_thread(self.http_client.get, f"{self.openai.base_url}models", headers=headers)
+        )
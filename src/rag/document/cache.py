@@ -1,21 +1,76 @@
 import structlog
 import os
-import json
 import hashlib
+import mmap
+import sqlite3
+import threading
+import msgspec
+import orjson
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor
 from typing import Dict, List, Any, Optional, Union
 from datetime import datetime
 import time
 
 logger = structlog.get_logger(__name__)
 
+_encoder = msgspec.msgpack.Encoder()
+_decoder = msgspec.msgpack.Decoder()
+
+# Documents kept in memory in front of the cache directory
+MEMORY_CACHE_SIZE = 1024
+
+# SQLite index of the cache files, kept in the cache directory
+INDEX_FILENAME = "index.db"
+
+# Threads writing cache files in the background for store_async()
+CACHE_WRITER_THREADS = 4
+
+# Bits in the Bloom filter of cache file names; about a 2% false positive rate at 100k files
+BLOOM_BITS = 1 << 20
+
 class DocumentCache:
     """
     Cache for processed documents.
     
     This class provides methods for caching processed documents to avoid reprocessing.
-    It stores documents in a local directory with a configurable TTL.
+    It stores documents in a local directory with a configurable TTL, and keeps
+    the most recently used ones in memory so hot documents skip the disk read.
+    A memory hit is only served while its cache file is unchanged, so a document
+    invalidated or stored again by another process, such as a crew worker, isn't
+    served stale from memory.
+    A small SQLite index records the size of each cache file, so statistics
+    don't need to stat every file, and a Bloom filter of the file names lets
+    lookups of documents this instance has never seen cached skip the filesystem.
+    Names the filter doesn't know are checked against the shared index, so files
+    cached by other processes are still found.
     """
     
+    _instances: Dict[str, 'DocumentCache'] = {}
+    _instances_lock = threading.Lock()
+    
+    @classmethod
+    def get_instance(cls, cache_dir: str = "./document_cache", ttl: int = 86400) -> 'DocumentCache':
+        """
+        Get the shared DocumentCache for a cache directory.
+        
+        Components that use the same directory must share one instance, so a
+        document invalidated through one isn't still served from another's memory.
+        
+        Args:
+            cache_dir: Directory to store cached documents.
+            ttl: Time-to-live for cached documents in seconds, used when the instance is created.
+        
+        Returns:
+            DocumentCache: The instance for the directory.
+        """
+        key = os.path.abspath(cache_dir)
+        with cls._instances_lock:
+            instance = cls._instances.get(key)
+            if instance is None:
+                instance = cls._instances[key] = cls(cache_dir, ttl)
+            return instance
+    
     def __init__(self, cache_dir: str = "./document_cache", ttl: int = 86400):
         """
         Initialize the DocumentCache.
@@ -26,12 +81,93 @@ class DocumentCache:
         """
         self.cache_dir = cache_dir
         self.ttl = ttl
+        self._memory_capacity = MEMORY_CACHE_SIZE
+        self._lock = threading.Lock()
+        # doc_id -> (cached time, document, cache file path), least recently used first
+        self._memory: OrderedDict[str, tuple[float, Dict[str, Any], str]] = OrderedDict()
+        self._writer = ThreadPoolExecutor(max_workers=CACHE_WRITER_THREADS, thread_name_prefix="document-cache")
         
         # Create cache directory if it doesn't exist
         if not os.path.exists(cache_dir):
             os.makedirs(cache_dir, exist_ok=True)
         
-        logger.info(f"Initialized DocumentCache with cache_dir={cache_dir}, ttl={ttl}")
+        self._index = sqlite3.connect(os.path.join(cache_dir, INDEX_FILENAME), check_same_thread=False)
+        self._init_index()
+        
+        # Filled from the index and by this instance's stores. Files cached by other
+        # processes are missing from it until _may_exist() finds them in the index.
+        self._bloom = bytearray(BLOOM_BITS // 8)
+        names = [name for (name,) in self._index.execute("SELECT name FROM entries")]
+        for name in names:
+            self._bloom_add(name)
+        # Lookups only need to try JSON files from older versions if there are any
+        self._has_legacy_files = any(name.endswith(".json") for name in names)
+        
+        logger.info("Initialized DocumentCache", cache_dir=cache_dir, ttl=ttl)
+    
+    def _init_index(self) -> None:
+        """
+        Create the index of cache files, filling it from the cache directory if it is new.
+        """
+        with self._lock, self._index:
+            self._index.execute(
+                "CREATE TABLE IF NOT EXISTS entries (name TEXT PRIMARY KEY, size INTEGER, mtime REAL)")
+            if self._index.execute("SELECT COUNT(*) FROM entries").fetchone()[0]:
+                return
+            
+            # Cache files from before the index existed
+            entries = []
+            for filename in os.listdir(self.cache_dir):
+                file_path = os.path.join(self.cache_dir, filename)
+                if (not filename.startswith(INDEX_FILENAME) and not filename.endswith(".tmp")
+                        and os.path.isfile(file_path)):
+                    stat = os.stat(file_path)
+                    entries.append((filename, stat.st_size, stat.st_mtime))
+            self._index.executemany("INSERT OR REPLACE INTO entries VALUES (?, ?, ?)", entries)
+    
+    @staticmethod
+    def _bloom_positions(name: str) -> tuple[int, ...]:
+        """
+        Get the Bloom filter bits for a cache file name.
+        
+        Args:
+            name: File name of the cache file.
+        
+        Returns:
+            tuple[int, ...]: The three bit positions.
+        """
+        digest = hashlib.blake2b(name.encode(), digest_size=12).digest()
+        return tuple(int.from_bytes(digest[i:i + 4], "little") % BLOOM_BITS for i in (0, 4, 8))
+    
+    def _bloom_add(self, name: str) -> None:
+        """Record a cache file name in the Bloom filter."""
+        for position in self._bloom_positions(name):
+            self._bloom[position >> 3] |= 1 << (position & 7)
+    
+    def _may_exist(self, cache_path: str) -> bool:
+        """
+        Check whether a cache file may exist, without touching the filesystem.
+        
+        Names missing from the Bloom filter are looked up in the index, which
+        every process using the cache directory writes to, and added to the
+        filter when found.
+        
+        Args:
+            cache_path: Path of the cache file.
+        
+        Returns:
+            bool: False if the file was never written, True if it may have been.
+        """
+        name = os.path.basename(cache_path)
+        if all(self._bloom[position >> 3] & (1 << (position & 7))
+               for position in self._bloom_positions(name)):
+            return True
+        
+        with self._lock:
+            if self._index.execute("SELECT 1 FROM entries WHERE name = ?", (name,)).fetchone() is None:
+                return False
+            self._bloom_add(name)
+        return True
     
     def _get_cache_path(self, doc_id: str) -> str:
         """
@@ -44,9 +180,54 @@ class DocumentCache:
             str: File path for the cached document.
         """
         # Hash the doc_id to create a safe filename
+        hashed_id = hashlib.blake2b(doc_id.encode(), digest_size=16).hexdigest()
+        return os.path.join(self.cache_dir, f"{hashed_id}.msgpack")
+    
+    def _get_legacy_cache_path(self, doc_id: str) -> str:
+        """
+        Get the file path a document was cached at before the cache used msgpack.
+        
+        Args:
+            doc_id: ID of the document.
+        
+        Returns:
+            str: File path for the JSON cache file.
+        """
         hashed_id = hashlib.md5(doc_id.encode()).hexdigest()
         return os.path.join(self.cache_dir, f"{hashed_id}.json")
     
+    def _remember(self, doc_id: str, cached_time: float, document: Dict[str, Any], cache_path: str) -> None:
+        """
+        Keep a document in the in-memory cache.
+        
+        Args:
+            doc_id: ID of the document.
+            cached_time: When the document was written to the cache.
+            document: The document, without cache metadata.
+            cache_path: Path of the document's cache file.
+        """
+        with self._lock:
+            self._memory[doc_id] = (cached_time, document, cache_path)
+            self._memory.move_to_end(doc_id)
+            if len(self._memory) > self._memory_capacity:
+                self._memory.popitem(last=False)
+    
+    @staticmethod
+    def _decode(data: Union[bytes, mmap.mmap]) -> Dict[str, Any]:
+        """
+        Decode a cache file, accepting JSON files written by older versions.
+        
+        Args:
+            data: Contents of the cache file, as bytes or a memory map.
+        
+        Returns:
+            Dict[str, Any]: The cached document.
+        """
+        # A msgpack map never starts with "{", a JSON object always does
+        if data[:1] == b"{":
+            return orjson.loads(memoryview(data))
+        return _decoder.decode(data)
+    
     def get(self, doc_id: str) -> Optional[Dict[str, Any]]:
         """
         Get a document from the cache.
@@ -57,31 +238,59 @@ class DocumentCache:
         Returns:
             Optional[Dict[str, Any]]: The document if found and not expired, None otherwise.
         """
+        with self._lock:
+            entry = self._memory.get(doc_id)
+            if entry is not None:
+                if time.time() - entry[0] <= self.ttl:
+                    self._memory.move_to_end(doc_id)
+                else:
+                    del self._memory[doc_id]
+                    entry = None
+        
+        if entry is not None:
+            # Another process may have invalidated the document, removing its file,
+            # or stored it again, replacing the file
+            try:
+                current = os.stat(entry[2]).st_mtime == entry[0]
+            except OSError:
+                current = False
+            if current:
+                # Callers get their own dict, as they would from a disk read
+                return entry[1].copy()
+            with self._lock:
+                if self._memory.get(doc_id) is entry:
+                    del self._memory[doc_id]
+        
         cache_path = self._get_cache_path(doc_id)
         
-        # Check if cache file exists
-        if not os.path.exists(cache_path):
-            return None
+        # Check if cache file exists, falling back to one from before the switch to msgpack.
+        # The Bloom filter and index rule out most documents that were never cached without a stat.
+        if not (self._may_exist(cache_path) and os.path.exists(cache_path)):
+            cache_path = self._get_legacy_cache_path(doc_id)
+            if not (self._has_legacy_files and self._may_exist(cache_path) and os.path.exists(cache_path)):
+                return None
         
         try:
             # Read cache file
-            with open(cache_path, 'r') as f:
-                cached_doc = json.load(f)
-            
-            # Check if cache is expired
-            cached_time = cached_doc.get('_cached_time', 0)
-            if time.time() - cached_time > self.ttl:
-                logger.debug(f"Cache expired for document {doc_id}")
-                return None
+            # msgpack is decoded straight from the page cache, without copying the file
+            with open(cache_path, 'rb') as f, \
+                    mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as data:
+                # Check if cache is expired; the file's mtime is when it was cached
+                cached_time = os.fstat(f.fileno()).st_mtime
+                if time.time() - cached_time > self.ttl:
+                    logger.debug("Cache expired for document", doc_id=doc_id)
+                    return None
+                
+                cached_doc = self._decode(data)
             
-            # Remove cache metadata
-            if '_cached_time' in cached_doc:
-                del cached_doc['_cached_time']
+            # Remove cache metadata written by older versions
+            cached_doc.pop('_cached_time', None)
             
-            logger.debug(f"Cache hit for document {doc_id}")
+            self._remember(doc_id, cached_time, cached_doc.copy(), cache_path)
+            logger.debug("Cache hit for document", doc_id=doc_id)
             return cached_doc
         except Exception as e:
-            logger.error(f"Error reading cache for document {doc_id}", error=str(e))
+            logger.error("Error reading cache for document", doc_id=doc_id, error=str(e))
             return None
     
     def store(self, doc_id: str, document: Dict[str, Any]) -> bool:
@@ -98,20 +307,42 @@ class DocumentCache:
         cache_path = self._get_cache_path(doc_id)
         
         try:
-            # Add cache metadata
-            cached_doc = document.copy()
-            cached_doc['_cached_time'] = time.time()
+            # Write cache file. Writing to a temporary file and renaming it over the
+            # cache file means a crash never leaves a partly written entry.
+            data = _encoder.encode(document)
+            temp_path = f"{cache_path}.{os.getpid()}.{threading.get_ident()}.tmp"
+            with open(temp_path, 'wb') as f:
+                f.write(data)
+            # The file's mtime is when it was cached, and identifies this version of it
+            cached_time = os.stat(temp_path).st_mtime
+            os.replace(temp_path, cache_path)
             
-            # Write cache file
-            with open(cache_path, 'w') as f:
-                json.dump(cached_doc, f)
-            
-            logger.debug(f"Cached document {doc_id}")
+            with self._lock, self._index:
+                self._index.execute("INSERT OR REPLACE INTO entries VALUES (?, ?, ?)",
+                                    (os.path.basename(cache_path), len(data), cached_time))
+                self._bloom_add(os.path.basename(cache_path))
+            self._remember(doc_id, cached_time, document.copy(), cache_path)
+            logger.debug("Cached document", doc_id=doc_id)
             return True
         except Exception as e:
-            logger.error(f"Error caching document {doc_id}", error=str(e))
+            logger.error("Error caching document", doc_id=doc_id, error=str(e))
             return False
     
+    def store_async(self, doc_id: str, document: Dict[str, Any]) -> Future:
+        """
+        Store a document in the cache on a background thread.
+        
+        The document must not be modified until the returned future resolves.
+        
+        Args:
+            doc_id: ID of the document to store.
+            document: Document to store.
+        
+        Returns:
+            Future: Resolves to the result of store().
+        """
+        return self._writer.submit(self.store, doc_id, document)
+    
     def invalidate(self, doc_id: str) -> bool:
         """
         Invalidate a cached document.
@@ -122,19 +353,22 @@ class DocumentCache:
         Returns:
             bool: True if document was invalidated successfully, False otherwise.
         """
-        cache_path = self._get_cache_path(doc_id)
-        
-        # Check if cache file exists
-        if not os.path.exists(cache_path):
-            return True
+        with self._lock:
+            self._memory.pop(doc_id, None)
         
         try:
-            # Delete cache file
-            os.remove(cache_path)
-            logger.debug(f"Invalidated cache for document {doc_id}")
+            # Delete the cache file and any older JSON one
+            cache_paths = (self._get_cache_path(doc_id), self._get_legacy_cache_path(doc_id))
+            for cache_path in cache_paths:
+                if os.path.exists(cache_path):
+                    os.remove(cache_path)
+            with self._lock, self._index:
+                self._index.executemany("DELETE FROM entries WHERE name = ?",
+                                        [(os.path.basename(cache_path),) for cache_path in cache_paths])
+            logger.debug("Invalidated cache for document", doc_id=doc_id)
             return True
         except Exception as e:
-            logger.error(f"Error invalidating cache for document {doc_id}", error=str(e))
+            logger.error("Error invalidating cache for document", doc_id=doc_id, error=str(e))
             return False
     
     def clear(self) -> bool:
@@ -144,12 +378,17 @@ class DocumentCache:
         Returns:
             bool: True if cache was cleared successfully, False otherwise.
         """
+        with self._lock:
+            self._memory.clear()
+        
         try:
-            # Delete all files in cache directory
+            # Delete all files in cache directory except the index
             for filename in os.listdir(self.cache_dir):
                 file_path = os.path.join(self.cache_dir, filename)
-                if os.path.isfile(file_path):
+                if not filename.startswith(INDEX_FILENAME) and os.path.isfile(file_path):
                     os.remove(file_path)
+            with self._lock, self._index:
+                self._index.execute("DELETE FROM entries")
             
             logger.info("Cleared document cache")
             return True
@@ -165,15 +404,10 @@ class DocumentCache:
             Dict[str, Any]: Dictionary of statistics.
         """
         try:
-            # Count files in cache directory
-            file_count = 0
-            total_size = 0
-            
-            for filename in os.listdir(self.cache_dir):
-                file_path = os.path.join(self.cache_dir, filename)
-                if os.path.isfile(file_path):
-                    file_count += 1
-                    total_size += os.path.getsize(file_path)
+            # Count cache files from the index
+            with self._lock:
+                file_count, total_size = self._index.execute(
+                    "SELECT COUNT(*), COALESCE(SUM(size), 0) FROM entries").fetchone()
             
             return {
                 'file_count': file_count,
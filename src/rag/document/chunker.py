@@ -1,5 +1,5 @@
 import structlog
-from typing import List, Dict, Any, Optional, Union
+from typing import Iterator, List, Dict, Any, Optional, Union
 import re
 
 logger = structlog.get_logger(__name__)
@@ -22,7 +22,7 @@ class TextChunker:
         """
         self.chunk_size = chunk_size
         self.chunk_overlap = chunk_overlap
-        logger.info(f"Initialized TextChunker with chunk_size={chunk_size}, chunk_overlap={chunk_overlap}")
+        logger.info("Initialized TextChunker", chunk_size=chunk_size, chunk_overlap=chunk_overlap)
     
     def chunk_text(self, text: str) -> List[str]:
         """
@@ -41,31 +41,32 @@ class TextChunker:
         if len(text) <= self.chunk_size:
             return [text]
         
-        chunks = []
+        # Find all chunk boundaries first, then slice the text once per chunk
+        text_length = len(text)
+        starts = []
+        ends = []
         start = 0
         
-        while start < len(text):
+        while True:
+            starts.append(start)
             # Get a chunk of size chunk_size
             end = start + self.chunk_size
             
             # If we're at the end of the text, just add the remaining text
-            if end >= len(text):
-                chunks.append(text[start:])
+            if end >= text_length:
+                ends.append(text_length)
                 break
             
             # Try to find a good splitting point (end of sentence or paragraph)
             # Look for period followed by space or newline, or just newline
             split_point = self._find_split_point(text, end)
-            
-            # Add the chunk
-            chunks.append(text[start:split_point])
+            ends.append(split_point)
             
             # Move the start pointer, accounting for overlap
-            start = split_point - self.chunk_overlap
-            if start < 0:
-                start = 0
+            start = max(split_point - self.chunk_overlap, 0)
         
-        logger.debug(f"Split text into {len(chunks)} chunks")
+        chunks = [text[chunk_start:chunk_end] for chunk_start, chunk_end in zip(starts, ends)]
+        logger.debug("Split text into chunks", count=len(chunks))
         return chunks
     
     def _find_split_point(self, text: str, end: int) -> int:
@@ -79,17 +80,17 @@ class TextChunker:
         Returns:
             int: Position to split at.
         """
-        # Look for a period followed by space or newline within 100 characters before end
-        look_back = min(100, end)
-        for i in range(end, end - look_back, -1):
-            if i < len(text) and (
-                (text[i-1] == '.' and (i == len(text) or text[i] in [' ', '\n'])) or
-                text[i-1] == '\n'
-            ):
-                return i
+        # Look for a period followed by space or newline, or just a newline, within
+        # 100 characters before end. Splits go right after the period or newline.
+        start = end - min(100, end)
+        split_point = max(
+            text.rfind('. ', start, end + 1),
+            text.rfind('.\n', start, end + 1),
+            text.rfind('\n', start, end)
+        ) + 1
         
         # If no good splitting point found, just split at end
-        return end
+        return split_point or end
     
     def chunk_documents(self, documents: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
         """
@@ -104,8 +105,23 @@ class TextChunker:
         Returns:
             List[Dict[str, Any]]: List of document chunks.
         """
-        chunked_documents = []
+        chunked_documents = list(self.iter_chunk_documents(documents))
+        logger.debug("Split documents into chunks", documents=len(documents), chunks=len(chunked_documents))
+        return chunked_documents
+    
+    def iter_chunk_documents(self, documents: List[Dict[str, Any]]) -> Iterator[Dict[str, Any]]:
+        """
+        Split documents into smaller chunks, yielding each chunk as it is made.
+        
+        Lets large ingests be processed a batch at a time instead of holding
+        every chunk in memory at once.
+        
+        Args:
+            documents: List of documents to split into chunks, as for chunk_documents().
         
+        Yields:
+            Dict[str, Any]: The next document chunk.
+        """
         for doc in documents:
             text = doc.get('text', '')
             metadata = doc.get('metadata', {})
@@ -116,30 +132,16 @@ class TextChunker:
             
             # Split text into chunks
             chunks = self.chunk_text(text)
+            total = len(chunks)
+            
+            # Other fields of the original document, copied to every chunk
+            other_fields = {key: value for key, value in doc.items() if key not in ('text', 'metadata')}
             
             # Create a new document for each chunk
             for i, chunk in enumerate(chunks):
-                # Create a copy of the metadata
-                chunk_metadata = metadata.copy()
-                
-                # Add chunk information to metadata
-                chunk_metadata['chunk'] = {
-                    'index': i,
-                    'total': len(chunks)
-                }
-                
-                # Create the chunked document
-                chunked_doc = {
+                # Create the chunked document, adding chunk information to a copy of the metadata
+                yield {
                     'text': chunk,
-                    'metadata': chunk_metadata
+                    'metadata': {**metadata, 'chunk': {'index': i, 'total': total}},
+                    **other_fields
                 }
-                
-                # Copy other fields from the original document
-                for key, value in doc.items():
-                    if key not in ['text', 'metadata']:
-                        chunked_doc[key] = value
-                
-                chunked_documents.append(chunked_doc)
-        
-        logger.debug(f"Split {len(documents)} documents into {len(chunked_documents)} chunks")
-        return chunked_documents
@@ -1,15 +1,20 @@
 import structlog
 import uuid
 import hashlib
+from itertools import islice
 from typing import Dict, List, Any, Optional, Union
 from src.rag.document.chunker import TextChunker
 from src.rag.document.cache import DocumentCache
+from src.rag.document.redis_cache import RedisDocumentCache
 from src.rag.embedding.service import EmbeddingService
 from src.rag.vector_db.manager import VectorDBManager
 from src.config.settings import Settings
 
 logger = structlog.get_logger(__name__)
 
+# Chunks embedded and stored together; only one batch is held in memory at a time
+PROCESSING_BATCH_SIZE = 256
+
 class DocumentProcessor:
     """
     Main document processing pipeline.
@@ -36,9 +41,11 @@ class DocumentProcessor:
             chunk_overlap=settings.chunk_overlap
         )
         
-        self.cache = None
-        if settings.cache_enabled:
-            self.cache = DocumentCache(
+        self.cache: Optional[Union[DocumentCache, RedisDocumentCache]] = None
+        if settings.cache_enabled and settings.cache_backend == "redis":
+            self.cache = RedisDocumentCache.get_instance(settings)
+        elif settings.cache_enabled:
+            self.cache = DocumentCache.get_instance(
                 cache_dir=settings.cache_dir,
                 ttl=settings.redis_ttl  # Reuse Redis TTL for document cache
             )
@@ -62,10 +69,13 @@ class DocumentProcessor:
         # Create a string representation of the metadata
         metadata_str = str(sorted(metadata.items()))
         
-        # Create a hash of the text and metadata
-        content_hash = hashlib.md5((text + metadata_str).encode()).hexdigest()
+        # Create a hash of the text and metadata. IDs are stored in the vector
+        # database, so the algorithm stays MD5; hashing the parts separately
+        # avoids building a copy of the whole text.
+        content_hash = hashlib.md5(text.encode())
+        content_hash.update(metadata_str.encode())
         
-        return f"doc_{content_hash}"
+        return f"doc_{content_hash.hexdigest()}"
     
     def process_document(self, text: str, metadata: Dict[str, Any] = None) -> List[str]:
         """
@@ -91,7 +101,7 @@ class DocumentProcessor:
         if self.cache:
             cached_doc = self.cache.get(doc_id)
             if cached_doc:
-                logger.info(f"Using cached document {doc_id}")
+                logger.info("Using cached document", doc_id=doc_id)
                 return [doc_id]
         
         # Create document
@@ -121,30 +131,29 @@ class DocumentProcessor:
             logger.warning("Empty document list, skipping processing")
             return []
         
-        # Step 1: Chunk documents
-        logger.debug(f"Chunking {len(documents)} documents")
-        chunked_docs = self.chunker.chunk_documents(documents)
-        
-        # Step 2: Generate embeddings
-        logger.debug(f"Generating embeddings for {len(chunked_docs)} document chunks")
-        texts = [doc['text'] for doc in chunked_docs]
-        embeddings = self.embedding_service.generate_embeddings(texts)
-        
-        # Step 3: Add embeddings to documents
-        for i, embedding in enumerate(embeddings):
-            chunked_docs[i]['embedding'] = embedding
-        
-        # Step 4: Store documents in vector database
-        logger.debug(f"Storing {len(chunked_docs)} document chunks in vector database")
-        doc_ids = self.vector_db_manager.store_embeddings(chunked_docs)
-        
-        # Step 5: Cache processed documents if enabled
+        # Step 1: Chunk documents, a batch at a time
+        logger.debug("Chunking documents", count=len(documents))
+        chunks = self.chunker.iter_chunk_documents(documents)
+        doc_ids = []
+        
+        while chunked_docs := list(islice(chunks, PROCESSING_BATCH_SIZE)):
+            # Step 2: Generate embeddings
+            logger.debug("Generating embeddings for document chunks", count=len(chunked_docs))
+            texts = [doc['text'] for doc in chunked_docs]
+            # One float32 array, handed to the vector database without converting to lists
+            embeddings = self.embedding_service.generate_embeddings_array(texts)
+            
+            # Step 3: Store documents in vector database, alongside their embeddings
+            logger.debug("Storing document chunks in vector database", count=len(chunked_docs))
+            doc_ids.extend(self.vector_db_manager.store_embeddings(chunked_docs, embeddings))
+        
+        # Step 4: Cache processed documents if enabled, writing the files in the background
         if self.cache:
             for doc in documents:
                 if 'id' in doc:
-                    self.cache.store(doc['id'], doc)
+                    self.cache.store_async(doc['id'], doc)
         
-        logger.info(f"Processed {len(documents)} documents into {len(doc_ids)} chunks")
+        logger.info("Processed documents", documents=len(documents), chunks=len(doc_ids))
         return doc_ids
     
     def query(self, query_text: str, top_k: int = 5, filter: Optional[Dict[str, Any]] = None) -> List[Dict[str, Any]]:
@@ -165,7 +174,7 @@ class DocumentProcessor:
         # Query vector database
         results = self.vector_db_manager.query(query_embedding, top_k, filter)
         
-        logger.info(f"Query returned {len(results)} results")
+        logger.info("Query returned results", count=len(results))
         return results
     
     def delete_document(self, doc_id: str) -> bool:
@@ -185,7 +194,7 @@ class DocumentProcessor:
         if self.cache:
             self.cache.invalidate(doc_id)
         
-        logger.info(f"Deleted document {doc_id}")
+        logger.info("Deleted document", doc_id=doc_id)
         return success
     
     def get_document(self, doc_id: str) -> Optional[Dict[str, Any]]:
@@ -202,15 +211,15 @@ class DocumentProcessor:
         if self.cache:
             cached_doc = self.cache.get(doc_id)
             if cached_doc:
-                logger.debug(f"Cache hit for document {doc_id}")
+                logger.debug("Cache hit for document", doc_id=doc_id)
                 return cached_doc
         
         # Get from vector database
         document = self.vector_db_manager.get_document(doc_id)
         
         if document:
-            logger.debug(f"Retrieved document {doc_id} from vector database")
+            logger.debug("Retrieved document from vector database", doc_id=doc_id)
         else:
-            logger.warning(f"Document {doc_id} not found")
+            logger.warning("Document not found", doc_id=doc_id)
         
         return document
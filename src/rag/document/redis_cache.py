@@ -0,0 +1,186 @@
+import structlog
+import threading
+from concurrent.futures import Future
+from typing import Dict, Any, Optional
+import msgspec
+import redis
+from src.config.settings import Settings
+
+logger = structlog.get_logger(__name__)
+
+_encoder = msgspec.msgpack.Encoder()
+_decoder = msgspec.msgpack.Decoder()
+
+class RedisDocumentCache:
+    """
+    Cache for processed documents, kept in Redis.
+
+    A drop-in alternative to DocumentCache for deployments that run several
+    workers: every worker shares the same entries instead of warming its own
+    cache directory. Entries are msgpack-encoded and expire through Redis TTLs.
+    """
+
+    _instance = None
+    _instance_lock = threading.Lock()
+
+    @classmethod
+    def get_instance(cls, settings: Settings) -> 'RedisDocumentCache':
+        """
+        Get the singleton instance of the RedisDocumentCache.
+
+        Args:
+            settings: Application settings containing the Redis configuration.
+
+        Returns:
+            RedisDocumentCache: The singleton instance.
+        """
+        if cls._instance is None:
+            with cls._instance_lock:
+                if cls._instance is None:
+                    cls._instance = cls(settings)
+        return cls._instance
+
+    def __init__(self, settings: Settings, prefix: str = "document:"):
+        """
+        Initialize the RedisDocumentCache.
+
+        Args:
+            settings: Application settings containing the Redis configuration.
+            prefix: Prefix for the cache's Redis keys.
+        """
+        self.ttl = settings.redis_ttl
+        self.prefix = prefix
+        connection_kwargs = {
+            "host": settings.redis_host,
+            "port": settings.redis_port,
+            "password": settings.redis_password,
+            "db": settings.redis_db,
+            "socket_timeout": 5,
+            "socket_connect_timeout": 5,
+            "retry_on_timeout": True
+        }
+        # Only add ssl if it's enabled
+        if settings.redis_ssl:
+            connection_kwargs["connection_class"] = redis.connection.SSLConnection
+        self.redis = redis.Redis(connection_pool=redis.ConnectionPool(**connection_kwargs))
+
+        logger.info("Initialized RedisDocumentCache", host=settings.redis_host, db=settings.redis_db, ttl=self.ttl)
+
+    def get(self, doc_id: str) -> Optional[Dict[str, Any]]:
+        """
+        Get a document from the cache.
+
+        Args:
+            doc_id: ID of the document to retrieve.
+
+        Returns:
+            Optional[Dict[str, Any]]: The document if found and not expired, None otherwise.
+        """
+        try:
+            data = self.redis.get(self.prefix + doc_id)
+            if data is None:
+                return None
+
+            logger.debug("Cache hit for document", doc_id=doc_id)
+            return _decoder.decode(data)
+        except (redis.RedisError, msgspec.DecodeError) as e:
+            logger.error("Error reading cache for document", doc_id=doc_id, error=str(e))
+            return None
+
+    def store(self, doc_id: str, document: Dict[str, Any]) -> bool:
+        """
+        Store a document in the cache.
+
+        Args:
+            doc_id: ID of the document to store.
+            document: Document to store.
+
+        Returns:
+            bool: True if document was stored successfully, False otherwise.
+        """
+        try:
+            self.redis.setex(self.prefix + doc_id, self.ttl, _encoder.encode(document))
+            logger.debug("Cached document", doc_id=doc_id)
+            return True
+        except (redis.RedisError, msgspec.EncodeError, TypeError) as e:
+            logger.error("Error caching document", doc_id=doc_id, error=str(e))
+            return False
+
+    def store_async(self, doc_id: str, document: Dict[str, Any]) -> Future:
+        """
+        Store a document in the cache.
+
+        A Redis write is a single round trip, so unlike DocumentCache this
+        stores the document before returning.
+
+        Args:
+            doc_id: ID of the document to store.
+            document: Document to store.
+
+        Returns:
+            Future: Resolved with the result of store().
+        """
+        future: Future = Future()
+        future.set_result(self.store(doc_id, document))
+        return future
+
+    def invalidate(self, doc_id: str) -> bool:
+        """
+        Invalidate a cached document.
+
+        Args:
+            doc_id: ID of the document to invalidate.
+
+        Returns:
+            bool: True if document was invalidated successfully, False otherwise.
+        """
+        try:
+            self.redis.delete(self.prefix + doc_id)
+            logger.debug("Invalidated cache for document", doc_id=doc_id)
+            return True
+        except redis.RedisError as e:
+            logger.error("Error invalidating cache for document", doc_id=doc_id, error=str(e))
+            return False
+
+    def clear(self) -> bool:
+        """
+        Clear all cached documents.
+
+        Returns:
+            bool: True if cache was cleared successfully, False otherwise.
+        """
+        try:
+            keys = list(self.redis.scan_iter(match=self.prefix + "*", count=1000))
+            for i in range(0, len(keys), 1000):
+                self.redis.unlink(*keys[i:i + 1000])
+
+            logger.info("Cleared document cache")
+            return True
+        except redis.RedisError as e:
+            logger.error("Error clearing document cache", error=str(e))
+            return False
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Get statistics about the cache.
+
+        Returns:
+            Dict[str, Any]: Dictionary of statistics.
+        """
+        try:
+            pipeline = self.redis.pipeline(transaction=False)
+            for key in self.redis.scan_iter(match=self.prefix + "*", count=1000):
+                pipeline.strlen(key)
+            sizes = pipeline.execute()
+
+            return {
+                'file_count': len(sizes),
+                'total_size_bytes': sum(sizes),
+                'backend': 'redis',
+                'ttl': self.ttl
+            }
+        except redis.RedisError as e:
+            logger.error("Error getting cache stats", error=str(e))
+            return {
+                'error': str(e)
+            }
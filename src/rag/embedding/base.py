@@ -1,5 +1,6 @@
 from abc import ABC, abstractmethod
 from typing import List, Union
+import numpy as np
 
 class EmbeddingModel(ABC):
     """
@@ -35,6 +36,21 @@ class EmbeddingModel(ABC):
         """
         pass
     
+    def generate_batch_array(self, texts: List[str]) -> np.ndarray:
+        """
+        Generate embeddings for a batch of texts as a single float32 array.
+        
+        Models that produce numpy arrays natively override this to skip the
+        conversion through Python lists.
+        
+        Args:
+            texts: The texts to generate embeddings for.
+        
+        Returns:
+            np.ndarray: The embedding vectors, one row per text.
+        """
+        return np.asarray(self.generate_batch(texts), dtype=np.float32)
+    
     @property
     @abstractmethod
     def dimension(self) -> int:
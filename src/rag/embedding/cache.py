@@ -0,0 +1,92 @@
+import hashlib
+import threading
+from collections import OrderedDict
+from typing import List, Optional
+import numpy as np
+
+class EmbeddingCache:
+    """
+    Caches embedding vectors by model and text content.
+
+    Keys are a hash of the model name and the text, so re-indexing a document,
+    or a chunk that appears in several files, reuses the vectors already
+    generated instead of embedding the text again. The least recently used
+    vector is dropped once the cache is full.
+    """
+
+    def __init__(self, capacity: int):
+        """
+        Initialize the EmbeddingCache.
+
+        Args:
+            capacity: Maximum number of cached vectors. 0 disables the cache.
+        """
+        self.capacity = capacity
+        self._lock = threading.Lock()
+        self._vectors: OrderedDict[bytes, np.ndarray] = OrderedDict()
+
+    @staticmethod
+    def key(model_name: str, text: str) -> bytes:
+        """
+        Build the cache key for a text.
+
+        Args:
+            model_name: Name of the model that embeds the text.
+            text: The text.
+
+        Returns:
+            bytes: The key.
+        """
+        digest = hashlib.blake2b(model_name.encode(), digest_size=16)
+        digest.update(b"\0")
+        digest.update(text.encode())
+        return digest.digest()
+
+    def get_many(self, keys: List[bytes]) -> List[Optional[np.ndarray]]:
+        """
+        Get the cached vectors for several keys.
+
+        Args:
+            keys: Keys from key().
+
+        Returns:
+            List[Optional[np.ndarray]]: Each key's vector, or None on a miss.
+        """
+        vectors = []
+        with self._lock:
+            for key in keys:
+                vector = self._vectors.get(key)
+                if vector is not None:
+                    self._vectors.move_to_end(key)
+                vectors.append(vector)
+        return vectors
+
+    def put_many(self, keys: List[bytes], vectors: np.ndarray) -> None:
+        """
+        Cache vectors for several keys.
+
+        Zero vectors, which the embedding models return when they fail, are
+        not cached.
+
+        Args:
+            keys: Keys from key().
+            vectors: The vectors, one row per key.
+        """
+        if not self.capacity:
+            return
+        with self._lock:
+            for key, vector in zip(keys, vectors):
+                if not vector.any():
+                    continue
+                # Copy the row so the cache doesn't keep the whole batch alive
+                vector = vector.copy()
+                vector.flags.writeable = False
+                self._vectors[key] = vector
+                self._vectors.move_to_end(key)
+            while len(self._vectors) > self.capacity:
+                self._vectors.popitem(last=False)
+
+    def clear(self) -> None:
+        """Drop every cached vector."""
+        with self._lock:
+            self._vectors.clear()
@@ -1,17 +1,56 @@
+import asyncio
+import random
 import structlog
 from typing import List, Dict, Any, Optional
 from openai import OpenAI
 from src.rag.embedding.base import EmbeddingModel
 from src.config.settings import Settings
+from src.llm.clients import LLMClients
 
 logger = structlog.get_logger(__name__)
 
+# Limits for each embeddings request. Tokens are estimated at four characters
+# each, keeping requests well under the API's per-request token limit.
+EMBEDDING_BATCH_SIZE = 256
+EMBEDDING_BATCH_TOKENS = 200_000
+# Longest random delay, in seconds, before each request when there are more
+# requests than can be in flight, so the burst doesn't hit the rate limiter at once
+EMBEDDING_JITTER = 0.05
+
+def _split_batches(texts: List[str], batch_size: int = EMBEDDING_BATCH_SIZE) -> List[List[str]]:
+    """
+    Split texts into consecutive batches that fit in one embeddings request.
+    
+    Args:
+        texts: The texts to split.
+        batch_size: Maximum number of texts in a batch.
+    
+    Returns:
+        List[List[str]]: The batches, in order.
+    """
+    batches = []
+    batch: List[str] = []
+    tokens = 0
+    for text in texts:
+        estimate = len(text) // 4 + 1
+        if batch and (len(batch) == batch_size or tokens + estimate > EMBEDDING_BATCH_TOKENS):
+            batches.append(batch)
+            batch = []
+            tokens = 0
+        batch.append(text)
+        tokens += estimate
+    if batch:
+        batches.append(batch)
+    return batches
+
 class OpenAIEmbedding(EmbeddingModel):
     """
     OpenAI embedding model implementation.
     
     This class implements the EmbeddingModel interface for OpenAI embeddings.
-    It provides methods for generating embeddings using OpenAI's API.
+    It provides methods for generating embeddings using OpenAI's API. Large
+    batches are split into several requests, sent concurrently over the shared
+    pooled AsyncOpenAI client.
     """
     
     def __init__(self, settings: Settings):
@@ -25,13 +64,16 @@ class OpenAIEmbedding(EmbeddingModel):
         self.api_key = settings.openai_api_key
         self._model_name = settings.openai_embedding_model
         self._dimension = 1536  # Default for text-embedding-3-small
+        self.batch_size = settings.embedding_batch_size
+        self.concurrency = settings.embedding_concurrency
         
         # Initialize OpenAI client
         self.client = OpenAI(api_key=self.api_key)
+        self.clients = LLMClients.get_instance(settings)
         
         if settings.openai_api_base:
             self.client.base_url = settings.openai_api_base
-            logger.info(f"Using custom OpenAI API base: {settings.openai_api_base}")
+            logger.info("Using custom OpenAI API base", base_url=settings.openai_api_base)
     
     def generate(self, text: str) -> List[float]:
         """
@@ -49,10 +91,10 @@ class OpenAIEmbedding(EmbeddingModel):
                 input=text
             )
             embedding = response.data[0].embedding
-            logger.debug(f"Generated embedding with {len(embedding)} dimensions")
+            logger.debug("Generated embedding", dimensions=len(embedding))
             return embedding
         except Exception as e:
-            logger.error(f"Error generating OpenAI embedding: {str(e)}")
+            logger.error("Error generating OpenAI embedding", error=str(e))
             # Return a zero vector as fallback
             return [0.0] * self._dimension
     
@@ -66,18 +108,53 @@ class OpenAIEmbedding(EmbeddingModel):
         Returns:
             List[List[float]]: The embedding vectors.
         """
+        if not texts:
+            return []
+        
+        batches = _split_batches(texts, self.batch_size)
         try:
-            response = self.client.embeddings.create(
-                model=self._model_name,
-                input=texts
-            )
-            embeddings = [data.embedding for data in response.data]
-            logger.debug(f"Generated {len(embeddings)} embeddings")
-            return embeddings
+            results = self.clients.submit(self._generate_batches(batches)).result()
         except Exception as e:
-            logger.error(f"Error generating OpenAI embeddings: {str(e)}")
+            logger.error("Error generating OpenAI embeddings", error=str(e))
             # Return zero vectors as fallback
             return [[0.0] * self._dimension for _ in range(len(texts))]
+        
+        # Reassemble the batches in order, with zero vectors for any that failed
+        embeddings = []
+        for batch, result in zip(batches, results):
+            if isinstance(result, BaseException):
+                logger.error("Error generating OpenAI embeddings", error=str(result), count=len(batch))
+                embeddings.extend([0.0] * self._dimension for _ in batch)
+            else:
+                embeddings.extend(result)
+        logger.debug("Generated embeddings", count=len(embeddings), requests=len(batches))
+        return embeddings
+    
+    async def _generate_batches(self, batches: List[List[str]]) -> List[Any]:
+        """
+        Request embeddings for each batch, a limited number at a time.
+        
+        Args:
+            batches: Batches from _split_batches().
+        
+        Returns:
+            List[Any]: Each batch's embedding vectors, or the exception its request raised.
+        """
+        semaphore = asyncio.Semaphore(self.concurrency)
+        # Small calls, such as query embeddings, are sent right away
+        jitter = EMBEDDING_JITTER if len(batches) > self.concurrency else 0
+        
+        async def generate(batch: List[str]) -> List[List[float]]:
+            async with semaphore:
+                if jitter:
+                    await asyncio.sleep(random.uniform(0, jitter))
+                response = await self.clients.openai.embeddings.create(
+                    model=self._model_name,
+                    input=batch
+                )
+            return [data.embedding for data in response.data]
+        
+        return await asyncio.gather(*(generate(batch) for batch in batches), return_exceptions=True)
     
     @property
     def dimension(self) -> int:
@@ -1,11 +1,16 @@
 import structlog
-from typing import List, Dict, Any, Optional
+import threading
+from typing import List, Dict, Any, Optional, Tuple
 import numpy as np
 from src.rag.embedding.base import EmbeddingModel
 from src.config.settings import Settings
 
 logger = structlog.get_logger(__name__)
 
+# Loaded models by name and backend, shared by every SentenceTransformerEmbedding in the process
+_models: Dict[Tuple[str, str], Any] = {}
+_models_lock = threading.Lock()
+
 class SentenceTransformerEmbedding(EmbeddingModel):
     """
     SentenceTransformer embedding model implementation.
@@ -23,6 +28,7 @@ class SentenceTransformerEmbedding(EmbeddingModel):
         """
         self.settings = settings
         self._model_name = settings.st_model
+        self._backend = settings.st_backend
         self._model = None
         self._dimension = 384  # Default for all-MiniLM-L6-v2
         
@@ -31,18 +37,47 @@ class SentenceTransformerEmbedding(EmbeddingModel):
     
     def _load_model(self) -> None:
         """
-        Load the SentenceTransformer model.
+        Load the SentenceTransformer model, reusing it if the process already loaded it.
         """
         try:
-            from sentence_transformers import SentenceTransformer
-            self._model = SentenceTransformer(self._model_name)
+            with _models_lock:
+                model = _models.get((self._model_name, self._backend))
+                if model is None:
+                    model = _models[(self._model_name, self._backend)] = self._create_model()
+                    logger.info("Loaded SentenceTransformer model", model=self._model_name,
+                                backend=self._backend, dimension=model.get_sentence_embedding_dimension())
+            self._model = model
             # Update dimension based on the loaded model
             self._dimension = self._model.get_sentence_embedding_dimension()
-            logger.info(f"Loaded SentenceTransformer model: {self._model_name} with dimension {self._dimension}")
         except Exception as e:
-            logger.error(f"Error loading SentenceTransformer model: {str(e)}")
+            logger.error("Error loading SentenceTransformer model", error=str(e))
             self._model = None
     
+    def _create_model(self) -> Any:
+        """
+        Create the SentenceTransformer model for the configured backend.
+        
+        The onnx and openvino backends need sentence-transformers 3.2 or later
+        with the matching extra installed; if they can't be used, the model is
+        loaded with the default torch backend instead.
+        
+        Returns:
+            SentenceTransformer: The model.
+        """
+        from sentence_transformers import SentenceTransformer
+        
+        if self._backend != "torch":
+            kwargs: Dict[str, Any] = {"backend": self._backend}
+            if self.settings.st_onnx_file:
+                kwargs["model_kwargs"] = {"file_name": self.settings.st_onnx_file}
+            try:
+                return SentenceTransformer(self._model_name, **kwargs)
+            except Exception as e:
+                logger.warning("Falling back to the torch backend for SentenceTransformer",
+                               backend=self._backend, error=str(e))
+        
+        return SentenceTransformer(self._model_name)
+    
     def generate(self, text: str) -> List[float]:
         """
         Generate an embedding for a single text using SentenceTransformer.
@@ -63,10 +98,10 @@ class SentenceTransformerEmbedding(EmbeddingModel):
             embedding = self._model.encode(text)
             # Convert numpy array to list
             embedding_list = embedding.tolist()
-            logger.debug(f"Generated embedding with {len(embedding_list)} dimensions")
+            logger.debug("Generated embedding", dimensions=len(embedding_list))
             return embedding_list
         except Exception as e:
-            logger.error(f"Error generating SentenceTransformer embedding: {str(e)}")
+            logger.error("Error generating SentenceTransformer embedding", error=str(e))
             # Return a zero vector as fallback
             return [0.0] * self._dimension
     
@@ -80,22 +115,33 @@ class SentenceTransformerEmbedding(EmbeddingModel):
         Returns:
             List[List[float]]: The embedding vectors.
         """
+        # Convert numpy arrays to lists
+        return self.generate_batch_array(texts).tolist()
+    
+    def generate_batch_array(self, texts: List[str]) -> np.ndarray:
+        """
+        Generate embeddings for a batch of texts as the float32 array the model produces.
+        
+        Args:
+            texts: The texts to generate embeddings for.
+        
+        Returns:
+            np.ndarray: The embedding vectors, one row per text.
+        """
         if self._model is None:
             self._load_model()
             if self._model is None:
                 logger.error("SentenceTransformer model not loaded")
-                return [[0.0] * self._dimension for _ in range(len(texts))]
+                return np.zeros((len(texts), self._dimension), dtype=np.float32)
         
         try:
-            embeddings = self._model.encode(texts)
-            # Convert numpy arrays to lists
-            embeddings_list = embeddings.tolist()
-            logger.debug(f"Generated {len(embeddings_list)} embeddings")
-            return embeddings_list
+            embeddings = self._model.encode(texts, convert_to_numpy=True).astype(np.float32, copy=False)
+            logger.debug("Generated embeddings", count=len(embeddings))
+            return embeddings
         except Exception as e:
-            logger.error(f"Error generating SentenceTransformer embeddings: {str(e)}")
+            logger.error("Error generating SentenceTransformer embeddings", error=str(e))
             # Return zero vectors as fallback
-            return [[0.0] * self._dimension for _ in range(len(texts))]
+            return np.zeros((len(texts), self._dimension), dtype=np.float32)
     
     @property
     def dimension(self) -> int:
@@ -1,6 +1,8 @@
 import structlog
 from typing import Dict, List, Any, Optional, Type
+import numpy as np
 from src.rag.embedding.base import EmbeddingModel
+from src.rag.embedding.cache import EmbeddingCache
 from src.rag.embedding.openai import OpenAIEmbedding
 from src.rag.embedding.sentence_transformers import SentenceTransformerEmbedding
 from src.config.settings import Settings
@@ -13,6 +15,7 @@ class EmbeddingService:
     
     This class manages the embedding models and allows switching between them.
     It provides a singleton instance to ensure only one model is active at a time.
+    Generated vectors are cached by text, so repeated texts skip the model.
     """
     
     _instance = None
@@ -48,6 +51,9 @@ class EmbeddingService:
             'sentence_transformers': SentenceTransformerEmbedding
         }
         self.current_model: Optional[EmbeddingModel] = None
+        # Models created so far, shared by everything that embeds text in the process
+        self._loaded_models: Dict[str, EmbeddingModel] = {}
+        self.cache = EmbeddingCache(settings.embedding_cache_size)
         
         # Initialize the default model
         self.set_model(self.model_type)
@@ -63,19 +69,44 @@ class EmbeddingService:
             bool: True if model was set successfully, False otherwise.
         """
         if model_type not in self.models:
-            logger.error(f"Unknown embedding model type: {model_type}")
+            logger.error("Unknown embedding model type", model_type=model_type)
             return False
         
+        model = self.get_shared_model(model_type)
+        if model is None:
+            return False
+        self.current_model = model
+        self.model_type = model_type
+        logger.info("Set embedding model", model_type=model_type)
+        return True
+
+    def get_shared_model(self, model_type: str) -> Optional[EmbeddingModel]:
+        """
+        Get the process-wide model of a type, creating it on first use.
+
+        Lets other components, such as the master crew's intent cache, use the
+        same loaded model as RAG instead of loading their own copy.
+
+        Args:
+            model_type: Type of embedding model to get.
+
+        Returns:
+            Optional[EmbeddingModel]: The model, or None if it could not be created.
+        """
+        model = self._loaded_models.get(model_type)
+        if model is not None:
+            return model
+        if model_type not in self.models:
+            logger.error("Unknown embedding model type", model_type=model_type)
+            return None
+
         # Create new model
         try:
-            model_class = self.models[model_type]
-            self.current_model = model_class(self.settings)
-            self.model_type = model_type
-            logger.info(f"Set embedding model to: {model_type}")
-            return True
+            model = self._loaded_models[model_type] = self.models[model_type](self.settings)
+            return model
         except Exception as e:
-            logger.error(f"Error setting embedding model: {model_type}", error=str(e))
-            return False
+            logger.error("Error setting embedding model", model_type=model_type, error=str(e))
+            return None
     
     def get_model(self) -> Optional[EmbeddingModel]:
         """
@@ -109,7 +140,7 @@ class EmbeddingService:
             logger.error("No embedding model available")
             return []
         
-        return self.current_model.generate(text)
+        return self._generate_cached([text])[0].tolist()
     
     def generate_embeddings(self, texts: List[str]) -> List[List[float]]:
         """
@@ -125,7 +156,52 @@ class EmbeddingService:
             logger.error("No embedding model available")
             return []
         
-        return self.current_model.generate_batch(texts)
+        return self._generate_cached(texts).tolist()
+    
+    def generate_embeddings_array(self, texts: List[str]) -> np.ndarray:
+        """
+        Generate embeddings for a batch of texts as a single float32 array.
+        
+        Args:
+            texts: The texts to generate embeddings for.
+        
+        Returns:
+            np.ndarray: The embedding vectors, one row per text.
+        """
+        if not self.current_model:
+            logger.error("No embedding model available")
+            return np.empty((0, 0), dtype=np.float32)
+        
+        return self._generate_cached(texts)
+    
+    def _generate_cached(self, texts: List[str]) -> np.ndarray:
+        """
+        Generate embeddings with the current model, reusing cached vectors.
+        
+        Only the texts missing from the cache are sent to the model.
+        
+        Args:
+            texts: The texts to generate embeddings for.
+        
+        Returns:
+            np.ndarray: The embedding vectors, one row per text.
+        """
+        model = self.current_model
+        if not texts:
+            return model.generate_batch_array(texts)
+        
+        keys = [EmbeddingCache.key(model.model_name, text) for text in texts]
+        vectors = self.cache.get_many(keys)
+        misses = [i for i, vector in enumerate(vectors) if vector is None]
+        if misses:
+            generated = model.generate_batch_array([texts[i] for i in misses])
+            self.cache.put_many([keys[i] for i in misses], generated)
+            if len(misses) == len(texts):
+                return generated
+            for i, vector in zip(misses, generated):
+                vectors[i] = vector
+        logger.debug("Embedding cache lookup", count=len(texts), hits=len(texts) - len(misses))
+        return np.stack(vectors)
     
     @property
     def dimension(self) -> int:
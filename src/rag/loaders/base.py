@@ -1,5 +1,5 @@
 from abc import ABC, abstractmethod
-from typing import Dict, List, Any, Optional, Union
+from typing import Dict, List, Any, Optional, Set, Union
 
 class DocumentLoader(ABC):
     """
@@ -26,12 +26,14 @@ class DocumentLoader(ABC):
         pass
     
     @abstractmethod
-    def load_batch(self, sources: List[str], **kwargs) -> List[Dict[str, Any]]:
+    def load_batch(self, sources: List[str], known: Optional[Set[str]] = None, **kwargs) -> List[Dict[str, Any]]:
         """
         Load multiple documents from sources.
         
         Args:
             sources: List of source identifiers.
+            known: Fingerprints, from fingerprints(), of sources already loaded.
+                Sources whose fingerprint is in the set are skipped.
             **kwargs: Additional arguments specific to the loader.
         
         Returns:
@@ -39,6 +41,40 @@ class DocumentLoader(ABC):
         """
         pass
     
+    def fingerprints(self, sources: List[str], **kwargs) -> Dict[str, str]:
+        """
+        Get fingerprints that change whenever a source's content may have changed.
+        
+        Fingerprints are cheap to compute, without loading the sources, so
+        callers can skip sources they have already loaded. Sources without a
+        fingerprint are always loaded.
+        
+        Args:
+            sources: List of source identifiers.
+            **kwargs: Additional arguments specific to the loader.
+        
+        Returns:
+            Dict[str, str]: Fingerprints by source. The default has none.
+        """
+        return {}
+    
+    def _unknown_sources(self, sources: List[str], known: Optional[Set[str]], **kwargs) -> List[str]:
+        """
+        Drop the sources whose fingerprint is already known.
+        
+        Args:
+            sources: List of source identifiers.
+            known: Fingerprints of sources already loaded, or None to keep all sources.
+            **kwargs: Additional arguments passed to fingerprints().
+        
+        Returns:
+            List[str]: The remaining sources, in order.
+        """
+        if not known:
+            return sources
+        fingerprints = self.fingerprints(sources, **kwargs)
+        return [source for source in sources if fingerprints.get(source) not in known]
+    
     @abstractmethod
     def supports(self, source_type: str) -> bool:
         """
@@ -1,12 +1,21 @@
 import structlog
 import os
 import hashlib
+import io
 import mimetypes
-from typing import Dict, List, Any, Optional, Union
+import mmap
+from concurrent.futures import ThreadPoolExecutor
+from typing import BinaryIO, Dict, List, Any, Optional, Set, Union
 from src.rag.loaders.base import DocumentLoader
 
 logger = structlog.get_logger(__name__)
 
+# Files loaded at once by load_batch. Loading mostly waits on disk reads and
+# the tesseract subprocess, so this can exceed the number of CPUs.
+DEFAULT_LOAD_WORKERS = min(32, (os.cpu_count() or 4) + 4)
+# Text files larger than this are decoded straight from a memory map
+TEXT_MMAP_THRESHOLD = 16 * 1024 * 1024
+
 class FileLoader(DocumentLoader):
     """
     Loader for local files.
@@ -15,10 +24,15 @@ class FileLoader(DocumentLoader):
     It provides methods for loading documents from file paths.
     """
     
-    def __init__(self):
+    def __init__(self, max_workers: int = DEFAULT_LOAD_WORKERS):
         """
         Initialize the FileLoader.
+        
+        Args:
+            max_workers: Maximum number of files load_batch loads at once.
         """
+        self.max_workers = max_workers
+        
         # Initialize supported file types
         self.supported_extensions = {
             '.txt': self._load_text,
@@ -37,8 +51,14 @@ class FileLoader(DocumentLoader):
             '.gif': self._load_image,
             '.bmp': self._load_image
         }
+        # MIME types of the supported extensions, for supports()
+        self._supported_mime_types = frozenset(
+            mime_type.lower()
+            for mime_type, _ in (mimetypes.guess_type(f"file{ext}") for ext in self.supported_extensions)
+            if mime_type
+        )
         
-        logger.info(f"Initialized FileLoader with {len(self.supported_extensions)} supported file types")
+        logger.info("Initialized FileLoader", supported_file_types=len(self.supported_extensions))
     
     def load(self, source: str, **kwargs) -> Dict[str, Any]:
         """
@@ -51,6 +71,9 @@ class FileLoader(DocumentLoader):
         Returns:
             Dict[str, Any]: The loaded document.
         """
+        # Generate document ID
+        doc_id = f"file_{hashlib.md5(source.encode()).hexdigest()}"
+        
         try:
             # Validate file path
             if not os.path.exists(source):
@@ -71,19 +94,16 @@ class FileLoader(DocumentLoader):
             loader_method = self.supported_extensions[ext]
             document = loader_method(source, **kwargs)
             
-            # Generate document ID
-            doc_id = f"file_{hashlib.md5(source.encode()).hexdigest()}"
-            
             # Add document ID
             document['id'] = doc_id
             
-            logger.info(f"Loaded file: {source}")
+            logger.info("Loaded file", source=source)
             return document
         except Exception as e:
-            logger.error(f"Error loading file: {source}", error=str(e))
+            logger.error("Error loading file", source=source, error=str(e))
             # Return empty document with error metadata
             return {
-                'id': f"file_{hashlib.md5(source.encode()).hexdigest()}",
+                'id': doc_id,
                 'text': '',
                 'metadata': {
                     'source': source,
@@ -92,26 +112,97 @@ class FileLoader(DocumentLoader):
                 }
             }
     
-    def load_batch(self, sources: List[str], **kwargs) -> List[Dict[str, Any]]:
+    def load_bytes(self, data: bytes, filename: str, **kwargs) -> Dict[str, Any]:
+        """
+        Load a document from a file's contents, without writing it to disk.
+        
+        Args:
+            data: The file's contents.
+            filename: Name of the file, used to pick the loader by extension.
+            **kwargs: Additional arguments specific to the file type.
+        
+        Returns:
+            Dict[str, Any]: The loaded document.
+        """
+        doc_id = f"file_{hashlib.md5(filename.encode()).hexdigest()}"
+        
+        try:
+            _, ext = os.path.splitext(filename)
+            ext = ext.lower()
+            
+            # Check if file type is supported
+            if ext not in self.supported_extensions:
+                raise ValueError(f"Unsupported file type: {ext}")
+            
+            document = self.supported_extensions[ext](io.BytesIO(data), **kwargs)
+            document['metadata'].update({
+                'source': filename,
+                'filename': os.path.basename(filename),
+                'extension': ext,
+                'size': len(data)
+            })
+            document['id'] = doc_id
+            
+            logger.info("Loaded file", source=filename)
+            return document
+        except Exception as e:
+            logger.error("Error loading file", source=filename, error=str(e))
+            # Return empty document with error metadata
+            return {
+                'id': doc_id,
+                'text': '',
+                'metadata': {
+                    'source': filename,
+                    'error': str(e),
+                    'source_type': 'file'
+                }
+            }
+    
+    def load_batch(self, sources: List[str], known: Optional[Set[str]] = None, **kwargs) -> List[Dict[str, Any]]:
         """
         Load multiple documents from file paths.
         
+        Files are loaded concurrently on a thread pool.
+        
         Args:
             sources: List of file paths to load.
+            known: Fingerprints, from fingerprints(), of files already loaded.
+                Files whose fingerprint is in the set are skipped.
             **kwargs: Additional arguments passed to load().
         
         Returns:
-            List[Dict[str, Any]]: List of loaded documents.
+            List[Dict[str, Any]]: List of loaded documents, in the order of sources.
         """
-        documents = []
+        sources = self._unknown_sources(sources, known)
+        if len(sources) < 2 or self.max_workers < 2:
+            documents = [self.load(source, **kwargs) for source in sources]
+        else:
+            with ThreadPoolExecutor(max_workers=min(self.max_workers, len(sources))) as executor:
+                documents = list(executor.map(lambda source: self.load(source, **kwargs), sources))
         
-        for source in sources:
-            document = self.load(source, **kwargs)
-            documents.append(document)
-        
-        logger.info(f"Loaded {len(documents)} files")
+        logger.info("Loaded files", count=len(documents))
         return documents
     
+    def fingerprints(self, sources: List[str], **kwargs) -> Dict[str, str]:
+        """
+        Get fingerprints of files from their path, modification time and size.
+        
+        Args:
+            sources: List of file paths.
+            **kwargs: Unused.
+        
+        Returns:
+            Dict[str, str]: Fingerprints by file path, for the files that exist.
+        """
+        fingerprints = {}
+        for source in sources:
+            try:
+                stat = os.stat(source)
+            except OSError:
+                continue
+            fingerprints[source] = f"{source}:{stat.st_mtime_ns}:{stat.st_size}"
+        return fingerprints
+    
     def supports(self, source_type: str) -> bool:
         """
         Check if the loader supports a source type.
@@ -130,50 +221,76 @@ class FileLoader(DocumentLoader):
             return source_type.lower() in self.supported_extensions
         
         # Check if it's a mime type
-        for ext in self.supported_extensions:
-            mime_type, _ = mimetypes.guess_type(f"file{ext}")
-            if mime_type and mime_type.lower() == source_type.lower():
-                return True
+        return source_type.lower() in self._supported_mime_types
+    
+    def _file_metadata(self, file_path: Union[str, BinaryIO], stat: Optional[os.stat_result] = None) -> Dict[str, Any]:
+        """
+        Get the metadata shared by every file type.
+        
+        In-memory files have no path or modification time; load_bytes() adds
+        their name and size.
+        
+        Args:
+            file_path: Path to the file, or the in-memory file.
+            stat: The file's stat result, if already known.
         
-        return False
+        Returns:
+            Dict[str, Any]: The file's metadata.
+        """
+        if not isinstance(file_path, str):
+            return {'source_type': 'file'}
+        
+        stat = stat or os.stat(file_path)
+        return {
+            'source': file_path,
+            'filename': os.path.basename(file_path),
+            'extension': os.path.splitext(file_path)[1].lower(),
+            'size': stat.st_size,
+            'modified': stat.st_mtime,
+            'source_type': 'file'
+        }
     
-    def _load_text(self, file_path: str, **kwargs) -> Dict[str, Any]:
+    def _load_text(self, file_path: Union[str, BinaryIO], **kwargs) -> Dict[str, Any]:
         """
         Load a text file.
         
         Args:
-            file_path: Path to the text file.
+            file_path: Path to the text file, or the in-memory file.
             **kwargs: Additional arguments.
         
         Returns:
             Dict[str, Any]: The loaded document.
         """
         encoding = kwargs.get('encoding', 'utf-8')
+        stat = None
         
-        with open(file_path, 'r', encoding=encoding) as f:
-            text = f.read()
+        # Read the raw bytes and decode them in one pass
+        if isinstance(file_path, str):
+            with open(file_path, 'rb') as f:
+                stat = os.fstat(f.fileno())
+                if stat.st_size > TEXT_MMAP_THRESHOLD:
+                    with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as data:
+                        text = str(data, encoding, 'replace')
+                else:
+                    text = f.read().decode(encoding, errors='replace')
+        else:
+            text = file_path.read().decode(encoding, errors='replace')
         
-        # Get file metadata
-        stat = os.stat(file_path)
+        # Normalize newlines as text mode would
+        if '\r' in text:
+            text = text.replace('\r\n', '\n').replace('\r', '\n')
         
         return {
             'text': text,
-            'metadata': {
-                'source': file_path,
-                'filename': os.path.basename(file_path),
-                'extension': os.path.splitext(file_path)[1].lower(),
-                'size': stat.st_size,
-                'modified': stat.st_mtime,
-                'source_type': 'file'
-            }
+            'metadata': self._file_metadata(file_path, stat)
         }
     
-    def _load_pdf(self, file_path: str, **kwargs) -> Dict[str, Any]:
+    def _load_pdf(self, file_path: Union[str, BinaryIO], **kwargs) -> Dict[str, Any]:
         """
         Load a PDF file.
         
         Args:
-            file_path: Path to the PDF file.
+            file_path: Path to the PDF file, or the in-memory file.
             **kwargs: Additional arguments.
         
         Returns:
@@ -183,37 +300,28 @@ class FileLoader(DocumentLoader):
             from pypdf import PdfReader
             
             reader = PdfReader(file_path)
-            text = ""
             
-            # Extract text from each page
-            for page in reader.pages:
-                text += page.extract_text() + "\n\n"
+            # Extract text from each page and join it once
+            text = "".join([page.extract_text() + "\n\n" for page in reader.pages])
             
             # Get file metadata
-            stat = os.stat(file_path)
+            metadata = self._file_metadata(file_path)
+            metadata['page_count'] = len(reader.pages)
             
             return {
                 'text': text,
-                'metadata': {
-                    'source': file_path,
-                    'filename': os.path.basename(file_path),
-                    'extension': '.pdf',
-                    'size': stat.st_size,
-                    'modified': stat.st_mtime,
-                    'page_count': len(reader.pages),
-                    'source_type': 'file'
-                }
+                'metadata': metadata
             }
         except ImportError:
             logger.error("pypdf not installed, cannot load PDF files")
             raise ImportError("pypdf not installed, cannot load PDF files")
     
-    def _load_docx(self, file_path: str, **kwargs) -> Dict[str, Any]:
+    def _load_docx(self, file_path: Union[str, BinaryIO], **kwargs) -> Dict[str, Any]:
         """
         Load a DOCX file.
         
         Args:
-            file_path: Path to the DOCX file.
+            file_path: Path to the DOCX file, or the in-memory file.
             **kwargs: Additional arguments.
         
         Returns:
@@ -223,44 +331,35 @@ class FileLoader(DocumentLoader):
             import docx
             
             doc = docx.Document(file_path)
-            text = ""
+            parts = []
             
             # Extract text from paragraphs
             for para in doc.paragraphs:
-                text += para.text + "\n"
+                parts.append(para.text + "\n")
             
             # Extract text from tables
             for table in doc.tables:
                 for row in table.rows:
                     for cell in row.cells:
-                        text += cell.text + " "
-                    text += "\n"
-                text += "\n"
-            
-            # Get file metadata
-            stat = os.stat(file_path)
+                        parts.append(cell.text + " ")
+                    parts.append("\n")
+                parts.append("\n")
+            text = "".join(parts)
             
             return {
                 'text': text,
-                'metadata': {
-                    'source': file_path,
-                    'filename': os.path.basename(file_path),
-                    'extension': os.path.splitext(file_path)[1].lower(),
-                    'size': stat.st_size,
-                    'modified': stat.st_mtime,
-                    'source_type': 'file'
-                }
+                'metadata': self._file_metadata(file_path)
             }
         except ImportError:
             logger.error("python-docx not installed, cannot load DOCX files")
             raise ImportError("python-docx not installed, cannot load DOCX files")
     
-    def _load_image(self, file_path: str, **kwargs) -> Dict[str, Any]:
+    def _load_image(self, file_path: Union[str, BinaryIO], **kwargs) -> Dict[str, Any]:
         """
         Load an image file and extract text using OCR.
         
         Args:
-            file_path: Path to the image file.
+            file_path: Path to the image file, or the in-memory file.
             **kwargs: Additional arguments.
         
         Returns:
@@ -277,19 +376,12 @@ class FileLoader(DocumentLoader):
             text = pytesseract.image_to_string(image)
             
             # Get file metadata
-            stat = os.stat(file_path)
+            metadata = self._file_metadata(file_path)
+            metadata['image_size'] = f"{image.width}x{image.height}"
             
             return {
                 'text': text,
-                'metadata': {
-                    'source': file_path,
-                    'filename': os.path.basename(file_path),
-                    'extension': os.path.splitext(file_path)[1].lower(),
-                    'size': stat.st_size,
-                    'modified': stat.st_mtime,
-                    'image_size': f"{image.width}x{image.height}",
-                    'source_type': 'file'
-                }
+                'metadata': metadata
             }
         except ImportError:
             logger.error("pytesseract or PIL not installed, cannot load image files")
@@ -1,15 +1,31 @@
+import asyncio
 import structlog
-import os
 import hashlib
 import json
-import tempfile
-from typing import Dict, List, Any, Optional, Union
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Any, Optional, Set, Union
 from src.rag.loaders.base import DocumentLoader
 from src.rag.loaders.file import FileLoader
 from src.config.settings import Settings
 
 logger = structlog.get_logger(__name__)
 
+# Largest page conversations.history returns
+HISTORY_PAGE_SIZE = 999
+# Slack requests in flight at once for a single aload_batch call or user
+# lookup prefetch, to stay within Slack's per-method rate limits
+SLACK_CONCURRENCY = 8
+# Seconds to wait for a Slack file download
+DOWNLOAD_TIMEOUT = 30
+# Extensions for Slack file types whose names differ from the extension
+FILETYPE_EXTENSIONS = {
+    'text': '.txt',
+    'markdown': '.md',
+    'jpeg': '.jpg'
+}
+
 class SlackLoader(DocumentLoader):
     """
     Loader for Slack messages and files.
@@ -28,6 +44,9 @@ class SlackLoader(DocumentLoader):
         self.settings = settings
         self.slack_bot_token = settings.slack_bot_token
         self.file_loader = FileLoader()
+        # Display names by user ID, shared across loads
+        self._user_names: Dict[str, str] = {}
+        self._user_names_lock = threading.Lock()
         
         logger.info("Initialized SlackLoader")
     
@@ -69,39 +88,140 @@ class SlackLoader(DocumentLoader):
             logger.error("slack_sdk not installed, cannot load Slack messages or files")
             raise ImportError("slack_sdk not installed, cannot load Slack messages or files")
         except Exception as e:
-            logger.error(f"Error loading Slack {'file' if is_file else 'message'}: {source}", error=str(e))
-            # Return empty document with error metadata
-            return {
-                'id': f"slack_{hashlib.md5(source.encode()).hexdigest()}",
-                'text': '',
-                'metadata': {
-                    'source': source,
-                    'channel_id': channel_id,
-                    'error': str(e),
-                    'source_type': 'slack'
-                }
+            logger.error("Error loading Slack content", source=source, is_file=is_file, error=str(e))
+            return self._error_document(source, channel_id, e)
+    
+    def _error_document(self, source: str, channel_id: str, error: Exception) -> Dict[str, Any]:
+        """
+        Build the empty document returned for a source that failed to load.
+        
+        Args:
+            source: Slack message ID or file ID.
+            channel_id: Slack channel ID.
+            error: The error that stopped the load.
+        
+        Returns:
+            Dict[str, Any]: Empty document with error metadata.
+        """
+        return {
+            'id': f"slack_{hashlib.md5(source.encode()).hexdigest()}",
+            'text': '',
+            'metadata': {
+                'source': source,
+                'channel_id': channel_id,
+                'error': str(error),
+                'source_type': 'slack'
             }
+        }
     
-    def load_batch(self, sources: List[str], **kwargs) -> List[Dict[str, Any]]:
+    def load_batch(self, sources: List[str], known: Optional[Set[str]] = None, **kwargs) -> List[Dict[str, Any]]:
         """
         Load multiple documents from Slack messages or files.
         
+        Messages from the same channel are fetched together, a page of channel
+        history at a time, instead of one API call per message.
+        
         Args:
             sources: List of Slack message IDs or file IDs.
+            known: Fingerprints, from fingerprints(), of messages or files
+                already loaded. Sources whose fingerprint is in the set are skipped.
             **kwargs: Additional arguments passed to load().
         
         Returns:
             List[Dict[str, Any]]: List of loaded documents.
         """
-        documents = []
+        sources = self._unknown_sources(sources, known, **kwargs)
+        if kwargs.get('is_file', False) or len(sources) < 2 or not kwargs.get('channel_id'):
+            documents = [self.load(source, **kwargs) for source in sources]
+        else:
+            documents = self._load_message_batch(sources, kwargs['channel_id'], kwargs.get('include_thread', True))
         
-        for source in sources:
-            document = self.load(source, **kwargs)
-            documents.append(document)
+        logger.info("Loaded Slack content", count=len(documents), is_file=kwargs.get('is_file', False))
+        return documents
+    
+    async def aload(self, source: str, **kwargs) -> Dict[str, Any]:
+        """
+        Load a document from a Slack message or file without blocking the event loop.
+        
+        Messages are fetched with the async Slack client. Files are downloaded
+        and parsed by load() on a worker thread.
+        
+        Args:
+            source: Slack message ID or file ID.
+            **kwargs: Additional arguments, as for load().
+        
+        Returns:
+            Dict[str, Any]: The loaded document.
+        """
+        channel_id = kwargs.get('channel_id')
+        include_thread = kwargs.get('include_thread', True)
+        
+        if not channel_id:
+            raise ValueError("channel_id is required for Slack loader")
+        
+        if kwargs.get('is_file', False):
+            return await asyncio.to_thread(self.load, source, **kwargs)
         
-        logger.info(f"Loaded {len(documents)} Slack {'files' if kwargs.get('is_file', False) else 'messages'}")
+        try:
+            from slack_sdk.web.async_client import AsyncWebClient
+            
+            client = AsyncWebClient(token=self.slack_bot_token)
+            return await self._aload_message(client, source, channel_id, include_thread)
+        except ImportError:
+            logger.error("slack_sdk not installed, cannot load Slack messages or files")
+            raise ImportError("slack_sdk not installed, cannot load Slack messages or files")
+        except Exception as e:
+            logger.error("Error loading Slack content", source=source, is_file=False, error=str(e))
+            return self._error_document(source, channel_id, e)
+    
+    async def aload_batch(self, sources: List[str], known: Optional[Set[str]] = None, **kwargs) -> List[Dict[str, Any]]:
+        """
+        Load multiple documents from Slack messages or files without blocking the event loop.
+        
+        Sources are loaded concurrently, at most SLACK_CONCURRENCY at a time.
+        Messages from the same channel are fetched together, as in load_batch().
+        
+        Args:
+            sources: List of Slack message IDs or file IDs.
+            known: Fingerprints, from fingerprints(), of messages or files
+                already loaded. Sources whose fingerprint is in the set are skipped.
+            **kwargs: Additional arguments passed to aload().
+        
+        Returns:
+            List[Dict[str, Any]]: List of loaded documents, in the order of sources.
+        """
+        sources = self._unknown_sources(sources, known, **kwargs)
+        if kwargs.get('is_file', False) or not kwargs.get('channel_id'):
+            semaphore = asyncio.Semaphore(SLACK_CONCURRENCY)
+            
+            async def load(source: str) -> Dict[str, Any]:
+                async with semaphore:
+                    return await self.aload(source, **kwargs)
+            
+            documents = list(await asyncio.gather(*(load(source) for source in sources)))
+        else:
+            documents = await self._aload_message_batch(sources, kwargs['channel_id'], kwargs.get('include_thread', True))
+        
+        logger.info("Loaded Slack content", count=len(documents), is_file=kwargs.get('is_file', False))
         return documents
     
+    def fingerprints(self, sources: List[str], **kwargs) -> Dict[str, str]:
+        """
+        Get fingerprints of Slack messages or files from their channel and ID.
+        
+        Message timestamps and file IDs don't change, so edits to a message
+        already loaded are not picked up.
+        
+        Args:
+            sources: List of Slack message IDs or file IDs.
+            **kwargs: Additional arguments, including channel_id.
+        
+        Returns:
+            Dict[str, str]: Fingerprints by source.
+        """
+        channel_id = kwargs.get('channel_id', '')
+        return {source: f"{channel_id}:{source}" for source in sources}
+    
     def supports(self, source_type: str) -> bool:
         """
         Check if the loader supports a source type.
@@ -114,24 +234,223 @@ class SlackLoader(DocumentLoader):
         """
         return source_type.lower() in ['slack', 'slack_message', 'slack_file']
     
-    def _load_message(self, client, message_ts: str, channel_id: str, include_thread: bool) -> Dict[str, Any]:
+    def _load_message_batch(self, sources: List[str], channel_id: str, include_thread: bool) -> List[Dict[str, Any]]:
         """
-        Load a Slack message.
+        Load several Slack messages from one channel.
+        
+        Args:
+            sources: Slack message timestamps.
+            channel_id: Slack channel ID.
+            include_thread: Whether to include thread replies.
+        
+        Returns:
+            List[Dict[str, Any]]: The loaded documents, in the order of sources.
+        """
+        try:
+            from slack_sdk import WebClient
+            
+            client = WebClient(token=self.slack_bot_token)
+            # Slack timestamps are decimal strings, so compare them as numbers
+            messages = self._fetch_history(client, channel_id, min(sources, key=float), max(sources, key=float))
+        except Exception as e:
+            logger.warning("Falling back to loading Slack messages one at a time", channel_id=channel_id, error=str(e))
+            return [self.load(source, channel_id=channel_id, include_thread=include_thread) for source in sources]
+        
+        documents = []
+        for source in sources:
+            message = messages.get(source)
+            if message is None:
+                # Not in the channel's history, e.g. a thread reply; load it on its own
+                documents.append(self.load(source, channel_id=channel_id, include_thread=include_thread))
+                continue
+            try:
+                documents.append(self._load_message(client, source, channel_id, include_thread, message))
+            except Exception as e:
+                logger.error("Error loading Slack content", source=source, is_file=False, error=str(e))
+                documents.append(self._error_document(source, channel_id, e))
+        return documents
+    
+    def _fetch_history(self, client, channel_id: str, oldest: str, latest: str) -> Dict[str, Dict[str, Any]]:
+        """
+        Fetch a channel's messages between two timestamps, inclusive.
         
         Args:
             client: Slack WebClient.
-            message_ts: Slack message timestamp.
+            channel_id: Slack channel ID.
+            oldest: Timestamp of the oldest message to fetch.
+            latest: Timestamp of the latest message to fetch.
+        
+        Returns:
+            Dict[str, Dict[str, Any]]: The messages, keyed by timestamp.
+        """
+        messages = {}
+        cursor = None
+        while True:
+            response = client.conversations_history(
+                channel=channel_id,
+                oldest=oldest,
+                latest=latest,
+                inclusive=True,
+                limit=HISTORY_PAGE_SIZE,
+                cursor=cursor
+            )
+            for message in response['messages']:
+                messages[message['ts']] = message
+            cursor = (response.get('response_metadata') or {}).get('next_cursor')
+            if not cursor:
+                return messages
+    
+    def _get_user_name(self, client, user_id: str) -> str:
+        """
+        Get a user's display name, looking it up once per user.
+        
+        Args:
+            client: Slack WebClient.
+            user_id: Slack user ID.
+        
+        Returns:
+            str: The user's real name, or their username if it isn't set.
+        """
+        user_name = self._user_names.get(user_id)
+        if user_name is None:
+            user_info = client.users_info(user=user_id)
+            user_name = user_info['user'].get('real_name', user_info['user'].get('name', 'Unknown'))
+            with self._user_names_lock:
+                self._user_names[user_id] = user_name
+        return user_name
+    
+    def _prefetch_user_names(self, client, user_ids: Set[str]) -> None:
+        """
+        Look up the display names of several users concurrently.
+        
+        Args:
+            client: Slack WebClient.
+            user_ids: Slack user IDs.
+        """
+        missing = [user_id for user_id in user_ids if user_id not in self._user_names]
+        if len(missing) < 2:
+            return
+        with ThreadPoolExecutor(max_workers=min(SLACK_CONCURRENCY, len(missing))) as executor:
+            list(executor.map(lambda user_id: self._get_user_name(client, user_id), missing))
+    
+    async def _aload_message_batch(self, sources: List[str], channel_id: str,
+                                   include_thread: bool) -> List[Dict[str, Any]]:
+        """
+        Load several Slack messages from one channel with the async Slack client.
+        
+        Args:
+            sources: Slack message timestamps.
             channel_id: Slack channel ID.
             include_thread: Whether to include thread replies.
         
         Returns:
-            Dict[str, Any]: The loaded document.
+            List[Dict[str, Any]]: The loaded documents, in the order of sources.
         """
-        from slack_sdk.errors import SlackApiError
+        if not sources:
+            return []
         
+        from slack_sdk.web.async_client import AsyncWebClient
+        
+        client = AsyncWebClient(token=self.slack_bot_token)
         try:
-            # Get message
-            response = client.conversations_history(
+            messages = await self._afetch_history(client, channel_id, min(sources, key=float), max(sources, key=float))
+        except Exception as e:
+            logger.warning("Falling back to loading Slack messages one at a time", channel_id=channel_id, error=str(e))
+            messages = {}
+        
+        semaphore = asyncio.Semaphore(SLACK_CONCURRENCY)
+        
+        async def load(source: str) -> Dict[str, Any]:
+            async with semaphore:
+                message = messages.get(source)
+                if message is None:
+                    return await self.aload(source, channel_id=channel_id, include_thread=include_thread)
+                try:
+                    return await self._aload_message(client, source, channel_id, include_thread, message)
+                except Exception as e:
+                    logger.error("Error loading Slack content", source=source, is_file=False, error=str(e))
+                    return self._error_document(source, channel_id, e)
+        
+        return list(await asyncio.gather(*(load(source) for source in sources)))
+    
+    async def _afetch_history(self, client, channel_id: str, oldest: str, latest: str) -> Dict[str, Dict[str, Any]]:
+        """
+        Fetch a channel's messages between two timestamps, inclusive, with the async Slack client.
+        
+        Args:
+            client: Slack AsyncWebClient.
+            channel_id: Slack channel ID.
+            oldest: Timestamp of the oldest message to fetch.
+            latest: Timestamp of the latest message to fetch.
+        
+        Returns:
+            Dict[str, Dict[str, Any]]: The messages, keyed by timestamp.
+        """
+        messages = {}
+        cursor = None
+        while True:
+            response = await client.conversations_history(
+                channel=channel_id,
+                oldest=oldest,
+                latest=latest,
+                inclusive=True,
+                limit=HISTORY_PAGE_SIZE,
+                cursor=cursor
+            )
+            for message in response['messages']:
+                messages[message['ts']] = message
+            cursor = (response.get('response_metadata') or {}).get('next_cursor')
+            if not cursor:
+                return messages
+    
+    async def _aget_user_name(self, client, user_id: str) -> str:
+        """
+        Get a user's display name with the async Slack client, looking it up once per user.
+        
+        Args:
+            client: Slack AsyncWebClient.
+            user_id: Slack user ID.
+        
+        Returns:
+            str: The user's real name, or their username if it isn't set.
+        """
+        user_name = self._user_names.get(user_id)
+        if user_name is None:
+            user_info = await client.users_info(user=user_id)
+            user_name = user_info['user'].get('real_name', user_info['user'].get('name', 'Unknown'))
+            with self._user_names_lock:
+                self._user_names[user_id] = user_name
+        return user_name
+    
+    async def _aprefetch_user_names(self, client, user_ids: Set[str]) -> None:
+        """
+        Look up the display names of several users concurrently with the async Slack client.
+        
+        Args:
+            client: Slack AsyncWebClient.
+            user_ids: Slack user IDs.
+        """
+        missing = [user_id for user_id in user_ids if user_id not in self._user_names]
+        if len(missing) > 1:
+            await asyncio.gather(*(self._aget_user_name(client, user_id) for user_id in missing))
+    
+    async def _aload_message(self, client, message_ts: str, channel_id: str, include_thread: bool,
+                             message: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+        """
+        Load a Slack message with the async Slack client.
+        
+        Args:
+            client: Slack AsyncWebClient.
+            message_ts: Slack message timestamp.
+            channel_id: Slack channel ID.
+            include_thread: Whether to include thread replies.
+            message: The message, if it was already fetched.
+        
+        Returns:
+            Dict[str, Any]: The loaded document.
+        """
+        if message is None:
+            response = await client.conversations_history(
                 channel=channel_id,
                 latest=message_ts,
                 limit=1,
@@ -142,7 +461,106 @@ class SlackLoader(DocumentLoader):
                 raise ValueError(f"Message not found: {message_ts}")
             
             message = response['messages'][0]
-            text = message.get('text', '')
+        
+        thread_text = ""
+        if include_thread and message.get('thread_ts'):
+            thread_response = await client.conversations_replies(
+                channel=channel_id,
+                ts=message.get('thread_ts'),
+                limit=100
+            )
+            replies = self._thread_replies(thread_response['messages'], message_ts)
+            await self._aprefetch_user_names(client, {reply.get('user', '') for reply in replies} | {message.get('user', '')})
+            for reply in replies:
+                user_name = await self._aget_user_name(client, reply.get('user', ''))
+                thread_text += f"{user_name}: {reply.get('text', '')}\n\n"
+        
+        user_name = await self._aget_user_name(client, message.get('user', ''))
+        return self._message_document(message, message_ts, channel_id, user_name, thread_text)
+    
+    def _thread_replies(self, replies: List[Dict[str, Any]], message_ts: str) -> List[Dict[str, Any]]:
+        """
+        Get a thread's replies, without the message that started it.
+        
+        Args:
+            replies: Messages from conversations.replies.
+            message_ts: Slack message timestamp.
+        
+        Returns:
+            List[Dict[str, Any]]: The replies.
+        """
+        # Skip the first message if it's the same as the main message
+        start_idx = 1 if replies[0].get('ts') == message_ts else 0
+        return replies[start_idx:]
+    
+    def _message_document(self, message: Dict[str, Any], message_ts: str, channel_id: str,
+                          user_name: str, thread_text: str) -> Dict[str, Any]:
+        """
+        Build the document for a Slack message.
+        
+        Args:
+            message: The message.
+            message_ts: Slack message timestamp.
+            channel_id: Slack channel ID.
+            user_name: Display name of the message's author.
+            thread_text: Formatted thread replies, or an empty string.
+        
+        Returns:
+            Dict[str, Any]: The loaded document.
+        """
+        text = message.get('text', '')
+        
+        # Combine main message and thread
+        if thread_text:
+            text += f"\n\nThread replies:\n{thread_text}"
+        
+        # Generate document ID
+        doc_id = f"slack_msg_{hashlib.md5((channel_id + message_ts).encode()).hexdigest()}"
+        
+        return {
+            'id': doc_id,
+            'text': text,
+            'metadata': {
+                'source': message_ts,
+                'channel_id': channel_id,
+                'user': user_name,
+                'timestamp': message.get('ts', ''),
+                'has_thread': bool(thread_text),
+                'source_type': 'slack'
+            }
+        }
+    
+    def _load_message(self, client, message_ts: str, channel_id: str, include_thread: bool,
+                      message: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+        """
+        Load a Slack message.
+        
+        Args:
+            client: Slack WebClient.
+            message_ts: Slack message timestamp.
+            channel_id: Slack channel ID.
+            include_thread: Whether to include thread replies.
+            message: The message, if it was already fetched.
+        
+        Returns:
+            Dict[str, Any]: The loaded document.
+        """
+        from slack_sdk.errors import SlackApiError
+        
+        try:
+            if message is None:
+                # Get message
+                response = client.conversations_history(
+                    channel=channel_id,
+                    latest=message_ts,
+                    limit=1,
+                    inclusive=True
+                )
+                
+                if not response['messages']:
+                    raise ValueError(f"Message not found: {message_ts}")
+                
+                message = response['messages'][0]
             
             # Get thread replies if requested
             thread_text = ""
@@ -153,41 +571,41 @@ class SlackLoader(DocumentLoader):
                     limit=100
                 )
                 
-                # Skip the first message if it's the same as the main message
-                start_idx = 1 if thread_response['messages'][0].get('ts') == message_ts else 0
-                
-                for reply in thread_response['messages'][start_idx:]:
-                    user_info = client.users_info(user=reply.get('user', ''))
-                    user_name = user_info['user'].get('real_name', user_info['user'].get('name', 'Unknown'))
+                replies = self._thread_replies(thread_response['messages'], message_ts)
+                # Look up every author in the thread at once rather than one reply at a time
+                self._prefetch_user_names(client, {reply.get('user', '') for reply in replies} | {message.get('user', '')})
+                for reply in replies:
+                    user_name = self._get_user_name(client, reply.get('user', ''))
                     thread_text += f"{user_name}: {reply.get('text', '')}\n\n"
             
-            # Combine main message and thread
-            if thread_text:
-                text += f"\n\nThread replies:\n{thread_text}"
-            
             # Get user info
-            user_info = client.users_info(user=message.get('user', ''))
-            user_name = user_info['user'].get('real_name', user_info['user'].get('name', 'Unknown'))
+            user_name = self._get_user_name(client, message.get('user', ''))
             
-            # Generate document ID
-            doc_id = f"slack_msg_{hashlib.md5((channel_id + message_ts).encode()).hexdigest()}"
-            
-            return {
-                'id': doc_id,
-                'text': text,
-                'metadata': {
-                    'source': message_ts,
-                    'channel_id': channel_id,
-                    'user': user_name,
-                    'timestamp': message.get('ts', ''),
-                    'has_thread': bool(thread_text),
-                    'source_type': 'slack'
-                }
-            }
+            return self._message_document(message, message_ts, channel_id, user_name, thread_text)
         except SlackApiError as e:
-            logger.error(f"Slack API error: {str(e)}")
+            logger.error("Slack API error", error=str(e))
             raise
     
+    def _file_name(self, file_id: str, file_data: Dict[str, Any]) -> str:
+        """
+        Get the name FileLoader picks a Slack file's loader by.
+        
+        Uses the uploaded file's name, or adds an extension for Slack's file
+        type when the name has no supported extension.
+        
+        Args:
+            file_id: Slack file ID.
+            file_data: The file's info from files.info.
+        
+        Returns:
+            str: The file name.
+        """
+        name = file_data.get('name') or file_id
+        if self.file_loader.supports(os.path.splitext(name)[1]):
+            return name
+        filetype = file_data.get('filetype') or 'text'
+        return name + FILETYPE_EXTENSIONS.get(filetype, f".{filetype}")
+    
     def _load_file(self, client, file_id: str, channel_id: str) -> Dict[str, Any]:
         """
         Load a Slack file.
@@ -200,6 +618,7 @@ class SlackLoader(DocumentLoader):
         Returns:
             Dict[str, Any]: The loaded document.
         """
+        import requests
         from slack_sdk.errors import SlackApiError
         
         try:
@@ -207,15 +626,16 @@ class SlackLoader(DocumentLoader):
             file_info = client.files_info(file=file_id)
             file_data = file_info['file']
             
-            # Create temporary file
-            with tempfile.NamedTemporaryFile(delete=False, suffix=f".{file_data.get('filetype', 'txt')}") as temp_file:
-                temp_path = temp_file.name
-            
-            # Download file
-            client.files_download(file=file_id, filename=temp_path)
+            # Download file into memory
+            response = requests.get(
+                file_data['url_private_download'],
+                headers={'Authorization': f"Bearer {self.slack_bot_token}"},
+                timeout=DOWNLOAD_TIMEOUT
+            )
+            response.raise_for_status()
             
             # Load file using FileLoader
-            document = self.file_loader.load(temp_path)
+            document = self.file_loader.load_bytes(response.content, self._file_name(file_id, file_data))
             
             # Add Slack-specific metadata
             document['metadata'].update({
@@ -232,10 +652,7 @@ class SlackLoader(DocumentLoader):
             doc_id = f"slack_file_{hashlib.md5((channel_id + file_id).encode()).hexdigest()}"
             document['id'] = doc_id
             
-            # Clean up temporary file
-            os.remove(temp_path)
-            
             return document
         except SlackApiError as e:
-            logger.error(f"Slack API error: {str(e)}")
+            logger.error("Slack API error", error=str(e))
             raise
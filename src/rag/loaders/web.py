@@ -3,7 +3,7 @@ import requests
 from bs4 import BeautifulSoup
 import time
 import hashlib
-from typing import Dict, List, Any, Optional, Union
+from typing import Dict, List, Any, Optional, Set, Union
 from urllib.parse import urlparse
 from src.rag.loaders.base import DocumentLoader
 
@@ -27,7 +27,7 @@ class WebLoader(DocumentLoader):
         """
         self.timeout = timeout
         self.user_agent = user_agent or 'CrewAI RAG WebLoader/1.0'
-        logger.info(f"Initialized WebLoader with timeout={timeout}")
+        logger.info("Initialized WebLoader", timeout=timeout)
     
     def load(self, source: str, **kwargs) -> Dict[str, Any]:
         """
@@ -44,6 +44,8 @@ class WebLoader(DocumentLoader):
         """
         include_images = kwargs.get('include_images', False)
         extract_links = kwargs.get('extract_links', False)
+        # Generate document ID
+        doc_id = f"web_{hashlib.md5(source.encode()).hexdigest()}"
         
         try:
             # Validate URL
@@ -109,20 +111,17 @@ class WebLoader(DocumentLoader):
                     metadata['links'] = links
                     metadata['link_count'] = len(links)
             
-            # Generate document ID
-            doc_id = f"web_{hashlib.md5(source.encode()).hexdigest()}"
-            
-            logger.info(f"Loaded web page: {source}")
+            logger.info("Loaded web page", source=source)
             return {
                 'id': doc_id,
                 'text': text,
                 'metadata': metadata
             }
         except Exception as e:
-            logger.error(f"Error loading web page: {source}", error=str(e))
+            logger.error("Error loading web page", source=source, error=str(e))
             # Return empty document with error metadata
             return {
-                'id': f"web_{hashlib.md5(source.encode()).hexdigest()}",
+                'id': doc_id,
                 'text': '',
                 'metadata': {
                     'source': source,
@@ -131,17 +130,20 @@ class WebLoader(DocumentLoader):
                 }
             }
     
-    def load_batch(self, sources: List[str], **kwargs) -> List[Dict[str, Any]]:
+    def load_batch(self, sources: List[str], known: Optional[Set[str]] = None, **kwargs) -> List[Dict[str, Any]]:
         """
         Load multiple documents from URLs.
         
         Args:
             sources: List of URLs to load.
+            known: Fingerprints of pages already loaded. Web pages have no
+                fingerprint, so every URL is loaded.
             **kwargs: Additional arguments passed to load().
         
         Returns:
             List[Dict[str, Any]]: List of loaded documents.
         """
+        sources = self._unknown_sources(sources, known)
         documents = []
         
         for source in sources:
@@ -152,7 +154,7 @@ class WebLoader(DocumentLoader):
             document = self.load(source, **kwargs)
             documents.append(document)
         
-        logger.info(f"Loaded {len(documents)} web pages")
+        logger.info("Loaded web pages", count=len(documents))
         return documents
     
     def supports(self, source_type: str) -> bool:
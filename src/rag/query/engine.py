@@ -76,7 +76,7 @@ class RAGQueryEngine:
         # Enhance context
         enhanced_context = self.context_enhancer.enhance(query_text, top_results)
         
-        logger.info(f"Query returned {len(top_results)} results")
+        logger.info("Query returned results", count=len(top_results))
         return {
             'query': query_text,
             'processed_query': processed_query,
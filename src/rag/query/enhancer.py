@@ -19,7 +19,7 @@ class ContextEnhancer:
             max_context_length: Maximum length of the enhanced context in characters.
         """
         self.max_context_length = max_context_length
-        logger.info(f"Initialized ContextEnhancer with max_context_length={max_context_length}")
+        logger.info("Initialized ContextEnhancer", max_context_length=max_context_length)
     
     def enhance(self, query: str, retrieved_docs: List[Dict[str, Any]]) -> str:
         """
@@ -74,7 +74,7 @@ class ContextEnhancer:
             
             context += doc_info
         
-        logger.debug(f"Enhanced context with {len(retrieved_docs)} documents")
+        logger.debug("Enhanced context", documents=len(retrieved_docs))
         return context
     
     def format_for_llm(self, enhanced_context: str, system_prompt: Optional[str] = None) -> Dict[str, str]:
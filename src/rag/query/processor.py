@@ -20,7 +20,7 @@ class QueryProcessor:
             expand_queries: Whether to expand queries with variations.
         """
         self.expand_queries = expand_queries
-        logger.info(f"Initialized QueryProcessor with expand_queries={expand_queries}")
+        logger.info("Initialized QueryProcessor", expand_queries=expand_queries)
     
     def process_query(self, query: str) -> str:
         """
@@ -44,7 +44,7 @@ class QueryProcessor:
         # Convert to lowercase
         processed_query = processed_query.lower()
         
-        logger.debug(f"Processed query: {processed_query}")
+        logger.debug("Processed query", query=processed_query)
         return processed_query
     
     def expand_query(self, query: str) -> List[str]:
@@ -93,5 +93,5 @@ class QueryProcessor:
         # Remove duplicates
         expanded_queries = list(dict.fromkeys(expanded_queries))
         
-        logger.debug(f"Expanded query to {len(expanded_queries)} variations")
+        logger.debug("Expanded query", variations=len(expanded_queries))
         return expanded_queries
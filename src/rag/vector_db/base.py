@@ -1,5 +1,6 @@
 from abc import ABC, abstractmethod
 from typing import Dict, List, Any, Optional, Union
+import numpy as np
 
 class VectorDBConnector(ABC):
     """
@@ -31,7 +32,8 @@ class VectorDBConnector(ABC):
         pass
     
     @abstractmethod
-    def store_embeddings(self, documents: List[Dict[str, Any]]) -> List[str]:
+    def store_embeddings(self, documents: List[Dict[str, Any]],
+                         embeddings: Optional[np.ndarray] = None) -> List[str]:
         """
         Store document embeddings in the vector database.
         
@@ -39,9 +41,10 @@ class VectorDBConnector(ABC):
             documents: List of documents with embeddings to store.
                 Each document should be a dictionary with at least:
                 - 'id': Unique identifier for the document
-                - 'embedding': Vector embedding of the document
+                - 'embedding': Vector embedding of the document, unless embeddings is given
                 - 'metadata': Dictionary of metadata about the document
                 - 'text': Original text of the document
+            embeddings: Optional array of the documents' embeddings, one row per document.
         
         Returns:
             List[str]: List of document IDs that were successfully stored.
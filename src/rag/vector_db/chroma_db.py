@@ -2,6 +2,7 @@ import structlog
 import uuid
 import os
 from typing import Dict, List, Any, Optional, Union
+import numpy as np
 import chromadb
 from chromadb.config import Settings as ChromaSettings
 from src.rag.vector_db.base import VectorDBConnector
@@ -55,12 +56,12 @@ class ChromaConnector(VectorDBConnector):
             # Get or create collection
             try:
                 self.collection = self.client.get_collection(name=self.collection_name)
-                logger.info(f"Connected to existing Chroma collection: {self.collection_name}")
+                logger.info("Connected to existing Chroma collection", collection=self.collection_name)
             except Exception as e:
-                logger.info(f"Collection {self.collection_name} does not exist, creating it")
+                logger.info("Chroma collection does not exist, creating it", collection=self.collection_name)
                 # Collection doesn't exist, create it
                 self.collection = self.client.create_collection(name=self.collection_name)
-                logger.info(f"Created new Chroma collection: {self.collection_name}")
+                logger.info("Created new Chroma collection", collection=self.collection_name)
             
             self.is_connected = True
             return True
@@ -87,7 +88,8 @@ class ChromaConnector(VectorDBConnector):
             logger.error("Failed to disconnect from Chroma", error=str(e))
             return False
     
-    def store_embeddings(self, documents: List[Dict[str, Any]]) -> List[str]:
+    def store_embeddings(self, documents: List[Dict[str, Any]],
+                         embeddings: Optional[np.ndarray] = None) -> List[str]:
         """
         Store document embeddings in Chroma.
         
@@ -95,9 +97,11 @@ class ChromaConnector(VectorDBConnector):
             documents: List of documents with embeddings to store.
                 Each document should be a dictionary with at least:
                 - 'id': Unique identifier for the document (optional, will be generated if not provided)
-                - 'embedding': Vector embedding of the document
+                - 'embedding': Vector embedding of the document, unless embeddings is given
                 - 'metadata': Dictionary of metadata about the document
                 - 'text': Original text of the document
+            embeddings: Optional array of the documents' embeddings, one row per document.
+                Passed to Chroma as is.
         
         Returns:
             List[str]: List of document IDs that were successfully stored.
@@ -110,7 +114,7 @@ class ChromaConnector(VectorDBConnector):
         try:
             # Prepare data for Chroma
             ids = []
-            embeddings = []
+            document_embeddings = []
             metadatas = []
             documents_text = []
             
@@ -120,7 +124,8 @@ class ChromaConnector(VectorDBConnector):
                 ids.append(doc_id)
                 
                 # Get embedding
-                embeddings.append(doc['embedding'])
+                if embeddings is None:
+                    document_embeddings.append(doc['embedding'])
                 
                 # Prepare metadata
                 metadata = doc.get('metadata', {})
@@ -132,12 +137,12 @@ class ChromaConnector(VectorDBConnector):
             # Add documents to collection
             self.collection.add(
                 ids=ids,
-                embeddings=embeddings,
+                embeddings=embeddings if embeddings is not None else document_embeddings,
                 metadatas=metadatas,
                 documents=documents_text
             )
             
-            logger.info(f"Stored {len(ids)} embeddings in Chroma")
+            logger.info("Stored embeddings in Chroma", count=len(ids))
             return ids
         except Exception as e:
             logger.error("Failed to store embeddings in Chroma", error=str(e))
@@ -179,7 +184,7 @@ class ChromaConnector(VectorDBConnector):
                     'text': results['documents'][0][i]
                 })
             
-            logger.info(f"Query returned {len(formatted_results)} results from Chroma")
+            logger.info("Chroma query returned results", count=len(formatted_results))
             return formatted_results
         except Exception as e:
             logger.error("Failed to query Chroma", error=str(e))
@@ -202,10 +207,10 @@ class ChromaConnector(VectorDBConnector):
         
         try:
             self.collection.delete(ids=[doc_id])
-            logger.info(f"Deleted document {doc_id} from Chroma")
+            logger.info("Deleted document from Chroma", doc_id=doc_id)
             return True
         except Exception as e:
-            logger.error(f"Failed to delete document {doc_id} from Chroma", error=str(e))
+            logger.error("Failed to delete document from Chroma", doc_id=doc_id, error=str(e))
             return False
     
     def get_document(self, doc_id: str) -> Optional[Dict[str, Any]]:
@@ -231,7 +236,7 @@ class ChromaConnector(VectorDBConnector):
             )
             
             if not result['ids']:
-                logger.warning(f"Document {doc_id} not found in Chroma")
+                logger.warning("Document not found in Chroma", doc_id=doc_id)
                 return None
             
             return {
@@ -241,7 +246,7 @@ class ChromaConnector(VectorDBConnector):
                 'text': result['documents'][0]
             }
         except Exception as e:
-            logger.error(f"Failed to get document {doc_id} from Chroma", error=str(e))
+            logger.error("Failed to get document from Chroma", doc_id=doc_id, error=str(e))
             return None
     
     def list_collections(self) -> List[str]:
@@ -258,7 +263,7 @@ class ChromaConnector(VectorDBConnector):
         try:
             collections = self.client.list_collections()
             collection_names = [collection.name for collection in collections]
-            logger.info(f"Listed {len(collection_names)} collections in Chroma")
+            logger.info("Listed Chroma collections", count=len(collection_names))
             return collection_names
         except Exception as e:
             logger.error("Failed to list collections in Chroma", error=str(e))
@@ -1,5 +1,6 @@
 import structlog
 from typing import Dict, Optional, Type, Any
+import numpy as np
 from src.rag.vector_db.base import VectorDBConnector
 from src.rag.vector_db.pinecone_db import PineconeConnector
 from src.rag.vector_db.chroma_db import ChromaConnector
@@ -63,7 +64,7 @@ class VectorDBManager:
             bool: True if switch was successful, False otherwise.
         """
         if db_type not in self.connectors:
-            logger.error(f"Unknown vector database type: {db_type}")
+            logger.error("Unknown vector database type", db_type=db_type)
             return False
         
         # Disconnect from current connector if it exists
@@ -79,10 +80,10 @@ class VectorDBManager:
             # Connect to the new database
             success = self.current_connector.connect()
             if success:
-                logger.info(f"Switched to vector database: {db_type}")
+                logger.info("Switched vector database", db_type=db_type)
                 return True
             else:
-                logger.error(f"Failed to connect to vector database: {db_type}")
+                logger.error("Failed to connect to vector database", db_type=db_type)
                 
                 # If Pinecone fails, try to fall back to ChromaDB
                 if db_type == 'pinecone':
@@ -91,7 +92,7 @@ class VectorDBManager:
                 
                 return False
         except Exception as e:
-            logger.error(f"Error switching to vector database: {db_type}", error=str(e))
+            logger.error("Error switching vector database", db_type=db_type, error=str(e))
             
             # If Pinecone fails with an exception, try to fall back to ChromaDB
             if db_type == 'pinecone':
@@ -99,7 +100,7 @@ class VectorDBManager:
                 try:
                     return self.switch_db('chroma')
                 except Exception as fallback_e:
-                    logger.error(f"Failed to fall back to ChromaDB: {str(fallback_e)}")
+                    logger.error("Failed to fall back to ChromaDB", error=str(fallback_e))
                     return False
             
             return False
@@ -122,12 +123,13 @@ class VectorDBManager:
         """
         return self.db_type
     
-    def store_embeddings(self, documents: list) -> list:
+    def store_embeddings(self, documents: list, embeddings: Optional[np.ndarray] = None) -> list:
         """
         Store document embeddings in the current vector database.
         
         Args:
             documents: List of documents with embeddings to store.
+            embeddings: Optional array of the documents' embeddings, one row per document.
         
         Returns:
             list: List of document IDs that were successfully stored.
@@ -136,7 +138,7 @@ class VectorDBManager:
             logger.error("No vector database connector available")
             return []
         
-        return self.current_connector.store_embeddings(documents)
+        return self.current_connector.store_embeddings(documents, embeddings)
     
     def query(self, query_embedding: list, top_k: int = 5, filter: Optional[Dict[str, Any]] = None) -> list:
         """
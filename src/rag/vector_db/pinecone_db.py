@@ -2,6 +2,7 @@ import structlog
 import time
 import uuid
 from typing import Dict, List, Any, Optional, Union
+import numpy as np
 from pinecone import Pinecone
 from src.rag.vector_db.base import VectorDBConnector
 from src.config.settings import Settings
@@ -57,23 +58,23 @@ class PineconeConnector(VectorDBConnector):
                 logger.info("Listing Pinecone indexes")
                 indexes = self.pc.list_indexes()
                 index_names = [index.name for index in indexes]
-                logger.info(f"Available Pinecone indexes: {index_names}")
+                logger.info("Available Pinecone indexes", indexes=index_names)
                 
                 # Check if index exists
                 if self.index_name not in index_names:
-                    logger.error(f"Pinecone index {self.index_name} does not exist")
+                    logger.error("Pinecone index does not exist", index=self.index_name)
                     self.is_connected = False
                     return False
                 
                 # Get the index configuration
                 index_info = next((idx for idx in indexes if idx.name == self.index_name), None)
                 if not index_info:
-                    logger.error(f"Could not find index info for {self.index_name}")
+                    logger.error("Could not find Pinecone index info", index=self.index_name)
                     self.is_connected = False
                     return False
                 
                 # Connect to the index
-                logger.info(f"Connecting to Pinecone index: {self.index_name}")
+                logger.info("Connecting to Pinecone index", index=self.index_name)
                 self.index = self.pc.Index(host=index_info.host)
                 self.is_connected = True
                 logger.info("Connected to Pinecone", index=self.index_name)
@@ -105,7 +106,8 @@ class PineconeConnector(VectorDBConnector):
             logger.error("Failed to disconnect from Pinecone", error=str(e))
             return False
     
-    def store_embeddings(self, documents: List[Dict[str, Any]]) -> List[str]:
+    def store_embeddings(self, documents: List[Dict[str, Any]],
+                         embeddings: Optional[np.ndarray] = None) -> List[str]:
         """
         Store document embeddings in Pinecone.
         
@@ -113,9 +115,10 @@ class PineconeConnector(VectorDBConnector):
             documents: List of documents with embeddings to store.
                 Each document should be a dictionary with at least:
                 - 'id': Unique identifier for the document (optional, will be generated if not provided)
-                - 'embedding': Vector embedding of the document
+                - 'embedding': Vector embedding of the document, unless embeddings is given
                 - 'metadata': Dictionary of metadata about the document
                 - 'text': Original text of the document
+            embeddings: Optional array of the documents' embeddings, one row per document.
         
         Returns:
             List[str]: List of document IDs that were successfully stored.
@@ -130,7 +133,7 @@ class PineconeConnector(VectorDBConnector):
             vectors = []
             doc_ids = []
             
-            for doc in documents:
+            for i, doc in enumerate(documents):
                 # Generate ID if not provided
                 doc_id = doc.get('id', str(uuid.uuid4()))
                 doc_ids.append(doc_id)
@@ -156,10 +159,13 @@ class PineconeConnector(VectorDBConnector):
                 if 'text' in doc and doc['text']:
                     flattened_metadata['text'] = doc['text']
                 
-                # Create vector
+                # Create vector; Pinecone's client needs plain lists
+                embedding = doc['embedding'] if embeddings is None else embeddings[i]
+                if isinstance(embedding, np.ndarray):
+                    embedding = embedding.tolist()
                 vector = {
                     'id': doc_id,
-                    'values': doc['embedding'],
+                    'values': embedding,
                     'metadata': flattened_metadata
                 }
                 vectors.append(vector)
@@ -173,7 +179,7 @@ class PineconeConnector(VectorDBConnector):
                     namespace="default"
                 )
             
-            logger.info(f"Stored {len(vectors)} embeddings in Pinecone")
+            logger.info("Stored embeddings in Pinecone", count=len(vectors))
             return doc_ids
         except Exception as e:
             logger.error("Failed to store embeddings in Pinecone", error=str(e))
@@ -222,7 +228,7 @@ class PineconeConnector(VectorDBConnector):
                     'text': text
                 })
             
-            logger.info(f"Query returned {len(formatted_results)} results from Pinecone")
+            logger.info("Pinecone query returned results", count=len(formatted_results))
             return formatted_results
         except Exception as e:
             logger.error("Failed to query Pinecone", error=str(e))
@@ -248,10 +254,10 @@ class PineconeConnector(VectorDBConnector):
                 ids=[doc_id],
                 namespace="default"
             )
-            logger.info(f"Deleted document {doc_id} from Pinecone")
+            logger.info("Deleted document from Pinecone", doc_id=doc_id)
             return True
         except Exception as e:
-            logger.error(f"Failed to delete document {doc_id} from Pinecone", error=str(e))
+            logger.error("Failed to delete document from Pinecone", doc_id=doc_id, error=str(e))
             return False
     
     def get_document(self, doc_id: str) -> Optional[Dict[str, Any]]:
@@ -293,10 +299,10 @@ class PineconeConnector(VectorDBConnector):
                     }
             
             # If we get here, we couldn't find the document
-            logger.warning(f"Document {doc_id} not found in Pinecone")
+            logger.warning("Document not found in Pinecone", doc_id=doc_id)
             return None
         except Exception as e:
-            logger.error(f"Failed to get document {doc_id} from Pinecone", error=str(e))
+            logger.error("Failed to get document from Pinecone", doc_id=doc_id, error=str(e))
             return None
     
     def list_collections(self) -> List[str]:
@@ -313,7 +319,7 @@ class PineconeConnector(VectorDBConnector):
             
             indexes = self.pc.list_indexes()
             index_names = [index.name for index in indexes]
-            logger.info(f"Listed {len(index_names)} indexes in Pinecone")
+            logger.info("Listed Pinecone indexes", count=len(index_names))
             return index_names
         except Exception as e:
             logger.error("Failed to list indexes in Pinecone", error=str(e))
@@ -1,15 +1,18 @@
-from slack_bolt import App
-from slack_bolt.adapter.socket_mode import SocketModeHandler
+from slack_bolt.async_app import AsyncApp
+from slack_bolt.adapter.socket_mode.async_handler import AsyncSocketModeHandler
 from src.config.settings import Settings
 from src.slack.message_handler import MessageHandler
 from src.crew.base_crew import BaseCrew
 from src.storage.redis_client import RedisConversationStore
 from src.storage.approval_store import ApprovalStore
 from src.auth.role_manager import RoleManager
-from typing import Dict, Any, Callable
+from typing import Dict, Any, Awaitable, Callable, Optional
 import structlog
+import asyncio
 import atexit
 import re
+import sys
+import time
 
 logger = structlog.get_logger(__name__)
 
@@ -18,7 +21,10 @@ class SlackApp:
 
     def __init__(self, settings: Settings, crew: BaseCrew):
         self.settings = settings
-        self.app = App(token=settings.slack_bot_token)
+        self.crew = crew
+        self.app = AsyncApp(token=settings.slack_bot_token)
+        # Resolved once via auth.test, see _get_bot_user_id
+        self._bot_user_id: Optional[str] = None
         
         # Initialize Redis conversation store
         self.conversation_store = RedisConversationStore(
@@ -53,8 +59,8 @@ class SlackApp:
             approval_store=self.approval_store
         )
         # Store handlers for test access
-        self.handle_message: Callable[[Dict[str, str], Any, Any], None] = None
-        self.handle_app_mention: Callable[[Dict[str, str], Any], None] = None
+        self.handle_message: Callable[[Dict[str, str], Any, Any], Awaitable[None]] = None
+        self.handle_app_mention: Callable[[Dict[str, str], Any, Any], Awaitable[None]] = None
         self._register_handlers()
 
     def _register_handlers(self) -> None:
@@ -66,19 +72,20 @@ class SlackApp:
         """Register message event handlers."""
 
         @self.app.event("message")
-        def handle_message(event: Dict[str, str], say, client) -> None:
+        async def handle_message(event: Dict[str, str], say, client) -> None:
             logger.info("Received message event", slack_event=event)
             try:
                 channel_id = event.get("channel")
                 thread_ts = event.get("thread_ts", event.get("ts"))
                 text = event.get("text", "")
-                user_id = event.get("user", "unknown_user")
-                app_id = self.app.client.auth_test()["user_id"]
+                # Interned so admin checks against the interned admin IDs hit by identity
+                user_id = sys.intern(event.get("user", "unknown_user"))
+                app_id = await self._get_bot_user_id()
                 logger.debug("Bot app_id", app_id=app_id)
                 if not event.get("thread_ts") and f"<@{app_id}>" not in text:
                     logger.info("Message not directed to bot, ignoring")
                     return
-                self.message_handler.process_message(
+                await self.message_handler.process_message(
                     text=text,
                     say=say,
                     thread_ts=thread_ts,
@@ -88,14 +95,14 @@ class SlackApp:
                 )
                 logger.info("Message processed successfully")
             except Exception as e:
-                logger.error(f"Error handling message: {str(e)}", exc_info=True)
-                say(text="Sorry, I encountered an error processing your message.", thread_ts=thread_ts)
+                logger.error("Error handling message", error=str(e), exc_info=True)
+                await say(text="Sorry, I encountered an error processing your message.", thread_ts=thread_ts)
         
         # Store the handler function
         self.handle_message = handle_message
 
         @self.app.event("app_mention")
-        def handle_app_mention(event: Dict[str, str], say, client) -> None:
+        async def handle_app_mention(event: Dict[str, str], say, client) -> None:
             logger.info("Received app_mention event", slack_event=event)
             try:
                 channel_id = event.get("channel")
@@ -107,19 +114,31 @@ class SlackApp:
                 
                 logger.info("App mention processed successfully")
             except Exception as e:
-                logger.error(f"Error handling app mention: {str(e)}", exc_info=True)
-                say(text="Sorry, I encountered an error processing your message.", thread_ts=thread_ts)
+                logger.error("Error handling app mention", error=str(e), exc_info=True)
+                await say(text="Sorry, I encountered an error processing your message.", thread_ts=thread_ts)
         
         # Store the handler function
         self.handle_app_mention = handle_app_mention
     
+    async def _get_bot_user_id(self) -> str:
+        """
+        Get the bot's own user ID, calling auth.test only the first time.
+
+        Returns:
+            str: The bot user ID.
+        """
+        if self._bot_user_id is None:
+            self._bot_user_id = (await self.app.client.auth_test())["user_id"]
+            logger.info("Resolved bot user ID", bot_user_id=self._bot_user_id)
+        return self._bot_user_id
+
     def _register_action_handlers(self) -> None:
         """Register action handlers for interactive components."""
         
         # Handler for approval button actions
         @self.app.action(re.compile(r"approve_request_.*"))
-        def handle_approve_action(ack, body, client) -> None:
-            ack()  # Acknowledge the action
+        async def handle_approve_action(ack, body, client) -> None:
+            await ack()  # Acknowledge the action
             
             try:
                 # Extract the request ID from the action ID
@@ -127,7 +146,7 @@ class SlackApp:
                 request_id = action_id.replace("approve_request_", "")
                 
                 # Get the user ID of the approver
-                approver_id = body["user"]["id"]
+                approver_id = sys.intern(body["user"]["id"])
                 
                 logger.info("Received approval action", 
                            request_id=request_id, 
@@ -140,7 +159,7 @@ class SlackApp:
                                  request_id=request_id)
                     
                     # Update the message to indicate the action was denied
-                    client.chat_update(
+                    await client.chat_update(
                         channel=body["channel"]["id"],
                         ts=body["message"]["ts"],
                         text="You do not have permission to approve requests.",
@@ -149,7 +168,7 @@ class SlackApp:
                     return
                 
                 # Handle the approval
-                self.message_handler.handle_approval_response(
+                await self.message_handler.handle_approval_response(
                     request_id=request_id,
                     approver_id=approver_id,
                     approved=True,
@@ -157,7 +176,7 @@ class SlackApp:
                 )
                 
                 # Update the message to indicate the action was taken
-                client.chat_update(
+                await client.chat_update(
                     channel=body["channel"]["id"],
                     ts=body["message"]["ts"],
                     text=f"Request {request_id} has been approved by <@{approver_id}>.",
@@ -168,7 +187,7 @@ class SlackApp:
                 logger.error("Error handling approval action", error=str(e), exc_info=True)
                 
                 # Update the message to indicate an error occurred
-                client.chat_update(
+                await client.chat_update(
                     channel=body["channel"]["id"],
                     ts=body["message"]["ts"],
                     text=f"Error processing approval: {str(e)}",
@@ -177,8 +196,8 @@ class SlackApp:
         
         # Handler for denial button actions
         @self.app.action(re.compile(r"deny_request_.*"))
-        def handle_deny_action(ack, body, client) -> None:
-            ack()  # Acknowledge the action
+        async def handle_deny_action(ack, body, client) -> None:
+            await ack()  # Acknowledge the action
             
             try:
                 # Extract the request ID from the action ID
@@ -186,7 +205,7 @@ class SlackApp:
                 request_id = action_id.replace("deny_request_", "")
                 
                 # Get the user ID of the denier
-                approver_id = body["user"]["id"]
+                approver_id = sys.intern(body["user"]["id"])
                 
                 logger.info("Received denial action", 
                            request_id=request_id, 
@@ -199,7 +218,7 @@ class SlackApp:
                                  request_id=request_id)
                     
                     # Update the message to indicate the action was denied
-                    client.chat_update(
+                    await client.chat_update(
                         channel=body["channel"]["id"],
                         ts=body["message"]["ts"],
                         text="You do not have permission to deny requests.",
@@ -208,7 +227,7 @@ class SlackApp:
                     return
                 
                 # Handle the denial
-                self.message_handler.handle_approval_response(
+                await self.message_handler.handle_approval_response(
                     request_id=request_id,
                     approver_id=approver_id,
                     approved=False,
@@ -216,7 +235,7 @@ class SlackApp:
                 )
                 
                 # Update the message to indicate the action was taken
-                client.chat_update(
+                await client.chat_update(
                     channel=body["channel"]["id"],
                     ts=body["message"]["ts"],
                     text=f"Request {request_id} has been denied by <@{approver_id}>.",
@@ -227,7 +246,7 @@ class SlackApp:
                 logger.error("Error handling denial action", error=str(e), exc_info=True)
                 
                 # Update the message to indicate an error occurred
-                client.chat_update(
+                await client.chat_update(
                     channel=body["channel"]["id"],
                     ts=body["message"]["ts"],
                     text=f"Error processing denial: {str(e)}",
@@ -237,14 +256,41 @@ class SlackApp:
     def start(self) -> None:
         """Start the Slack app with Socket Mode."""
         try:
-            handler = SocketModeHandler(app=self.app, app_token=self.settings.slack_app_token)
-            logger.info("Starting Slack app in Socket Mode")
-            handler.start()
+            asyncio.run(self._start())
         except Exception as e:
             logger.error("Error starting Slack app", error=str(e), exc_info=True)
             self._cleanup()
             raise
 
+    async def _start(self) -> None:
+        """Connect over Socket Mode and serve events until shut down."""
+        await self._warm_up()
+        await self._get_bot_user_id()
+        handler = AsyncSocketModeHandler(app=self.app, app_token=self.settings.slack_app_token)
+        logger.info("Starting Slack app in Socket Mode")
+        await handler.start_async()
+
+    async def _warm_up(self) -> None:
+        """
+        Build the agents and open the LLM connections before accepting events.
+
+        Without this the first message after boot pays for agent construction,
+        DNS and the TLS handshakes. Failures are logged and don't stop startup.
+        """
+        start = time.perf_counter()
+        try:
+            # Imported here so loading the Slack layer doesn't load the LLM SDKs
+            from src.llm.clients import LLMClients
+            clients = LLMClients.get_instance(self.settings)
+            await asyncio.gather(
+                asyncio.to_thread(self.crew.warm_up),
+                asyncio.wrap_future(clients.submit(clients.warm_up()))
+            )
+            logger.info("Warmed up crew and LLM connections",
+                        warmup_ms=round((time.perf_counter() - start) * 1000))
+        except Exception as e:
+            logger.error("Warm-up failed", error=str(e), exc_info=True)
+
     def _cleanup(self) -> None:
         """Cleanup resources on shutdown."""
         try:
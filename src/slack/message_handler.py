@@ -1,5 +1,6 @@
-from typing import Any, Dict, List
-from datetime import datetime
+import asyncio
+from typing import Any, Dict, List, Optional
+import time
 import structlog
 from src.crew.base_crew import BaseCrew
 from src.utils.formatting import format_slack_message
@@ -9,9 +10,17 @@ from src.auth.role_manager import RoleManager, Operation
 
 logger = structlog.get_logger(__name__)
 
+# Minimum pause between streaming edits of the placeholder message (seconds),
+# roughly the one-per-second pace Slack allows for message writes
+STREAM_UPDATE_INTERVAL = 1.0
+# How long a finished response is shared with identical requests (seconds)
+COALESCE_TTL = 60
+
 class MessageHandler:
     """Handles Slack message processing and responses."""
 
+    __slots__ = ("crew", "conversation_store", "role_manager", "approval_store", "logger", "_inflight")
+
     def __init__(self, crew: BaseCrew, conversation_store: RedisConversationStore, 
                 role_manager: RoleManager, approval_store: ApprovalStore):
         self.crew = crew
@@ -19,8 +28,10 @@ class MessageHandler:
         self.role_manager = role_manager
         self.approval_store = approval_store
         self.logger = structlog.get_logger(__name__)
+        # Responses of in-flight (and recently finished) requests by coalescing key
+        self._inflight: Dict[str, asyncio.Future[str]] = {}
 
-    def process_message(self, text: str, say: Any, thread_ts: str, channel_id: str, user_id: str, client: Any = None) -> None:
+    async def process_message(self, text: str, say: Any, thread_ts: str, channel_id: str, user_id: str, client: Any = None) -> None:
         """
         Process incoming messages and handle responses.
         
@@ -36,25 +47,16 @@ class MessageHandler:
             # Store incoming message
             message_data = {
                 "text": text,
-                "timestamp": datetime.now().isoformat(),
+                "timestamp": time.time(),
                 "type": "incoming"
             }
-            self.conversation_store.store_message(channel_id, thread_ts, message_data)
+            await asyncio.to_thread(self.conversation_store.store_message, channel_id, thread_ts, message_data)
             self.logger.debug("Stored incoming message", message_data=message_data)
 
-            # Send an initial "processing" message
-            processing_message = ":hourglass_flowing_sand: `Processing your request...` :writing_hand:"
-            processing_response = say(
-                text=processing_message,
-                thread_ts=thread_ts,
-                mrkdwn=True
-            )
-            
-            # Get the timestamp of the processing message so we can delete it later
-            processing_ts = processing_response.get('ts')
+            processing_ts = await self._send_processing_message(say, thread_ts)
             
             # Get conversation history for context
-            history = self.get_conversation_history(channel_id, thread_ts)
+            history = await asyncio.to_thread(self.get_conversation_history, channel_id, thread_ts)
             
             # Run the crew task with conversation history and user ID
             inputs = {
@@ -63,65 +65,128 @@ class MessageHandler:
                 "user_id": user_id,
                 "channel_id": channel_id
             }
-            response = self.crew.run(inputs=inputs)
-            
-            # Delete the processing message if we have its timestamp
-            if processing_ts and client:
-                try:
-                    # Use the client to delete the message
-                    client.chat_delete(
-                        channel=channel_id,
-                        ts=processing_ts
-                    )
-                    self.logger.debug("Deleted processing message", ts=processing_ts)
-                except Exception as e:
-                    self.logger.error("Failed to delete processing message", error=str(e), exc_info=True)
+            response = await self._stream_response(inputs, channel_id, processing_ts, client)
             
             # Send the actual response
-            self._send_response(response, say, thread_ts, channel_id)
+            await self._send_response(response, say, thread_ts, channel_id,
+                                client=client, ts=processing_ts)
 
         except RedisConnectionError as e:
             self.logger.error("Redis connection error", error=str(e))
-            # Send an initial "processing" message
-            processing_message = ":hourglass_flowing_sand: `Processing your request...` :writing_hand:"
-            processing_response = say(
-                text=processing_message,
-                thread_ts=thread_ts,
-                mrkdwn=True
-            )
-            
-            # Get the timestamp of the processing message so we can delete it later
-            processing_ts = processing_response.get('ts')
+            processing_ts = await self._send_processing_message(say, thread_ts)
             
             # Continue processing even if Redis fails
-            response = self.crew.run(inputs={
+            response = await self._stream_response({
                 "topic": text,
                 "user_id": user_id,
                 "channel_id": channel_id
-            })
+            }, channel_id, processing_ts, client)
             
-            # Delete the processing message if we have its timestamp
-            if processing_ts and client:
-                try:
-                    # Use the client to delete the message
-                    client.chat_delete(
-                        channel=channel_id,
-                        ts=processing_ts
-                    )
-                    self.logger.debug("Deleted processing message", ts=processing_ts)
-                except Exception as e:
-                    self.logger.error("Failed to delete processing message", error=str(e), exc_info=True)
-            
-            self._send_response(response, say, thread_ts, channel_id, store_history=False)
+            await self._send_response(response, say, thread_ts, channel_id, store_history=False,
+                                client=client, ts=processing_ts)
 
         except Exception as e:
             self.logger.error("Error processing message", error=str(e), exc_info=True)
             error_message = format_slack_message(f"Sorry, I encountered an error: {str(e)}", bold=True)
-            say(text=error_message, thread_ts=thread_ts, mrkdwn=True)
+            await say(text=error_message, thread_ts=thread_ts, mrkdwn=True)
+
+    async def _send_processing_message(self, say: Any, thread_ts: str) -> Optional[str]:
+        """Post the "processing" placeholder and return its timestamp."""
+        processing_message = ":hourglass_flowing_sand: `Processing your request...` :writing_hand:"
+        processing_response = await say(
+            text=processing_message,
+            thread_ts=thread_ts,
+            mrkdwn=True
+        )
+        return processing_response.get('ts') if processing_response else None
+
+    async def _stream_response(self, inputs: Dict[str, Any], channel_id: str,
+                         processing_ts: Optional[str], client: Any) -> str:
+        """
+        Get the crew's response, sharing it between identical concurrent requests.
+
+        If the crew allows it, a request whose coalescing key matches one that
+        is in flight (or finished within COALESCE_TTL seconds) waits for that
+        response instead of running the crew again.
+
+        Returns:
+            The complete response text.
+        """
+        key = self.crew.coalescing_key(inputs)
+        if key is None:
+            return await self._run_crew(inputs, channel_id, processing_ts, client)
 
-    def _send_response(self, response: str, say: Any, thread_ts: str, 
-                      channel_id: str, store_history: bool = True) -> None:
-        """Send formatted response message and store in history."""
+        inflight = self._inflight.get(key)
+        if inflight is not None:
+            self.logger.info("Joining identical in-flight request", key=key)
+            return await asyncio.shield(inflight)
+
+        loop = asyncio.get_running_loop()
+        future: asyncio.Future[str] = loop.create_future()
+        # Mark failures as retrieved when no other request joined
+        future.add_done_callback(lambda f: f.cancelled() or f.exception())
+        self._inflight[key] = future
+        try:
+            response = await self._run_crew(inputs, channel_id, processing_ts, client)
+        except BaseException as e:
+            del self._inflight[key]
+            if isinstance(e, asyncio.CancelledError):
+                future.cancel()
+            else:
+                future.set_exception(e)
+            raise
+        future.set_result(response)
+        loop.call_later(COALESCE_TTL, self._expire_inflight, key, future)
+        return response
+
+    def _expire_inflight(self, key: str, future: "asyncio.Future[str]") -> None:
+        """Forget a coalesced response once its TTL has passed."""
+        if self._inflight.get(key) is future:
+            del self._inflight[key]
+
+    async def _run_crew(self, inputs: Dict[str, Any], channel_id: str,
+                        processing_ts: Optional[str], client: Any) -> str:
+        """
+        Run the crew, editing the placeholder message as the response streams in.
+
+        The first chunk is shown immediately; after that the placeholder is only
+        updated every STREAM_UPDATE_INTERVAL seconds to stay within Slack's rate
+        limits. Each edit carries the full text received so far rather than a
+        diff, so any edit that gets through shows the current state on its own
+        and a failed or delayed one is superseded by the next.
+
+        Returns:
+            The complete response text.
+        """
+        response = ""
+        last_update = None
+        async for chunk in self.crew.stream(inputs):
+            response += chunk
+            if not processing_ts or not client:
+                continue
+            now = time.monotonic()
+            if last_update is None or now - last_update >= STREAM_UPDATE_INTERVAL:
+                await self._update_message(client, channel_id, processing_ts, response)
+                last_update = now
+        return response
+
+    async def _update_message(self, client: Any, channel_id: str, ts: str, text: str) -> bool:
+        """Replace the text of a posted message, returning whether it succeeded."""
+        try:
+            await client.chat_update(channel=channel_id, ts=ts, text=text, mrkdwn=True)
+            return True
+        except Exception as e:
+            self.logger.error("Failed to update message", error=str(e), ts=ts)
+            return False
+
+    async def _send_response(self, response: str, say: Any, thread_ts: str, 
+                      channel_id: str, store_history: bool = True,
+                      client: Any = None, ts: Optional[str] = None) -> None:
+        """Send formatted response message and store in history.
+
+        If the timestamp of an already posted message is given, that message
+        is edited in place instead of posting a new one.
+        """
         # Detect if this is likely a conversation response
         message_type = self._detect_message_type(response)
         
@@ -135,20 +200,21 @@ class MessageHandler:
                          message_type=message_type,
                          thread_ts=thread_ts)
 
-        say(
-            text=formatted_response,
-            thread_ts=thread_ts,
-            mrkdwn=True
-        )
+        if not (ts and client and await self._update_message(client, channel_id, ts, formatted_response)):
+            await say(
+                text=formatted_response,
+                thread_ts=thread_ts,
+                mrkdwn=True
+            )
         
         if store_history:
             try:
                 message_data = {
                     "text": formatted_response,
-                    "timestamp": datetime.now().isoformat(),
+                    "timestamp": time.time(),
                     "type": "outgoing"
                 }
-                self.conversation_store.store_message(channel_id, thread_ts, message_data)
+                await asyncio.to_thread(self.conversation_store.store_message, channel_id, thread_ts, message_data)
                 self.logger.debug("Stored outgoing message", message_data=message_data)
             except RedisConnectionError as e:
                 self.logger.error("Failed to store response in history", error=str(e))
@@ -220,7 +286,7 @@ class MessageHandler:
             self.logger.error("Failed to retrieve conversation history", error=str(e))
             return []
     
-    def create_approval_request(self, 
+    async def create_approval_request(self, 
                                user_id: str, 
                                operation: str, 
                                details: Dict[str, Any],
@@ -242,7 +308,8 @@ class MessageHandler:
         """
         try:
             # Create the approval request
-            request = self.approval_store.create_request(
+            request = await asyncio.to_thread(
+                self.approval_store.create_request,
                 user_id=user_id,
                 operation=operation,
                 details=details,
@@ -251,7 +318,7 @@ class MessageHandler:
             )
             
             # Notify the user that their request requires approval
-            self._send_response(
+            await self._send_response(
                 "Your request requires admin approval. An admin will be notified.",
                 say,
                 thread_ts,
@@ -259,18 +326,18 @@ class MessageHandler:
             )
             
             # Notify admins about the request
-            self._notify_admins_of_approval_request(request, client)
+            await self._notify_admins_of_approval_request(request, client)
             
         except Exception as e:
             self.logger.error("Failed to create approval request", error=str(e), exc_info=True)
-            self._send_response(
+            await self._send_response(
                 f"Sorry, I encountered an error processing your approval request: {str(e)}",
                 say,
                 thread_ts,
                 channel_id
             )
     
-    def _notify_admins_of_approval_request(self, request: Any, client: Any) -> None:
+    async def _notify_admins_of_approval_request(self, request: Any, client: Any) -> None:
         """
         Notify admins about an approval request.
         
@@ -282,7 +349,7 @@ class MessageHandler:
         for admin_id in self.role_manager.admin_user_ids:
             try:
                 # Open a DM with the admin
-                response = client.conversations_open(users=admin_id)
+                response = await client.conversations_open(users=admin_id)
                 dm_channel_id = response["channel"]["id"]
                 
                 # Create the approval message with buttons
@@ -291,7 +358,7 @@ class MessageHandler:
                         "type": "section",
                         "text": {
                             "type": "mrkdwn",
-                            "text": f"*Approval Request*\n\nUser <@{request.user_id}> has requested to perform operation: *{request.operation.name}*"
+                            "text": f"*Approval Request*\n\nUser <@{request.user_id}> has requested to perform operation: *{request.operation}*"
                         }
                     },
                     {
@@ -331,7 +398,7 @@ class MessageHandler:
                 ]
                 
                 # Send the message
-                client.chat_postMessage(
+                await client.chat_postMessage(
                     channel=dm_channel_id,
                     text=f"Approval request from <@{request.user_id}>",
                     blocks=blocks
@@ -347,7 +414,7 @@ class MessageHandler:
                                admin_id=admin_id,
                                request_id=request.request_id)
     
-    def handle_approval_response(self, 
+    async def handle_approval_response(self, 
                                 request_id: str, 
                                 approver_id: str, 
                                 approved: bool,
@@ -364,20 +431,20 @@ class MessageHandler:
         try:
             # Get the request from the store
             if approved:
-                request = self.approval_store.approve_request(request_id, approver_id)
+                request = await asyncio.to_thread(self.approval_store.approve_request, request_id, approver_id)
             else:
-                request = self.approval_store.deny_request(request_id, approver_id)
+                request = await asyncio.to_thread(self.approval_store.deny_request, request_id, approver_id)
             
             if not request:
                 self.logger.error("Approval request not found", request_id=request_id)
                 return
             
             # Notify the user of the approval status
-            self._notify_user_of_approval_status(request, approved, client)
+            await self._notify_user_of_approval_status(request, approved, client)
             
             # If approved, execute the requested operation
             if approved:
-                self._execute_approved_operation(request, client)
+                await self._execute_approved_operation(request, client)
             
         except Exception as e:
             self.logger.error("Failed to handle approval response", 
@@ -386,7 +453,7 @@ class MessageHandler:
                            approver_id=approver_id,
                            approved=approved)
     
-    def _notify_user_of_approval_status(self, request: Any, approved: bool, client: Any) -> None:
+    async def _notify_user_of_approval_status(self, request: Any, approved: bool, client: Any) -> None:
         """
         Notify the user of the approval status.
         
@@ -397,10 +464,10 @@ class MessageHandler:
         """
         try:
             status = "approved" if approved else "denied"
-            message = f"Your request to perform operation *{request.operation.name}* has been {status} by an admin."
+            message = f"Your request to perform operation *{request.operation}* has been {status} by an admin."
             
             # Send a message in the original thread
-            client.chat_postMessage(
+            await client.chat_postMessage(
                 channel=request.channel_id,
                 thread_ts=request.thread_ts,
                 text=message,
@@ -418,7 +485,7 @@ class MessageHandler:
                            user_id=request.user_id,
                            request_id=request.request_id)
     
-    def _execute_approved_operation(self, request: Any, client: Any) -> None:
+    async def _execute_approved_operation(self, request: Any, client: Any) -> None:
         """
         Execute the approved operation.
         
@@ -428,7 +495,7 @@ class MessageHandler:
         """
         try:
             # Extract operation and details
-            operation = request.operation
+            operation = Operation[request.operation]
             details = request.details
             
             self.logger.info("Executing approved operation", 
@@ -442,9 +509,9 @@ class MessageHandler:
             if operation in [Operation.LIST_DOCUMENTS, Operation.READ_DOCUMENT, 
                            Operation.DELETE_DOCUMENT, Operation.VIEW_STATS]:
                 # Get the document management tool from the crew
-                doc_tool = self.crew.get_tool("manage_documents")
+                doc_tool = await asyncio.to_thread(self.crew.get_tool, "manage_documents")
                 if doc_tool:
-                    result = doc_tool.execute_approved_operation(operation, details)
+                    result = await asyncio.to_thread(doc_tool.execute_approved_operation, operation, details)
                 else:
                     self.logger.error("Document management tool not found in crew")
                     result = "Error: Document management tool not available"
@@ -453,7 +520,7 @@ class MessageHandler:
                 result = f"Unsupported operation type: {operation.name}"
             
             # Notify the user of the result
-            client.chat_postMessage(
+            await client.chat_postMessage(
                 channel=request.channel_id,
                 thread_ts=request.thread_ts,
                 text=f"The operation *{operation.name}* has been executed:\n\n{result}",
@@ -463,11 +530,11 @@ class MessageHandler:
         except Exception as e:
             self.logger.error("Failed to execute approved operation", 
                            error=str(e), 
-                           operation=request.operation.name,
+                           operation=request.operation,
                            request_id=request.request_id)
             
             # Notify the user of the failure
-            client.chat_postMessage(
+            await client.chat_postMessage(
                 channel=request.channel_id,
                 thread_ts=request.thread_ts,
                 text=f"Sorry, I encountered an error executing the approved operation: {str(e)}",
@@ -1,5 +1,5 @@
-import json
 import uuid
+import msgspec
 import structlog
 from typing import Dict, List, Optional, Any
 import redis
@@ -8,6 +8,9 @@ from src.storage.redis_client import RedisConnectionError
 
 logger = structlog.get_logger(__name__)
 
+_encoder = msgspec.json.Encoder()
+_decoder = msgspec.json.Decoder(ApprovalRequest)
+
 class ApprovalStore:
     """Store for managing approval requests."""
     
@@ -86,7 +89,7 @@ class ApprovalStore:
         request = ApprovalRequest(
             request_id=request_id,
             user_id=user_id,
-            operation=Operation[operation],
+            operation=Operation[operation].name,
             details=details,
             channel_id=channel_id,
             thread_ts=thread_ts
@@ -95,7 +98,7 @@ class ApprovalStore:
         # Store the request in Redis
         key = f"{self.prefix}{request_id}"
         try:
-            self.redis.set(key, json.dumps(request.to_dict()), ex=self.ttl)
+            self.redis.set(key, _encoder.encode(request), ex=self.ttl)
             logger.info("Created approval request", 
                        request_id=request_id, 
                        user_id=user_id, 
@@ -121,7 +124,7 @@ class ApprovalStore:
         try:
             data = self.redis.get(key)
             if data:
-                return ApprovalRequest.from_dict(json.loads(data))
+                return _decoder.decode(data)
             return None
         except redis.RedisError as e:
             logger.error("Failed to get approval request", 
@@ -138,7 +141,7 @@ class ApprovalStore:
         """
         key = f"{self.prefix}{request.request_id}"
         try:
-            self.redis.set(key, json.dumps(request.to_dict()), ex=self.ttl)
+            self.redis.set(key, _encoder.encode(request), ex=self.ttl)
             logger.info("Updated approval request", 
                        request_id=request.request_id, 
                        status=request.status)
@@ -203,7 +206,7 @@ class ApprovalStore:
             for key in keys:
                 data = self.redis.get(key)
                 if data:
-                    request = ApprovalRequest.from_dict(json.loads(data))
+                    request = _decoder.decode(data)
                     if request.status == "pending":
                         requests.append(request)
             
@@ -122,5 +122,5 @@ class DocumentIngestionTool(BaseTool):
             return f"Successfully ingested document from {source}. Document ID: {doc_ids[0]}"
         
         except Exception as e:
-            logger.error(f"Error ingesting document: {str(e)}", exc_info=True)
+            logger.error("Error ingesting document", error=str(e), exc_info=True)
             return f"Error ingesting document: {str(e)}"
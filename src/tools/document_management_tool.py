@@ -131,7 +131,7 @@ class DocumentManagementTool(BaseTool):
                 return self._get_stats(role_manager=self._role_manager, user_id=user_id)
         
         except Exception as e:
-            logger.error(f"Error managing documents: {str(e)}", exc_info=True)
+            logger.error("Error managing documents", error=str(e), exc_info=True)
             return f"Error managing documents: {str(e)}"
     
     @requires_permission(Operation.DOCUMENT_LIST)
@@ -285,5 +285,5 @@ class DocumentManagementTool(BaseTool):
             )
             
         except Exception as e:
-            logger.error(f"Error executing approved operation: {str(e)}", exc_info=True)
+            logger.error("Error executing approved operation", error=str(e), exc_info=True)
             return f"Error executing approved operation: {str(e)}"
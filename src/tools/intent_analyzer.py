@@ -10,43 +10,10 @@ class IntentAnalyzerInput(BaseModel):
     request: str = Field(..., description="The user's request text to analyze")
     conversation_history: Optional[str] = Field(None, description="Optional conversation history for context")
 
-class IntentAnalyzerTool(BaseTool):
-    name: str = "analyze_intent"
-    description: str = """
-    Analyze the user's request to determine which specialized agent should handle it.
-    Consider the full context including any conversation history.
-    Return a structured analysis with intent parameters confidence and reasoning.
-    If the intent is unclear or the confidence is low suggest a clarification question.
-    
-    Possible intents include:
-    - weather: For weather information requests
-    - rag_query: For knowledge base queries
-    - doc_management: For document management operations
-    - research: For research on specific topics
-    - feedback: For collecting user feedback through structured questions
-    - conversation: For general conversation and ambiguous requests
-    """
-    args_schema: type[BaseModel] = IntentAnalyzerInput
-
-    def __init__(self):
-        super().__init__()
-
-    def _run(self, request: str, conversation_history: Optional[str] = None) -> str:
-        """
-        Analyze the user's request to determine which agent should handle it.
-
-        Args:
-            request: The user's request text
-            conversation_history: Optional conversation history for context
-
-        Returns:
-            A prompt for the LLM to analyze the request
-        """
-        prompt = f"""
-        Analyze this user request: "{request}"
-
-        {conversation_history if conversation_history else "No conversation history available."}
-
+# Instructions shared by every analysis prompt. They lead the prompt so that
+# consecutive requests share a long prefix the provider can cache; only the
+# history and request at the end vary.
+_INSTRUCTIONS = """
         Available specialized agents:
         1. Research Agent
            - Handles research queries and information gathering
@@ -86,19 +53,61 @@ class IntentAnalyzerTool(BaseTool):
         4. Your reasoning for this choice
         5. If confidence is below 0.7, suggest a clarification question to ask the user
 
+        If the request has several independent parts for the Research, Weather or RAG Query
+        agents (for example "Research topic X and check the weather in Y"), list all of their
+        intents in "intents", with the most important one also in "intent".
+
         IMPORTANT: For simple greetings, casual conversation, or ambiguous requests, assign to the Conversation Agent with appropriate confidence.
         DO NOT default to the Weather Agent for ambiguous requests or simple greetings.
         
         Return your analysis in this exact JSON format:
-        {{
+        {
             "intent": "research, weather, rag_query, doc_management, feedback, or conversation",
-            "params": {{
+            "intents": ["every intent of a multi-part request, otherwise omit this field"],
+            "params": {
                 "topic" or "location" or "query" or "document_source" or "message": "extracted parameter",
                 "document_type": "optional document type for doc_management"
-            }},
+            },
             "confidence": 0.0 to 1.0,
             "reasoning": "Brief explanation of your decision",
             "clarification_question": "Question to ask if confidence < 0.7, otherwise null"
-        }}
+        }
+"""
+
+class IntentAnalyzerTool(BaseTool):
+    name: str = "analyze_intent"
+    description: str = """
+    Analyze the user's request to determine which specialized agent should handle it.
+    Consider the full context including any conversation history.
+    Return a structured analysis with intent parameters confidence and reasoning.
+    If the intent is unclear or the confidence is low suggest a clarification question.
+    
+    Possible intents include:
+    - weather: For weather information requests
+    - rag_query: For knowledge base queries
+    - doc_management: For document management operations
+    - research: For research on specific topics
+    - feedback: For collecting user feedback through structured questions
+    - conversation: For general conversation and ambiguous requests
+    """
+    args_schema: type[BaseModel] = IntentAnalyzerInput
+
+    def __init__(self):
+        super().__init__()
+
+    def _run(self, request: str, conversation_history: Optional[str] = None) -> str:
+        """
+        Analyze the user's request to determine which agent should handle it.
+
+        Args:
+            request: The user's request text
+            conversation_history: Optional conversation history for context
+
+        Returns:
+            A prompt for the LLM to analyze the request
+        """
+        return f"""{_INSTRUCTIONS}
+        {conversation_history if conversation_history else "No conversation history available."}
+
+        Analyze this user request: "{request}"
         """
-        return prompt
@@ -52,5 +52,5 @@ class RAGQueryTool(BaseTool):
             # Return the enhanced context
             return results['enhanced_context']
         except Exception as e:
-            logger.error(f"Error querying knowledge base: {str(e)}", exc_info=True)
+            logger.error("Error querying knowledge base", error=str(e), exc_info=True)
             return f"Error querying knowledge base: {str(e)}"
@@ -1,6 +1,15 @@
 import re
 from typing import Optional
 
+# Bullet styles cycled through for list items
+_BULLET_STYLES = ("•", "◦", "◉", "○", "▪", "▫", "◆", "◇", "►", "▻")
+# Keywords that mark a bullet point as important
+_EMPHASIS_KEYWORDS = ("important", "critical", "key", "main", "significant")
+_NUMBERED_ITEM_RE = re.compile(r"\d+\.\s")
+# Matches any line that one of the weather field branches below would handle, so
+# ordinary lines are checked with a single scan instead of one per field
+_WEATHER_FIELD_RE = re.compile(r"temperature:|humidity:|wind speed:|conditions:|forecast:|high:|low:|chance of rain:")
+
 def format_slack_message(text: str, bold: bool = False, message_type: Optional[str] = None) -> str:
     """
     Format text for Slack mrkdwn compatibility with enhanced readability.
@@ -89,25 +98,27 @@ def format_slack_message(text: str, bold: bool = False, message_type: Optional[s
                     formatted_lines.append("")
             
             # Use a variety of bullet point styles for visual interest
-            bullet_styles = ["•", "◦", "◉", "○", "▪", "▫", "◆", "◇", "►", "▻"]
-            bullet_index = len(formatted_lines) % len(bullet_styles)
+            bullet = _BULLET_STYLES[len(formatted_lines) % len(_BULLET_STYLES)]
             bullet_content = line[2:].strip()
             
             # Add some emphasis to important bullet points with color
-            if any(keyword in bullet_content.lower() for keyword in ["important", "critical", "key", "main", "significant"]):
-                formatted_lines.append(f"{bullet_styles[bullet_index]} `{bullet_content}`")
+            lower_content = bullet_content.lower()
+            if any(keyword in lower_content for keyword in _EMPHASIS_KEYWORDS):
+                formatted_lines.append(f"{bullet} `{bullet_content}`")
             else:
-                formatted_lines.append(f"{bullet_styles[bullet_index]} {bullet_content}")
+                formatted_lines.append(f"{bullet} {bullet_content}")
             continue
             
         # Handle numbered lists
-        if re.match(r"^\d+\.\s", line.strip()):
+        if _NUMBERED_ITEM_RE.match(line):
             formatted_lines.append(line)
             continue
             
         # Enhanced weather information with more visually appealing formatting
         lower_line = line.lower()
-        if "temperature:" in lower_line:
+        if not _WEATHER_FIELD_RE.search(lower_line):
+            formatted_lines.append(line)
+        elif "temperature:" in lower_line:
             temp_parts = line.split(":")
             if len(temp_parts) > 1:
                 temp_value = temp_parts[1].strip()
@@ -147,7 +158,7 @@ def format_slack_message(text: str, bold: bool = False, message_type: Optional[s
                 formatted_lines.append(f"{cond_emoji} *Conditions*: `{cond_value}`")
             else:
                 formatted_lines.append(f":cloud: {line}")
-        elif "forecast:" in lower_line or lower_line.endswith("forecast:"):
+        elif "forecast:" in lower_line:
             # Use block quote for forecast headers to add color
             formatted_lines.append(f"> :calendar: *{line}*")
             formatted_lines.append("")
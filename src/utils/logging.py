@@ -1,18 +1,26 @@
 import structlog
 import logging
+import os
 import sys
-from typing import Any
+from typing import Any, Callable, Optional
+import orjson
 
 def add_app_info(_, __, event_dict: dict[str, Any]) -> dict[str, Any]:
     """Add application-specific context to log entries."""
     event_dict["app"] = "crewai-agent"
     return event_dict
 
+def orjson_dumps(obj: Any, default: Optional[Callable[[Any], Any]] = None, **kwargs: Any) -> str:
+    """Serialize a log entry with orjson for structlog's JSONRenderer."""
+    return orjson.dumps(obj, default=default, option=orjson.OPT_NON_STR_KEYS).decode()
+
 def configure_logging() -> None:
     """Configure structured logging with enhanced detail and formatting."""
+    level_name = os.getenv("LOG_LEVEL", "DEBUG").upper()
+
     # Set up standard logging first
     logging.basicConfig(
-        level=logging.DEBUG,
+        level=level_name,
         format="%(message)s",
         stream=sys.stdout
     )
@@ -27,9 +35,10 @@ def configure_logging() -> None:
             structlog.processors.StackInfoRenderer(),
             structlog.processors.format_exc_info,
             structlog.processors.UnicodeDecoder(),
-            structlog.processors.JSONRenderer(indent=None)
+            structlog.processors.JSONRenderer(serializer=orjson_dumps)
         ],
-        wrapper_class=structlog.stdlib.BoundLogger,
+        # Methods below the level are no-ops, so suppressed calls skip building the event dict
+        wrapper_class=structlog.make_filtering_bound_logger(logging.getLevelName(level_name)),
         logger_factory=structlog.stdlib.LoggerFactory(),
         cache_logger_on_first_use=True,
     )
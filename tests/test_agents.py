@@ -1,17 +1,42 @@
+import dataclasses
 import pytest
-from unittest.mock import patch, MagicMock
+from unittest.mock import patch, MagicMock, AsyncMock, PropertyMock
+from types import SimpleNamespace
 import json
-from src.config.settings import Settings
+from src.config.settings import Settings, get_settings
 from src.agents.research_agent import ResearchAgent
 from src.agents.writing_agent import WritingAgent
 from src.agents.conversation_agent import ConversationAgent
 from src.agents.master_agent import MasterAgent
-from src.crew.master_crew import MasterCrew
+from src.crew.master_crew import MasterCrew, _match_local_intent
+from src.batch.batcher import CompletionBatcher
+from src.llm.clients import LLMClients
+from src.crew.research_writing_crew import ResearchWritingCrew
+from src.crew.intent_cache import SemanticIntentCache
+from src.crew.intent_classifier import IntentClassifier
+from src.rag.embedding.base import EmbeddingModel
 
 @pytest.fixture
 def settings() -> Settings:
     """Fixture for Settings instance."""
-    return Settings()
+    return get_settings()
+
+def test_get_settings_is_shared() -> None:
+    """Test that get_settings builds Settings once per process."""
+    assert get_settings() is get_settings()
+
+def test_settings_are_immutable(settings: Settings) -> None:
+    """Test that Settings can be shared and hashed but not changed."""
+    from dataclasses import FrozenInstanceError
+    with pytest.raises(FrozenInstanceError):
+        settings.openai_model = "gpt-4o"
+    assert hash(settings) == hash(get_settings())
+
+def test_agents_share_litellm_session(settings: Settings) -> None:
+    """Test that litellm calls from CrewAI agents go through the shared HTTP client."""
+    import litellm
+    ResearchAgent(settings)
+    assert litellm.client_session is LLMClients.get_instance(settings).http_client
 
 def test_research_agent_initialization(settings: Settings) -> None:
     """Test ResearchAgent initialization and creation."""
@@ -19,7 +44,7 @@ def test_research_agent_initialization(settings: Settings) -> None:
     created_agent = agent.create()
     assert created_agent.role == "Researcher"
     assert created_agent.llm.model == f"openai/{settings.openai_model}"
-    assert created_agent.verbose is True
+    assert created_agent.verbose is settings.crew_verbose
     assert created_agent.allow_delegation is False
 
 def test_writing_agent_initialization(settings: Settings) -> None:
@@ -33,13 +58,38 @@ def test_writing_agent_initialization(settings: Settings) -> None:
     assert created_agent.verbose is False
     assert created_agent.allow_delegation is False
 
+def test_agent_create_is_cached(settings: Settings) -> None:
+    """Test that create() builds the CrewAI agent once and reuses it."""
+    agent = WritingAgent(settings)
+    assert agent.create() is agent.create()
+
+def test_crew_warm_up_builds_agents(settings: Settings) -> None:
+    """Test that warm_up builds every agent of the crew."""
+    crew = ResearchWritingCrew(settings)
+    with patch.object(ResearchAgent, '_build') as research_build, \
+         patch.object(WritingAgent, '_build') as writing_build:
+        crew.warm_up()
+    research_build.assert_called_once()
+    writing_build.assert_called_once()
+
+def test_master_crew_creates_agents_lazily(settings: Settings) -> None:
+    """Test that MasterCrew creates agent wrappers on first use, and warm_up creates them all."""
+    crew = MasterCrew(settings)
+    assert "weather_agent" not in vars(crew)
+
+    assert crew.weather_agent is crew.weather_agent
+    with patch.object(ConversationAgent, '_build') as conversation_build:
+        crew.warm_up()
+    conversation_build.assert_called_once()
+    assert "feedback_agent" in vars(crew)
+
 def test_conversation_agent_initialization(settings: Settings) -> None:
     """Test ConversationAgent initialization and creation."""
     agent = ConversationAgent(settings)
     created_agent = agent.create()
     assert created_agent.role == "Conversational Assistant"
     assert created_agent.llm.model == f"openai/{settings.openai_model}"
-    assert created_agent.verbose is True
+    assert created_agent.verbose is settings.crew_verbose
     assert created_agent.allow_delegation is False
 
 def test_master_agent_initialization(settings: Settings) -> None:
@@ -48,14 +98,14 @@ def test_master_agent_initialization(settings: Settings) -> None:
     created_agent = agent.create()
     assert created_agent.role == "Master Controller"
     assert created_agent.llm.model == f"openai/{settings.openai_model}"
-    assert created_agent.verbose is True
+    assert created_agent.verbose is settings.crew_verbose
     assert created_agent.allow_delegation is True
     assert len(created_agent.tools) == 1
     assert created_agent.tools[0].name == "analyze_intent"
 
 def test_master_crew_parse_intent_result_valid_json() -> None:
     """Test MasterCrew._parse_intent_result with valid JSON."""
-    settings = Settings()
+    settings = get_settings()
     crew = MasterCrew(settings)
     
     # Test with valid JSON
@@ -72,14 +122,15 @@ def test_master_crew_parse_intent_result_valid_json() -> None:
     }
     """
     
-    intent, confidence, clarification = crew._parse_intent_result(result_str)
+    intent, confidence, clarification, additional_intents = crew._parse_intent_result(result_str)
     assert intent == "conversation"
     assert confidence == 0.95
     assert clarification is None
+    assert additional_intents == ()
 
 def test_master_crew_parse_intent_result_low_confidence() -> None:
     """Test MasterCrew._parse_intent_result with low confidence and clarification."""
-    settings = Settings()
+    settings = get_settings()
     crew = MasterCrew(settings)
     
     # Test with low confidence and clarification question
@@ -95,31 +146,56 @@ def test_master_crew_parse_intent_result_low_confidence() -> None:
     }
     """
     
-    intent, confidence, clarification = crew._parse_intent_result(result_str)
+    intent, confidence, clarification, additional_intents = crew._parse_intent_result(result_str)
     assert intent == "weather"
     assert confidence == 0.4
     assert clarification == "Which city would you like to know the weather for?"
 
+def test_master_crew_parse_intent_result_multiple_intents() -> None:
+    """Test MasterCrew._parse_intent_result keeps independent additional intents."""
+    crew = MasterCrew(get_settings())
+
+    result_str = json.dumps({
+        "intent": "research",
+        "intents": ["research", "Weather", "feedback", "weather"],
+        "confidence": 0.9
+    })
+
+    intent, confidence, clarification, additional_intents = crew._parse_intent_result(result_str)
+    assert intent == "research"
+    assert additional_intents == ("weather",)
+
+def test_master_crew_parse_intent_result_trailing_prose() -> None:
+    """Test MasterCrew._parse_intent_result with text after the JSON object."""
+    crew = MasterCrew(get_settings())
+
+    result_str = 'Analysis: {"intent": "rag_query", "confidence": 0.8, "reasoning": "Asks about {docs}"} Hope that helps!'
+
+    intent, confidence, clarification, additional_intents = crew._parse_intent_result(result_str)
+    assert intent == "rag_query"
+    assert confidence == 0.8
+
 def test_master_crew_parse_intent_result_invalid_json() -> None:
     """Test MasterCrew._parse_intent_result with invalid JSON."""
-    settings = Settings()
+    settings = get_settings()
     crew = MasterCrew(settings)
     
     # Test with invalid JSON
     result_str = "I think this is a weather request"
     
-    intent, confidence, clarification = crew._parse_intent_result(result_str)
+    intent, confidence, clarification, additional_intents = crew._parse_intent_result(result_str)
     assert intent == "conversation"  # Default to conversation
     assert confidence == 0.0
     assert clarification is None
 
-@patch('src.crew.master_crew.Crew')
-def test_master_crew_create_crew_conversation_intent(mock_crew, settings: Settings) -> None:
+@patch.object(CompletionBatcher, 'complete')
+@patch('crewai.Crew')
+def test_master_crew_create_crew_conversation_intent(mock_crew, mock_complete, settings: Settings) -> None:
     """Test MasterCrew.create_crew with conversation intent."""
     # Setup mock
     mock_instance = MagicMock()
     mock_crew.return_value = mock_instance
-    mock_instance.kickoff.return_value = json.dumps({
+    mock_complete.return_value = json.dumps({
         "intent": "conversation",
         "params": {"message": "hello"},
         "confidence": 0.9,
@@ -128,25 +204,34 @@ def test_master_crew_create_crew_conversation_intent(mock_crew, settings: Settin
     
     # Create crew and test
     crew = MasterCrew(settings)
+    crew.intent_cache = None
     result = crew.create_crew({"topic": "hello"})
     
+    # The intent analysis prompt is sent with the master agent's system prompt
+    messages = mock_complete.call_args[0][0]
+    assert messages[0]["role"] == "system"
+    assert "Master Controller" in messages[0]["content"]
+    assert 'Analyze this user request: "hello"' in messages[1]["content"]
+    
     # Verify the conversation agent was used
     assert result == mock_instance
-    assert mock_crew.call_count == 2  # Once for master, once for specialized
+    assert mock_crew.call_count == 1  # Only the specialized crew; intent comes from the batcher
     
     # Get the specialized agent from the second call to Crew
     specialized_args = mock_crew.call_args[1]
     assert len(specialized_args['agents']) == 1
-    # The agent should be an instance of the conversation agent's create() method result
-    # We can't directly check the type, but we can verify it's not one of the other agents
+    # The crew reuses the conversation agent the task was built with
+    assert specialized_args['agents'][0] is crew.conversation_agent.create()
+    assert specialized_args['tasks'][0].agent is specialized_args['agents'][0]
 
-@patch('src.crew.master_crew.Crew')
-def test_master_crew_create_crew_low_confidence(mock_crew, settings: Settings) -> None:
+@patch.object(CompletionBatcher, 'complete')
+@patch('crewai.Crew')
+def test_master_crew_create_crew_low_confidence(mock_crew, mock_complete, settings: Settings) -> None:
     """Test MasterCrew.create_crew with low confidence and clarification."""
     # Setup mock
     mock_instance = MagicMock()
     mock_crew.return_value = mock_instance
-    mock_instance.kickoff.return_value = json.dumps({
+    mock_complete.return_value = json.dumps({
         "intent": "weather",
         "params": {"location": "unknown"},
         "confidence": 0.4,
@@ -156,14 +241,237 @@ def test_master_crew_create_crew_low_confidence(mock_crew, settings: Settings) -
     
     # Create crew and test
     crew = MasterCrew(settings)
-    result = crew.create_crew({"topic": "weather"})
+    crew.intent_cache = None
+    result = crew.create_crew({"topic": "what about tomorrow?"})
     
     # Verify the conversation agent was used to ask for clarification
     assert result == mock_instance
-    assert mock_crew.call_count == 2  # Once for master, once for specialized
+    assert mock_crew.call_count == 1  # Only the specialized crew; intent comes from the batcher
     
     # Get the specialized task from the second call to Crew
     specialized_args = mock_crew.call_args[1]
     assert len(specialized_args['tasks']) == 1
     assert "Ask for clarification" in specialized_args['tasks'][0].description
     assert "Which city would you like to know the weather for?" in specialized_args['tasks'][0].description
+
+@patch.object(CompletionBatcher, 'complete')
+@patch('crewai.Crew')
+def test_master_crew_create_crew_local_weather_match(mock_crew, mock_complete, settings: Settings) -> None:
+    """Test that weather keywords route to the weather agent without an LLM call."""
+    crew = MasterCrew(settings)
+    crew.create_crew({"topic": "What's the forecast for London?"})
+
+    mock_complete.assert_not_called()
+    specialized_args = mock_crew.call_args[1]
+    assert specialized_args['agents'][0] is crew.weather_agent.create()
+
+def test_match_local_intent_leaves_knowledge_base_requests_to_the_master_agent() -> None:
+    """Test that keyword routing only settles unambiguous requests."""
+    assert _match_local_intent("What's the forecast for London?") == "weather"
+    assert _match_local_intent("Research renewable energy trends") == "research"
+    assert _match_local_intent("Look up the security policy in our documents") is None
+    assert _match_local_intent("Find out about our expense policy") is None
+    assert _match_local_intent("What's our Q3 sales forecast in the docs?") is None
+    assert _match_local_intent("Research what the handbook says about leave") is None
+    assert _match_local_intent("Is the rain forecast in the knowledge base?") is None
+
+@patch.object(CompletionBatcher, 'complete')
+@patch('crewai.Crew')
+def test_master_crew_create_crew_ambiguous_keywords(mock_crew, mock_complete, settings: Settings) -> None:
+    """Test that requests matching several intents' keywords go to the master agent."""
+    mock_complete.return_value = json.dumps({"intent": "research", "confidence": 0.9})
+
+    crew = MasterCrew(settings)
+    crew.intent_cache = None
+    crew.create_crew({"topic": "Research how rain forecasts are made"})
+
+    mock_complete.assert_called_once()
+
+@patch.object(CompletionBatcher, 'complete')
+@patch('crewai.Crew')
+def test_master_crew_create_crew_multiple_intents(mock_crew, mock_complete, settings: Settings) -> None:
+    """Test that independent intents run as concurrent tasks combined by the conversation agent."""
+    mock_complete.return_value = json.dumps({
+        "intent": "rag_query", "intents": ["rag_query", "research"], "confidence": 0.9
+    })
+
+    crew = MasterCrew(settings)
+    crew.intent_cache = None
+    crew.create_crew({"topic": "What do our docs say about onboarding, and how do other companies do it?"})
+
+    tasks = mock_crew.call_args[1]['tasks']
+    assert [task.agent for task in tasks] == [crew.rag_query_agent.create(),
+                                              crew.research_agent.create(),
+                                              crew.conversation_agent.create()]
+    assert [task.async_execution for task in tasks] == [True, True, False]
+    assert tasks[2].context == tasks[:2]
+
+def _intent_cache(settings: Settings, vectors: dict) -> SemanticIntentCache:
+    """Build an intent cache whose embedding model returns the given vectors."""
+    model = MagicMock(spec=EmbeddingModel)
+    model.generate.side_effect = lambda text: vectors[text.rsplit("\n", 1)[-1]]
+    return SemanticIntentCache(settings, model=model)
+
+def test_intent_cache_matches_similar_requests(settings: Settings) -> None:
+    """Test that the intent cache returns results only for similar, live requests."""
+    cache = _intent_cache(settings, {"hi": [1.0, 0.0], "hello": [0.99, 0.05], "bye": [0.0, 1.0]})
+    cache.add(cache.embed("hi"), ("conversation", 0.9, None, ()))
+
+    assert cache.lookup(cache.embed("hello")) == ("conversation", 0.9, None, ())
+    assert cache.lookup(cache.embed("bye")) is None
+
+    with patch("src.crew.intent_cache.time.monotonic", return_value=1e12):
+        assert cache.lookup(cache.embed("hello")) is None
+
+def test_intent_cache_with_no_capacity_caches_nothing(settings: Settings) -> None:
+    """Test that a zero-size intent cache ignores adds instead of failing requests."""
+    empty_settings = dataclasses.replace(settings, intent_cache_size=0)
+    cache = _intent_cache(empty_settings, {"hello": [1.0, 0.0]})
+    vector = cache.embed("hello")
+
+    cache.add(vector, ("conversation", 0.9, None, ()))
+
+    assert cache.lookup(vector) is None
+    assert MasterCrew(empty_settings).intent_cache is None
+
+@patch.object(CompletionBatcher, 'complete')
+@patch('crewai.Crew')
+def test_master_crew_reuses_cached_intent(mock_crew, mock_complete, settings: Settings) -> None:
+    """Test that a paraphrased request reuses the cached intent without an LLM call."""
+    mock_complete.return_value = json.dumps({"intent": "rag_query", "confidence": 0.9})
+
+    crew = MasterCrew(settings)
+    crew.intent_cache = _intent_cache(settings, {
+        "what do our docs say about onboarding?": [1.0, 0.0],
+        "what do the docs say about onboarding": [0.99, 0.05]
+    })
+    crew.create_crew({"topic": "What do our docs say about onboarding?"})
+    crew.create_crew({"topic": "What do the docs say about onboarding"})
+
+    mock_complete.assert_called_once()
+    assert mock_crew.call_args[1]['agents'][0] is crew.rag_query_agent.create()
+
+@patch.object(CompletionBatcher, 'complete')
+@patch('crewai.Crew')
+def test_master_crew_reuses_intent_for_exact_repeat(mock_crew, mock_complete, settings: Settings) -> None:
+    """Test that an exact repeat of a request hits the fingerprint tier before embedding."""
+    mock_complete.return_value = json.dumps({"intent": "rag_query", "confidence": 0.9})
+
+    crew = MasterCrew(settings)
+    crew.intent_cache = MagicMock(spec=SemanticIntentCache)
+    crew.intent_cache.embed.return_value = None
+    crew.create_crew({"topic": "What do our docs say about onboarding?"})
+    crew.create_crew({"topic": "  what do our docs say about onboarding?"})
+
+    mock_complete.assert_called_once()
+    crew.intent_cache.embed.assert_called_once()
+
+@patch.object(CompletionBatcher, 'complete')
+@patch('crewai.Crew')
+def test_master_crew_skips_intent_cache_for_long_history(mock_crew, mock_complete, settings: Settings) -> None:
+    """Test that long conversations always get a fresh intent analysis."""
+    mock_complete.return_value = json.dumps({"intent": "rag_query", "confidence": 0.9})
+    history = [{"type": "user", "text": f"message {i}"}
+               for i in range(settings.conversation_history_threshold + 1)]
+
+    crew = MasterCrew(settings)
+    crew.intent_cache = MagicMock(spec=SemanticIntentCache)
+    crew.create_crew({"topic": "What do our docs say about onboarding?",
+                      "conversation_history": history})
+
+    crew.intent_cache.embed.assert_not_called()
+    mock_complete.assert_called_once()
+
+@patch.object(CompletionBatcher, 'complete')
+@patch('crewai.Crew')
+def test_master_crew_uses_confident_classifier_prediction(mock_crew, mock_complete, settings: Settings) -> None:
+    """Test that confident classifier predictions skip the master agent and low ones don't."""
+    mock_complete.return_value = json.dumps({"intent": "conversation", "confidence": 0.9})
+
+    crew = MasterCrew(settings)
+    crew.intent_cache = None
+    crew.intent_classifier = MagicMock(spec=IntentClassifier)
+    crew.intent_classifier.predict.return_value = ("feedback", 0.95)
+    with patch('src.tasks.feedback_task.create_feedback_task') as create_feedback_task:
+        crew.create_crew({"topic": "I'd like to share my thoughts"})
+    create_feedback_task.assert_called_once()
+    mock_complete.assert_not_called()
+
+    crew.intent_classifier.predict.return_value = ("feedback", 0.4)
+    crew.create_crew({"topic": "hmm"})
+    mock_complete.assert_called_once()
+
+def _fake_stream(*parts: str):
+    """Build an async iterator of OpenAI-style streaming chunks."""
+    async def generate():
+        for part in parts:
+            yield SimpleNamespace(choices=[SimpleNamespace(delta=SimpleNamespace(content=part))])
+    return generate()
+
+@patch.object(LLMClients, 'openai', new_callable=PropertyMock)
+def test_research_writing_crew_staircase(mock_openai, settings: Settings) -> None:
+    """Test that the writer runs on streamed research and its output is returned."""
+    client = MagicMock()
+    client.chat.completions.create = AsyncMock(side_effect=[
+        _fake_stream("Research ", "notes."),
+        _fake_stream("An ", "article.")
+    ])
+    mock_openai.return_value = client
+
+    crew = ResearchWritingCrew(settings)
+    result = crew.run({"topic": "AI trends"})
+
+    assert result == "An article."
+    assert client.chat.completions.create.call_count == 2
+    writer_prompt = client.chat.completions.create.call_args_list[1][1]["messages"][1]["content"]
+    assert "Research notes." in writer_prompt
+    assert "The research is complete." in writer_prompt
+
+@patch.object(LLMClients, 'openai', new_callable=PropertyMock)
+async def test_research_writing_crew_stream(mock_openai, settings: Settings) -> None:
+    """Test that stream() hands the article over chunk by chunk to the caller's loop."""
+    client = MagicMock()
+    client.chat.completions.create = AsyncMock(side_effect=[
+        _fake_stream("Research ", "notes."),
+        _fake_stream("An ", "article.")
+    ])
+    mock_openai.return_value = client
+
+    crew = ResearchWritingCrew(settings)
+    chunks = [chunk async for chunk in crew.stream({"topic": "AI trends"})]
+
+    assert chunks == ["An ", "article."]
+
+async def test_crew_runs_in_worker_process_pool(settings: Settings) -> None:
+    """Test that blocking crew runs go to the process pool when workers are configured."""
+    from concurrent.futures import ThreadPoolExecutor
+    from dataclasses import replace
+    from src.crew import base_crew
+
+    pool = ThreadPoolExecutor(max_workers=1)
+    with patch.object(MasterCrew, '_get_process_pool', return_value=pool), \
+         patch.object(MasterCrew, 'from_settings', side_effect=lambda s: MasterCrew(s)) as from_settings, \
+         patch.object(MasterCrew, 'run', return_value="Worker response") as mock_run, \
+         patch.dict(base_crew._worker_crews, clear=True):
+        crew = MasterCrew(replace(settings, crew_process_workers=1))
+        first = [chunk async for chunk in crew.stream({"request": "hi"})]
+        second = [chunk async for chunk in crew.stream({"request": "again"})]
+    pool.shutdown()
+
+    assert first == ["Worker response"]
+    assert second == ["Worker response"]
+    # The worker builds its own crew once and reuses it
+    from_settings.assert_called_once_with(settings)
+    assert mock_run.call_count == 2
+
+def test_get_tool_indexes_agent_tools_once(settings: Settings) -> None:
+    """Test that tool lookups don't build a crew and reuse the tool index."""
+    crew = MasterCrew(settings)
+    with patch.object(MasterCrew, 'create_crew') as create_crew:
+        tool = crew.get_tool(crew.weather_agent.weather_tool.name)
+        tool_index = crew._tool_index
+        assert crew.get_tool("no_such_tool") is None
+
+    assert tool is crew.weather_agent.weather_tool
+    assert crew._tool_index is tool_index
+    create_crew.assert_not_called()
@@ -0,0 +1,63 @@
+import pytest
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from types import SimpleNamespace
+from unittest.mock import patch, MagicMock, PropertyMock
+from src.config.settings import Settings
+from src.batch.batcher import CompletionBatcher
+from src.llm.clients import LLMClients
+
+@pytest.fixture
+def settings() -> Settings:
+    """Fixture for mocked Settings."""
+    settings = MagicMock(spec=Settings)
+    settings.openai_api_key = "sk-test"
+    settings.openai_api_base = None
+    settings.openai_model = "gpt-4o-mini"
+    settings.batch_size = 32
+    settings.batch_window_ms = 50
+    return settings
+
+def _completion(content: str) -> SimpleNamespace:
+    """Build an OpenAI-style chat completion response."""
+    return SimpleNamespace(choices=[SimpleNamespace(message=SimpleNamespace(content=content))])
+
+@patch.object(LLMClients, 'openai', new_callable=PropertyMock)
+def test_concurrent_requests_are_batched(mock_openai, settings: Settings) -> None:
+    """Test that requests arriving together are sent as one batch and demultiplexed."""
+    async def create(messages, **kwargs):
+        await asyncio.sleep(0.01)
+        return _completion(messages[-1]["content"].upper())
+    mock_openai.return_value.chat.completions.create = create
+
+    batcher = CompletionBatcher(settings)
+    with patch('src.batch.batcher.logger') as mock_logger, ThreadPoolExecutor(max_workers=5) as pool:
+        prompts = [f"message {i}" for i in range(5)]
+        results = list(pool.map(
+            lambda p: batcher.complete([{"role": "system", "content": "shared"},
+                                        {"role": "user", "content": p}]),
+            prompts
+        ))
+
+    assert results == [p.upper() for p in prompts]
+    batch_sizes = [c[1]["size"] for c in mock_logger.debug.call_args_list
+                   if c[0][0] == "Dispatching completion batch"]
+    assert sum(batch_sizes) == 5
+    assert len(batch_sizes) < 5
+
+@patch.object(LLMClients, 'openai', new_callable=PropertyMock)
+def test_batch_errors_reach_their_caller(mock_openai, settings: Settings) -> None:
+    """Test that a failed request only fails its own caller."""
+    async def create(messages, **kwargs):
+        if messages[-1]["content"] == "bad":
+            raise RuntimeError("request failed")
+        return _completion("ok")
+    mock_openai.return_value.chat.completions.create = create
+
+    batcher = CompletionBatcher(settings)
+    good = batcher.submit([{"role": "user", "content": "good"}])
+    bad = batcher.submit([{"role": "user", "content": "bad"}])
+
+    assert good.result(timeout=5) == "ok"
+    with pytest.raises(RuntimeError, match="request failed"):
+        bad.result(timeout=5)
@@ -1,8 +1,16 @@
+import dataclasses
+import hashlib
+import json
+import os
+import time
+import numpy as np
 import pytest
 from unittest.mock import Mock, patch
-from src.config.settings import Settings
+from src.config.settings import Settings, get_settings
 from src.rag.embedding.service import EmbeddingService
 from src.rag.vector_db.manager import VectorDBManager
+from src.rag.document.cache import DocumentCache
+from src.rag.document.chunker import TextChunker
 from src.rag.document.processor import DocumentProcessor
 from src.rag.query.engine import RAGQueryEngine
 from src.tools.rag_query_tool import RAGQueryTool
@@ -13,7 +21,7 @@ from typing import Dict, List, Any
 @pytest.fixture
 def settings() -> Settings:
     """Fixture for Settings instance."""
-    return Settings()
+    return get_settings()
 
 @pytest.fixture
 def mock_embedding_service(settings: Settings):
@@ -22,6 +30,7 @@ def mock_embedding_service(settings: Settings):
         mock_instance = Mock()
         mock_instance.generate_embedding.return_value = [0.1] * 1536  # Mock embedding vector
         mock_instance.generate_embeddings.return_value = [[0.1] * 1536]  # Mock embedding vectors
+        mock_instance.generate_embeddings_array.return_value = np.full((1, 1536), 0.1, dtype=np.float32)
         mock_instance.dimension = 1536
         mock_instance.model_name = "mock-embedding-model"
         mock.return_value = mock_instance
@@ -171,3 +180,290 @@ def test_document_management_tool(settings: Settings, mock_embedding_service, mo
     # Check that the tool returned stats
     assert isinstance(stats_result, str)
     assert "Knowledge Base Statistics" in stats_result
+
+def test_embedding_service_shares_models(settings: Settings):
+    """Test that each model type is created once and shared."""
+    with patch('src.rag.embedding.service.OpenAIEmbedding') as mock_openai, \
+         patch('src.rag.embedding.service.SentenceTransformerEmbedding') as mock_st:
+        service = EmbeddingService(settings, model_type='sentence_transformers')
+        shared = service.get_shared_model('sentence_transformers')
+        assert shared is service.current_model
+        assert service.get_shared_model('sentence_transformers') is shared
+        assert service.set_model('sentence_transformers')
+        assert service.current_model is shared
+        mock_st.assert_called_once_with(settings)
+        assert service.get_shared_model('unknown') is None
+
+def test_embedding_service_caches_vectors(settings: Settings):
+    """Test that repeated texts are embedded once and served from the cache."""
+    with patch('src.rag.embedding.service.OpenAIEmbedding'), \
+         patch('src.rag.embedding.service.SentenceTransformerEmbedding') as mock_st:
+        model = mock_st.return_value
+        model.model_name = "mock-model"
+        model.generate_batch_array.side_effect = lambda texts: np.array(
+            [[len(text), 1.0] for text in texts], dtype=np.float32)
+        service = EmbeddingService(settings, model_type='sentence_transformers')
+
+        first = service.generate_embeddings_array(["a", "bb"])
+        second = service.generate_embeddings_array(["bb", "ccc", "a"])
+
+        np.testing.assert_array_equal(first, [[1, 1], [2, 1]])
+        np.testing.assert_array_equal(second, [[2, 1], [3, 1], [1, 1]])
+        assert model.generate_batch_array.call_args_list[1].args == (["ccc"],)
+        assert service.generate_embedding("ccc") == [3.0, 1.0]
+        assert model.generate_batch_array.call_count == 2
+
+def test_document_cache_round_trip(tmp_path):
+    """Test that the document cache stores msgpack and still reads older JSON files."""
+    document = {"id": "doc_1", "text": "Cached text.", "metadata": {"source": "test"}}
+    # Written by a version that cached JSON under MD5 file names
+    with open(tmp_path / f"{hashlib.md5(b'doc_2').hexdigest()}.json", "w") as f:
+        json.dump({**document, "id": "doc_2", "_cached_time": time.time()}, f)
+    cache = DocumentCache(cache_dir=str(tmp_path))
+
+    assert cache.store("doc_1", document)
+    assert cache._get_cache_path("doc_1").endswith(".msgpack")
+    assert cache.get("doc_1") == document
+    assert cache.get("doc_2")["id"] == "doc_2"
+    assert cache.store_async("doc_3", document).result()
+    assert cache.get("doc_3") == document
+
+    assert cache.invalidate("doc_2")
+    assert cache.get("doc_2") is None
+
+def test_document_cache_serves_hot_documents_from_memory(tmp_path):
+    """Test that recently used documents are served without reading the cache file."""
+    cache = DocumentCache(cache_dir=str(tmp_path))
+    document = {"id": "doc_1", "text": "Cached text.", "metadata": {"source": "test"}}
+    cache.store("doc_1", document)
+
+    with patch('builtins.open', side_effect=AssertionError("read from disk")):
+        cached = cache.get("doc_1")
+    assert cached == document
+    cached["text"] = "changed"
+    assert cache.get("doc_1") == document
+
+    cache.invalidate("doc_1")
+    assert cache.get("doc_1") is None
+
+def test_document_cache_drops_documents_changed_elsewhere(tmp_path):
+    """Test that a document invalidated or re-stored by another process isn't served from memory."""
+    cache = DocumentCache(cache_dir=str(tmp_path))
+    document = {"id": "doc_1", "text": "Cached text.", "metadata": {"source": "test"}}
+    cache.store("doc_1", document)
+    # Stands in for the cache of another worker process using the same directory
+    other = DocumentCache(cache_dir=str(tmp_path))
+    assert other.get("doc_1") == document
+
+    updated = {**document, "text": "Updated text."}
+    assert cache.store("doc_1", updated)
+    assert other.get("doc_1") == updated
+
+    assert cache.invalidate("doc_1")
+    assert other.get("doc_1") is None
+
+def test_document_cache_finds_documents_cached_elsewhere(tmp_path):
+    """Test that documents cached by another instance after startup are found."""
+    cache = DocumentCache(cache_dir=str(tmp_path))
+    # Stands in for the cache of another worker process using the same directory
+    other = DocumentCache(cache_dir=str(tmp_path))
+    document = {"id": "doc_1", "text": "Cached text.", "metadata": {"source": "test"}}
+
+    assert other.store("doc_1", document)
+
+    assert cache.get("doc_1") == document
+    assert cache.get("doc_2") is None
+
+def test_text_chunker_splits_after_sentences():
+    """Test that chunks end after a sentence or line when one is close to the limit."""
+    chunker = TextChunker(chunk_size=120, chunk_overlap=0)
+    text = "First sentence here. " * 5 + "x" * 200
+
+    chunks = chunker.chunk_text(text)
+
+    assert chunks[0] == ("First sentence here. " * 5).rstrip()
+    assert "".join(chunks) == text
+    assert chunker._find_split_point("line one\nline two", 12) == 9
+    assert chunker._find_split_point("x" * 300, 250) == 250
+
+def test_file_loader_batch_keeps_source_order(tmp_path):
+    """Test that files loaded concurrently come back in the order requested."""
+    from src.rag.loaders.file import FileLoader
+
+    sources = []
+    for i in range(10):
+        path = tmp_path / f"file_{i}.txt"
+        path.write_text(f"File {i}")
+        sources.append(str(path))
+    sources.append(str(tmp_path / "missing.txt"))
+
+    documents = FileLoader(max_workers=4).load_batch(sources)
+
+    assert [document['text'] for document in documents[:-1]] == [f"File {i}" for i in range(10)]
+    assert 'error' in documents[-1]['metadata']
+
+def test_file_loader_skips_known_files(tmp_path):
+    """Test that files whose fingerprint is already known are not loaded again."""
+    from src.rag.loaders.file import FileLoader
+
+    unchanged = tmp_path / "unchanged.txt"
+    unchanged.write_text("Unchanged")
+    changed = tmp_path / "changed.txt"
+    changed.write_text("Old")
+    loader = FileLoader()
+    known = set(loader.fingerprints([str(unchanged), str(changed)]).values())
+    changed.write_text("New text")
+
+    documents = loader.load_batch([str(unchanged), str(changed)], known=known)
+
+    assert [document['text'] for document in documents] == ["New text"]
+
+def test_file_loader_loads_bytes_in_memory():
+    """Test that file contents are loaded without a file on disk."""
+    from src.rag.loaders.file import FileLoader
+
+    loader = FileLoader()
+    document = loader.load_bytes(b"Line one\r\nLine two", "notes.txt")
+
+    assert document['text'] == "Line one\nLine two"
+    assert document['metadata']['filename'] == "notes.txt"
+    assert document['metadata']['size'] == 18
+    assert 'error' in loader.load_bytes(b"data", "archive.zip")['metadata']
+
+def test_slack_loader_picks_file_loader_from_file_name(settings: Settings):
+    """Test that Slack files are parsed by their name's extension, not Slack's file type name."""
+    from src.rag.loaders.slack import SlackLoader
+
+    loader = SlackLoader(settings)
+    client = Mock()
+    client.files_info.return_value = {'file': {
+        'name': 'notes.md', 'filetype': 'markdown', 'url_private_download': 'https://files.slack.com/notes.md'
+    }}
+    with patch('requests.get') as mock_get:
+        mock_get.return_value.content = b"# Notes"
+        document = loader._load_file(client, "F123", "C123")
+
+    assert document['text'] == "# Notes"
+    assert document['metadata']['filename'] == "notes.md"
+    assert loader._file_name("F1", {'name': 'README', 'filetype': 'text'}) == "README.txt"
+    assert loader._file_name("F1", {'filetype': 'pdf'}) == "F1.pdf"
+
+def test_openai_embedding_batches_fit_request_limits():
+    """Test that large embedding batches are split into ordered requests within the limits."""
+    from src.rag.embedding.openai import EMBEDDING_BATCH_SIZE, _split_batches
+
+    texts = [f"chunk {i}" for i in range(EMBEDDING_BATCH_SIZE * 2 + 1)]
+    batches = _split_batches(texts)
+
+    assert [len(batch) for batch in batches] == [EMBEDDING_BATCH_SIZE, EMBEDDING_BATCH_SIZE, 1]
+    assert [text for batch in batches for text in batch] == texts
+    assert len(_split_batches(["x" * 600_000, "y" * 600_000])) == 2
+    assert [len(batch) for batch in _split_batches(texts[:10], batch_size=4)] == [4, 4, 2]
+
+def test_document_processor_embeds_in_batches(settings: Settings, mock_embedding_service, mock_vector_db_manager):
+    """Test that large ingests are embedded and stored one batch of chunks at a time."""
+    from src.rag.document.processor import PROCESSING_BATCH_SIZE
+
+    mock_embedding_service.generate_embeddings_array.side_effect = (
+        lambda texts: np.zeros((len(texts), 4), dtype=np.float32))
+    mock_vector_db_manager.store_embeddings.side_effect = lambda docs, embeddings: [doc['id'] for doc in docs]
+    processor = DocumentProcessor(settings)
+    processor.cache = None
+    documents = [{'id': f"doc_{i}", 'text': "Short text.", 'metadata': {}}
+                 for i in range(PROCESSING_BATCH_SIZE + 10)]
+
+    doc_ids = processor.process_documents(documents)
+
+    assert len(doc_ids) == len(documents)
+    batches = [call.args for call in mock_vector_db_manager.store_embeddings.call_args_list]
+    assert [len(docs) for docs, _ in batches] == [PROCESSING_BATCH_SIZE, 10]
+    assert [embeddings.shape for _, embeddings in batches] == [(PROCESSING_BATCH_SIZE, 4), (10, 4)]
+
+def test_sentence_transformer_model_loaded_once(settings: Settings):
+    """Test that SentenceTransformer weights are loaded once per process and model name."""
+    from src.rag.embedding import sentence_transformers
+    from src.rag.embedding.sentence_transformers import SentenceTransformerEmbedding
+
+    with patch('sentence_transformers.SentenceTransformer') as mock_class, \
+         patch.dict(sentence_transformers._models, clear=True):
+        mock_class.return_value.get_sentence_embedding_dimension.return_value = 384
+        first = SentenceTransformerEmbedding(settings)
+        second = SentenceTransformerEmbedding(settings)
+
+    mock_class.assert_called_once_with(settings.st_model)
+    assert first._model is second._model
+
+def test_sentence_transformer_backend_falls_back_to_torch(settings: Settings):
+    """Test that an unavailable ONNX backend falls back to loading the torch model."""
+    from src.rag.embedding import sentence_transformers
+    from src.rag.embedding.sentence_transformers import SentenceTransformerEmbedding
+
+    onnx_settings = dataclasses.replace(settings, st_backend="onnx", st_onnx_file="onnx/model_qint8.onnx")
+    torch_model = Mock()
+    torch_model.get_sentence_embedding_dimension.return_value = 384
+    with patch('sentence_transformers.SentenceTransformer',
+               side_effect=[TypeError("unexpected keyword argument 'backend'"), torch_model]) as mock_class, \
+         patch.dict(sentence_transformers._models, clear=True):
+        embedding = SentenceTransformerEmbedding(onnx_settings)
+
+    assert embedding._model is torch_model
+    assert mock_class.call_args_list[0].kwargs == {
+        "backend": "onnx", "model_kwargs": {"file_name": "onnx/model_qint8.onnx"}}
+    assert mock_class.call_args_list[1].kwargs == {}
+
+def test_document_cache_stats_from_index(tmp_path):
+    """Test that cache statistics track stored and invalidated documents through the index."""
+    (tmp_path / "existing.json").write_text('{"id": "old"}')
+    cache = DocumentCache(cache_dir=str(tmp_path))
+    assert cache.get_stats()['file_count'] == 1
+
+    cache.store("doc_1", {"id": "doc_1", "text": "Cached text."})
+    stats = cache.get_stats()
+    assert stats['file_count'] == 2
+    assert stats['total_size_bytes'] == os.path.getsize(cache._get_cache_path("doc_1")) + len('{"id": "old"}')
+
+    cache.invalidate("doc_1")
+    assert cache.get_stats()['file_count'] == 1
+    cache.clear()
+    assert cache.get_stats()['file_count'] == 0
+    assert os.path.exists(tmp_path / "index.db")
+
+def test_document_cache_shared_per_directory(tmp_path):
+    """Test that components using the same cache directory share one cache."""
+    shared = DocumentCache.get_instance(cache_dir=str(tmp_path))
+    shared.store("doc_1", {"id": "doc_1", "text": "Cached text."})
+
+    other = DocumentCache.get_instance(cache_dir=os.path.join(str(tmp_path), "."))
+    assert other is shared
+    other.invalidate("doc_1")
+    assert shared.get("doc_1") is None
+
+def test_document_cache_skips_disk_for_unknown_documents(tmp_path):
+    """Test that lookups of documents that were never cached don't touch the filesystem."""
+    cache = DocumentCache(cache_dir=str(tmp_path))
+    cache.store("doc_1", {"id": "doc_1", "text": "Cached text."})
+    cache._memory.clear()
+
+    with patch('os.path.exists', side_effect=AssertionError("checked the filesystem")):
+        assert cache.get("never_cached") is None
+    assert cache.get("doc_1")["id"] == "doc_1"
+
+def test_redis_document_cache_round_trip(settings: Settings):
+    """Test that the Redis document cache stores msgpack entries with the Redis TTL."""
+    from src.rag.document.redis_cache import RedisDocumentCache
+
+    entries = {}
+    with patch('redis.Redis') as mock_redis_class:
+        mock_redis = mock_redis_class.return_value
+        mock_redis.setex.side_effect = lambda key, ttl, value: entries.__setitem__(key, value)
+        mock_redis.get.side_effect = entries.get
+        mock_redis.delete.side_effect = lambda key: entries.pop(key, None)
+        cache = RedisDocumentCache(settings)
+
+        document = {"id": "doc_1", "text": "Cached text.", "metadata": {"source": "test"}}
+        assert cache.store_async("doc_1", document).result()
+        assert mock_redis.setex.call_args.args[:2] == ("document:doc_1", settings.redis_ttl)
+        assert cache.get("doc_1") == document
+
+        assert cache.invalidate("doc_1")
+        assert cache.get("doc_1") is None
@@ -1,22 +1,30 @@
 import pytest
-from unittest.mock import Mock, patch
-from src.config.settings import Settings
+import asyncio
+from unittest.mock import AsyncMock, Mock, patch
+from src.config.settings import Settings, get_settings
 from src.slack.app import SlackApp
 from src.crew.research_writing_crew import ResearchWritingCrew
+from src.llm.clients import LLMClients
 from typing import Dict
 
 @pytest.fixture
 def settings() -> Settings:
     """Fixture for Settings instance."""
-    return Settings()
+    return get_settings()
 
 @pytest.fixture
 def mock_crew(settings: Settings) -> ResearchWritingCrew:
     """Fixture for a mock ResearchWritingCrew."""
     crew = ResearchWritingCrew(settings)
     crew.run = Mock(return_value="**Test** message\n- item1\n- item2")
+    crew.stream = Mock(side_effect=lambda inputs: _stream(crew.run(inputs=inputs)))
     return crew
 
+async def _stream(*chunks: str):
+    """Async iterator over the given response chunks."""
+    for chunk in chunks:
+        yield chunk
+
 @pytest.fixture
 def mock_redis_store():
     """Fixture for mocking Redis store."""
@@ -51,24 +59,21 @@ def slack_app(settings: Settings, mock_crew: ResearchWritingCrew,
          patch('src.slack.app.RoleManager', return_value=mock_role_manager):
         return SlackApp(settings, mock_crew)
 
-def test_handle_message_directed_to_bot(slack_app: SlackApp, mock_crew: ResearchWritingCrew) -> None:
+async def test_handle_message_directed_to_bot(slack_app: SlackApp, mock_crew: ResearchWritingCrew) -> None:
     """Test message handling when directed to bot."""
     event = {
         "channel": "C123",
         "ts": "1234567890.123456",
         "text": "<@U123> research AI trends"
     }
-    say_mock = Mock()
+    say_mock = AsyncMock()
     # Mock the say function to return a response with a ts
     say_mock.return_value = {"ts": "processing_message_ts"}
     
-    client_mock = Mock()
-    client_mock.auth_test.return_value = {"user_id": "U123"}
-    # Mock the chat_delete method
-    client_mock.chat_delete = Mock()
+    client_mock = AsyncMock()
 
-    with patch.object(slack_app.app.client, "auth_test", return_value={"user_id": "U123"}):
-        slack_app.handle_message(event=event, say=say_mock, client=client_mock)
+    with patch.object(slack_app.app.client, "auth_test", AsyncMock(return_value={"user_id": "U123"})):
+        await slack_app.handle_message(event=event, say=say_mock, client=client_mock)
 
     # Check that run was called with the expected parameters
     assert mock_crew.run.call_count == 1
@@ -77,14 +82,19 @@ def test_handle_message_directed_to_bot(slack_app: SlackApp, mock_crew: Research
     assert call_args["inputs"]["topic"] == "<@U123> research AI trends"
     # Additional parameters are expected but we don't need to check their exact values
     
-    # Check that say was called at least twice (once for processing, once for response)
-    assert say_mock.call_count >= 2
-    
-    # Check that chat_delete was called to remove the processing message
-    client_mock.chat_delete.assert_called_once()
+    # Only the processing message is posted; the response replaces it in place
+    say_mock.assert_called_once()
+    assert say_mock.call_args[1]["thread_ts"] == "1234567890.123456"
+    client_mock.chat_delete.assert_not_called()
     
-    # Get the actual text that was passed to say_mock in the last call (the formatted response)
-    actual_text = say_mock.call_args[1]['text']
+    # The first streamed chunk is shown as is, the last update is the formatted response
+    assert client_mock.chat_update.call_count == 2
+    assert client_mock.chat_update.call_args_list[0][1]["text"] == "**Test** message\n- item1\n- item2"
+    update_args = client_mock.chat_update.call_args[1]
+    assert update_args["channel"] == "C123"
+    assert update_args["ts"] == "processing_message_ts"
+    assert update_args["mrkdwn"] is True
+    actual_text = update_args['text']
     
     # The message is being detected as a conversation message, which has simpler formatting
     # Verify it contains the original content but not the fancy formatting
@@ -94,40 +104,86 @@ def test_handle_message_directed_to_bot(slack_app: SlackApp, mock_crew: Research
     # Verify it doesn't contain the research/information formatting
     assert ":zap:" not in actual_text  # No header for conversation messages
     assert "`Insights & Information`" not in actual_text  # No colored header for conversation messages
-    
-    assert "thread_ts" in say_mock.call_args[1]
-    assert say_mock.call_args[1]["thread_ts"] == "1234567890.123456"
-    assert say_mock.call_args[1]["mrkdwn"] is True
 
-def test_handle_message_not_directed(slack_app: SlackApp, mock_crew: ResearchWritingCrew) -> None:
+async def test_streamed_updates_are_throttled(slack_app: SlackApp, mock_crew: ResearchWritingCrew) -> None:
+    """Test that streamed chunks are batched into few placeholder edits."""
+    mock_crew.stream = Mock(return_value=_stream(*["chunk "] * 100))
+    say_mock = AsyncMock(return_value={"ts": "processing_message_ts"})
+    client_mock = AsyncMock()
+
+    await slack_app.message_handler.process_message(
+        "research AI trends", say_mock, "1234567890.123456", "C123", "U456", client_mock
+    )
+
+    # Chunks arriving within one interval only show the first, then the final formatted response
+    assert client_mock.chat_update.call_count == 2
+    assert client_mock.chat_update.call_args_list[0][1]["text"] == "chunk "
+    assert "chunk " * 99 in client_mock.chat_update.call_args[1]["text"]
+    say_mock.assert_called_once()
+
+async def test_identical_requests_are_coalesced(slack_app: SlackApp, mock_crew: ResearchWritingCrew) -> None:
+    """Test that identical concurrent requests share a single crew run."""
+    async def slow_stream(inputs):
+        await asyncio.sleep(0.05)
+        yield "Shared answer"
+    mock_crew.stream = Mock(side_effect=slow_stream)
+    handler = slack_app.message_handler
+    say_a = AsyncMock(return_value={"ts": "a"})
+    say_b = AsyncMock(return_value={"ts": "b"})
+    client_mock = AsyncMock()
+
+    await asyncio.gather(
+        handler.process_message("Research AI trends", say_a, "1.1", "C1", "U1", client_mock),
+        handler.process_message("  research   ai TRENDS ", say_b, "2.2", "C2", "U2", client_mock)
+    )
+
+    assert mock_crew.stream.call_count == 1
+    final_updates = [c[1] for c in client_mock.chat_update.call_args_list if "Shared answer" in c[1]["text"]]
+    assert {update["ts"] for update in final_updates} == {"a", "b"}
+
+async def test_handle_message_not_directed(slack_app: SlackApp, mock_crew: ResearchWritingCrew) -> None:
     """Test message handling when not directed to bot."""
     event = {
         "channel": "C123",
         "ts": "1234567890.123456",
         "text": "hello world"
     }
-    say_mock = Mock()
-    client_mock = Mock()
-    client_mock.auth_test.return_value = {"user_id": "U123"}
+    say_mock = AsyncMock()
+    client_mock = AsyncMock()
 
-    with patch.object(slack_app.app.client, "auth_test", return_value={"user_id": "U123"}):
-        slack_app.handle_message(event=event, say=say_mock, client=client_mock)
+    with patch.object(slack_app.app.client, "auth_test", AsyncMock(return_value={"user_id": "U123"})):
+        await slack_app.handle_message(event=event, say=say_mock, client=client_mock)
 
     mock_crew.run.assert_not_called()
     say_mock.assert_not_called()
 
-def test_handle_app_mention(slack_app: SlackApp, mock_crew: ResearchWritingCrew) -> None:
+async def test_bot_user_id_is_resolved_once(slack_app: SlackApp, mock_crew: ResearchWritingCrew) -> None:
+    """Test that auth.test is only called for the first message."""
+    event = {
+        "channel": "C123",
+        "ts": "1234567890.123456",
+        "text": "hello world"
+    }
+    auth_test = AsyncMock(return_value={"user_id": "U123"})
+
+    with patch.object(slack_app.app.client, "auth_test", auth_test):
+        for _ in range(3):
+            await slack_app.handle_message(event=event, say=AsyncMock(), client=AsyncMock())
+
+    auth_test.assert_awaited_once()
+
+async def test_handle_app_mention(slack_app: SlackApp, mock_crew: ResearchWritingCrew) -> None:
     """Test app_mention event handling."""
     event = {
         "ts": "1234567890.123456",
         "text": "<@U123> research AI trends",
         "channel": "C123"
     }
-    say_mock = Mock()
-    client_mock = Mock()
+    say_mock = AsyncMock()
+    client_mock = AsyncMock()
 
     # Call the method
-    slack_app.handle_app_mention(event=event, say=say_mock, client=client_mock)
+    await slack_app.handle_app_mention(event=event, say=say_mock, client=client_mock)
     
     # Since we removed the processing part, we should not expect any calls to crew.run
     mock_crew.run.assert_not_called()
@@ -138,6 +194,21 @@ def test_handle_app_mention(slack_app: SlackApp, mock_crew: ResearchWritingCrew)
     # No chat_delete calls should be made
     client_mock.chat_delete.assert_not_called()
 
+async def test_warm_up(slack_app: SlackApp, mock_crew: ResearchWritingCrew) -> None:
+    """Test that start-up warm-up builds the agents and opens the LLM connections."""
+    with patch.object(mock_crew, "warm_up") as crew_warm_up, \
+         patch.object(LLMClients, "warm_up", new_callable=AsyncMock) as clients_warm_up:
+        await slack_app._warm_up()
+
+    crew_warm_up.assert_called_once()
+    clients_warm_up.assert_awaited_once()
+
+async def test_warm_up_failure_is_not_fatal(slack_app: SlackApp, mock_crew: ResearchWritingCrew) -> None:
+    """Test that a failed warm-up is logged instead of stopping the app."""
+    with patch.object(mock_crew, "warm_up", side_effect=RuntimeError("no network")), \
+         patch.object(LLMClients, "warm_up", new_callable=AsyncMock):
+        await slack_app._warm_up()
+
 def test_slack_formatting() -> None:
     """Test Slack message formatting."""
     from src.utils.formatting import format_slack_message